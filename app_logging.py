@@ -0,0 +1,71 @@
+"""Logging for the window: records are queued and written on a listener thread.
+
+The Tk thread only puts records on a queue; a QueueListener formats them and
+writes to the console and a rotating Logs/pdf_autofill.log, so a slow disk
+never stalls the form and the folder holds a bounded set of files instead of
+one per launch. Field-by-field values are traced at DEBUG only; set
+AUTOFILL_LOG_LEVEL=DEBUG to see them.
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+
+LOG_FILE = "pdf_autofill.log"
+MAX_BYTES = 1 << 20
+BACKUP_COUNT = 5
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_listener = None
+
+
+def setup_logging(log_dir):
+    """Route the root logger through a queue to the console and a rotating log file"""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    level = getattr(logging, os.environ.get("AUTOFILL_LOG_LEVEL", "INFO").upper(), logging.INFO)
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler()]
+    try:
+        os.makedirs(log_dir, exist_ok=True)
+        handlers.append(logging.handlers.RotatingFileHandler(
+            os.path.join(log_dir, LOG_FILE), maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8"))
+    except OSError as e:
+        # e.g. a read-only install folder; the console still gets everything
+        logging.warning(f"Could not open the log file in {log_dir}: {str(e)}")
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(logging.handlers.QueueHandler(records))
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(records, *handlers)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """Write out whatever is still queued and close the log file"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def log_fields(title, fields):
+    """One summary record for a dictionary of field values, and the values themselves at DEBUG"""
+    filled = sum(1 for value in fields.values() if value not in (None, ""))
+    logging.info(f"{title}: {filled} of {len(fields)} fields set")
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(f"{title} values:\n" + "\n".join(f"  {field}: {value}" for field, value in fields.items()))
@@ -0,0 +1,142 @@
+"""Appearance streams for filled form fields.
+
+Text is laid out the way viewers lay out a single-line field: the DA font and
+colour, 2pt padding, vertically centred, aligned by /Q, with size 0 meaning
+fit the box. Glyph widths come from the font's /Widths or, for the standard
+Helvetica the templates use, its AFM metrics. Each font and size is measured
+once and kept in a cache.
+
+Most values repeat from packet to packet (the location's name and address,
+the rep, package prices), so finished streams are memoized by font, size, box
+and text. A cached stream is shared by every PDF that shows the value and
+must not be modified.
+"""
+import re
+import threading
+from collections import OrderedDict
+
+import pdfrw
+
+PADDING = 2
+MAX_AUTO_SIZE = 12
+DEFAULT_FONT_SIZE = 9
+APPEARANCE_CACHE_SIZE = 4096
+
+# Helvetica AFM widths for character codes 32-126, in 1/1000 em
+HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584
+]
+DEFAULT_WIDTH = 556
+
+DA_FONT = re.compile(r'/([^\s/]+)\s+([\d.]+)\s+Tf')
+
+
+def standard_font():
+    """Helvetica with WinAnsi encoding, for fields whose DA font isn't in the file"""
+    return pdfrw.PdfDict(Type=pdfrw.PdfName.Font, Subtype=pdfrw.PdfName.Type1,
+                         BaseFont=pdfrw.PdfName.Helvetica, Encoding=pdfrw.PdfName.WinAnsiEncoding)
+
+
+def encode_text(text):
+    """A value as single-byte WinAnsi text, which both Helvetica and /Helv use"""
+    return ' '.join(text.splitlines()).encode('cp1252', 'replace')
+
+
+class FontSetup:
+    """Glyph widths of one font at one size"""
+
+    def __init__(self, font, size):
+        self.size = size
+        widths = font.Widths if font is not None else None
+        if widths and font.FirstChar is not None:
+            first = int(font.FirstChar)
+            self.widths = {first + i: float(w) for i, w in enumerate(widths)}
+        else:
+            self.widths = {32 + i: w for i, w in enumerate(HELVETICA_WIDTHS)}
+
+    def text_width(self, data):
+        return sum(self.widths.get(code, DEFAULT_WIDTH) for code in data) * self.size / 1000
+
+
+_fonts = {}
+_fonts_lock = threading.Lock()
+
+
+def font_setup(font, size):
+    """FontSetup for a font and size, measured once per BaseFont and size"""
+    key = (str(font.BaseFont) if font is not None else None, size)
+    with _fonts_lock:
+        setup = _fonts.get(key)
+        if setup is None:
+            setup = _fonts[key] = FontSetup(font, size)
+        return setup
+
+
+def field_font(da, resources):
+    """(font name, font dict, size, DA) for a field, defaulting to 9pt Helvetica"""
+    match = DA_FONT.search(da or '')
+    if not match:
+        da = f"0 g /Helv {DEFAULT_FONT_SIZE} Tf"
+        match = DA_FONT.search(da)
+    name, size = match.group(1), float(match.group(2))
+    fonts = resources.Font if resources else None
+    font = fonts[f'/{name}'] if fonts else None
+    return name, font, size, da
+
+
+def text_appearance(da, width, height, text, quadding=0, resources=None):
+    """Form XObject drawing text in a width x height field box"""
+    name, font, size, da = field_font(da, resources)
+    data = encode_text(text)
+    if size == 0:
+        size = max(4.0, min(MAX_AUTO_SIZE, (height - 2 * PADDING) * 0.9))
+        available = width - 2 * PADDING
+        natural = font_setup(font, size).text_width(data)
+        if natural > available > 0:
+            size = max(4.0, size * available / natural)
+    text_width = font_setup(font, size).text_width(data)
+
+    if quadding == 1:
+        x = (width - text_width) / 2
+    elif quadding == 2:
+        x = width - PADDING - text_width
+    else:
+        x = PADDING
+    y = (height - size) / 2 + 0.22 * size  # Baseline that centres cap height and descenders
+    da = DA_FONT.sub(f"/{name} {size:g} Tf", da, count=1)
+    literal = pdfrw.PdfString.from_bytes(data, bytes_encoding='literal')
+
+    stream = pdfrw.IndirectPdfDict(
+        Type=pdfrw.PdfName.XObject, Subtype=pdfrw.PdfName.Form,
+        BBox=pdfrw.PdfArray([0, 0, round(width, 3), round(height, 3)]),
+        Resources=pdfrw.PdfDict(Font=pdfrw.PdfDict(**{name: font if font is not None else standard_font()})))
+    stream.stream = (f"/Tx BMC\nq\n{PADDING / 2:g} {PADDING / 2:g} {width - PADDING:g} {height - PADDING:g} re W n\n"
+                     f"BT\n{da}\n{x:.2f} {y:.2f} Td\n{literal} Tj\nET\nQ\nEMC")
+    return stream
+
+
+_appearances = OrderedDict()
+_appearances_lock = threading.Lock()
+
+
+def cached_text_appearance(da, width, height, text, quadding=0, resources=None):
+    """text_appearance, reusing the stream made earlier for the same font, size, box and text"""
+    _, font, _, _ = field_font(da, resources)
+    # The cached stream references the font, so its id can't be reused while the entry exists
+    key = (da, id(font) if font is not None else None, round(width, 3), round(height, 3), text, quadding)
+    with _appearances_lock:
+        stream = _appearances.get(key)
+        if stream is not None:
+            _appearances.move_to_end(key)
+            return stream
+    stream = text_appearance(da, width, height, text, quadding, resources)
+    with _appearances_lock:
+        stream = _appearances.setdefault(key, stream)
+        if len(_appearances) > APPEARANCE_CACHE_SIZE:
+            _appearances.popitem(last=False)
+    return stream
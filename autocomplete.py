@@ -0,0 +1,110 @@
+"""Autocomplete for the catalog inputs (Casket, Urn, Limousine, ...).
+
+One floating tk.Listbox serves every registered input. It moves under the
+input being typed in, shows that input's catalog matches (see catalog_search)
+and hands the picked item and its price back to the window. The listbox and
+its bindings are made once, and each input gets a single <FocusOut> binding,
+so another catalog is one more registry entry rather than another widget.
+
+The list closes after HIDE_AFTER_S without activity. Activity only records
+the time. One `after` is armed for the deadline, and when it fires it either
+hides the list or re-arms for the time that is left. Nothing runs while the
+list is hidden.
+"""
+import time
+import tkinter as tk
+
+import catalog_search
+
+LISTBOX_WIDTH = 400
+ROW_HEIGHT = 20  # Approximate pixels per row
+MAX_ROWS = 8.75
+HIDE_AFTER_S = 7  # Inactivity before the list closes by itself
+ACTIVITY_EVENTS = ('<Motion>', '<MouseWheel>', '<Button-4>', '<Button-5>')
+
+
+class Autocomplete:
+    """The shared suggestion list for a {input key: (catalog, price key)} registry"""
+
+    def __init__(self, window, fields, on_select):
+        self.window = window
+        self.fields = fields
+        self.on_select = on_select  # on_select(input key, item, price key, price)
+        self.indexes = {key: catalog_search.catalog_index(catalog) for key, (catalog, _) in fields.items()}
+        self.listbox = None
+        self.active = None  # Input key the list is showing matches for
+        self.shown = []
+        self.bound = set()
+        self.last_activity_time = time.monotonic()
+        self.timer = None
+
+    def _create_listbox(self):
+        self.listbox = tk.Listbox(self.window.TKroot, width=50, height=10, background='white',
+                                  foreground='black', font=('Helvetica', 10))
+        self.listbox.bind('<<ListboxSelect>>', self._select)
+        # Browsing the list keeps it open; the default scrolling still applies
+        for sequence in ACTIVITY_EVENTS:
+            self.listbox.bind(sequence, self.touch, add='+')
+
+    def update(self, key, text):
+        """Show the matches for what has been typed in an input, under that input"""
+        if self.listbox is None:
+            self._create_listbox()
+        if key not in self.bound:
+            self.window[key].Widget.bind('<FocusOut>', lambda e, key=key: self.hide(key))
+            self.bound.add(key)
+        self.active = key
+        self.touch()
+
+        items = self.indexes[key].search(text)
+        # Only the rows that differ from what the list already shows are replaced
+        start, stop, inserted = catalog_search.listbox_edit(self.shown, items)
+        if stop > start:
+            self.listbox.delete(start, stop - 1)
+        if inserted:
+            self.listbox.insert(start, *inserted)
+        self.shown = items
+
+        input_widget = self.window[key].Widget
+        x = input_widget.winfo_rootx() - self.window.TKroot.winfo_rootx()
+        y = input_widget.winfo_rooty() - self.window.TKroot.winfo_rooty() + input_widget.winfo_height()
+        height = min(max(len(items), 1), MAX_ROWS) * ROW_HEIGHT
+        self.listbox.place(x=x, y=y, width=LISTBOX_WIDTH, height=height)
+        if self.timer is None:
+            self._arm(HIDE_AFTER_S)
+
+    def hide(self, key=None):
+        """Hide the list, or only if it is showing for key"""
+        if self.listbox is not None and (key is None or key == self.active):
+            self.listbox.place_forget()
+            self.cancel()
+
+    def touch(self, event=None):
+        self.last_activity_time = time.monotonic()
+
+    def cancel(self):
+        if self.timer:
+            self.window.TKroot.after_cancel(self.timer)
+            self.timer = None
+
+    def _select(self, event):
+        selection = self.listbox.curselection()
+        if not selection or self.active not in self.fields:
+            self.touch()
+            return
+        item = self.listbox.get(selection[0])
+        catalog, price_key = self.fields[self.active]
+        self.on_select(self.active, item, price_key, float(catalog[item]))
+        self.hide()
+
+    def _arm(self, seconds):
+        self.timer = self.window.TKroot.after(max(1, int(seconds * 1000)), self._deadline)
+
+    def _deadline(self):
+        """Hide the list, unless there was activity since the timer was armed"""
+        self.timer = None
+        remaining = self.last_activity_time + HIDE_AFTER_S - time.monotonic()
+        if remaining > 0:
+            self._arm(remaining)
+        else:
+            self.hide()
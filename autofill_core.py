@@ -0,0 +1,1802 @@
+import sys
+import os
+import time
+START_TIME = time.perf_counter()  # Time to interactive is measured from here, before the GUI imports
+import PySimpleGUI as sg
+from pathlib import Path
+import logging
+import re
+import tkinter as tk
+import locale
+import multiprocessing
+import threading
+import pricing
+from money import ZERO, Money, parse_or_zero
+import recalc
+import brands
+import form_mapping
+import form_schema
+import app_logging
+import autocomplete
+
+# PIL, pdfrw (pdf_templates) and dateutil are imported where they are first
+# used, so none of them is loaded before the window is up.
+INTERACTIVE_TARGET_S = 1.5  # Startup budget from START_TIME to a responsive window
+
+def get_absolute_path(relative_path):
+    """Get absolute path for both development and compiled environments"""
+    if getattr(sys, 'frozen', False):
+        # Running in a bundle (compiled)
+        base_path = sys._MEIPASS
+    else:
+        # Running in normal Python environment
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    
+    return os.path.join(base_path, relative_path)
+
+def resize_image(image_path, size):
+    """Resize image to fit within specified size while maintaining aspect ratio"""
+    try:
+        # Create temp directory in the same directory as the script
+        temp_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'temp')
+        
+        # Create temp filename using just the base name of the original file
+        temp_filename = f"temp_{os.path.basename(image_path)}"
+        temp_path = os.path.join(temp_dir, temp_filename)
+        
+        # Reuse the copy resized on an earlier launch unless the logo has changed since
+        if os.path.exists(temp_path) and os.path.getmtime(temp_path) >= os.path.getmtime(image_path):
+            return temp_path
+        
+        from PIL import Image
+        
+        # Open the image directly (image_path is already absolute)
+        img = Image.open(image_path)
+        
+        # Calculate aspect ratios
+        target_ratio = size[0] / size[1]
+        img_ratio = img.width / img.height
+        
+        if img_ratio > target_ratio:
+            # Width is limiting factor
+            new_width = size[0]
+            new_height = int(new_width / img_ratio)
+        else:
+            # Height is limiting factor
+            new_height = size[1]
+            new_width = int(new_height * img_ratio)
+            
+        # Resize image
+        img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        os.makedirs(temp_dir, exist_ok=True)
+        
+        # Save resized image
+        img.save(temp_path)
+        return temp_path
+        
+    except Exception as e:
+        print(f"Error resizing image: {str(e)}")
+        return image_path
+
+class PDFAutofiller:
+    """The client forms window, configured for one brand by a brands.BrandProfile"""
+
+    TEXT_WIDTH = 40
+    INPUT_WIDTH = 20
+    DOLLAR_WIDTH = 10
+    RECALC_DELAY_MS = 120  # Quiet time before a burst of edits is recalculated
+    IDLE_BUILD_MS = 400  # Quiet time with no events before the next deferred tab is built
+    # Events whose handlers read or write fields on every tab
+    WHOLE_FORM_EVENTS = ("Autofill PDFs", "-REFRESH-", "-CALCULATE_MONTHLY_PAYMENT-", "-COMPARE-PAYMENTS-",
+                         "-PACKAGE-")
+    
+    def __init__(self, profile=brands.ROB, headless=False):
+        self.profile = profile
+        
+        sg.LOOK_AND_FEEL_TABLE['KFSTheme'] = {
+                'BACKGROUND': '#f0f0f0',  # Light gray background
+                'TEXT': '#000000',        # Black text
+                'INPUT': '#ffffff',       # White input fields
+                'TEXT_INPUT': '#000000',  # Black text in input fields
+                'SCROLL': '#c7e0dc',      # Light teal for scrollbars
+                'BUTTON': ('#000000', '#e7e7e7'),  # Black text on light gray buttons
+                'PROGRESS': ('#01826B', '#D0D0D0'),
+                'BORDER': 1,
+                'SLIDER_DEPTH': 0,
+                'PROGRESS_DEPTH': 0,
+            }
+        
+        
+        # Apply the theme
+        sg.theme('KFSTheme')
+    
+        # Set font for all elements
+        sg.set_options(font=("Helvetica", 10))
+        
+        self.base_path = self.get_base_path()
+        self.setup_logging()
+        
+        # Add logo paths using existing base_path
+        self.left_logo = os.path.join(self.base_path, "Logos", profile.logos[0])
+        self.right_logo = os.path.join(self.base_path, "Logos", profile.logos[1])
+        
+        # Icon Path
+        self.icon = os.path.join(self.base_path, "Logos", profile.icon)
+        
+        self.phone_input_keys = [
+            "-PHONE-", "Phone_3", "Representative Phone"
+        ]
+        
+        self.discount_amount_keys = [('-DISCOUNT-AMT-', 0)
+        ]
+        
+        self.dollar_input_keys = [
+            "A1", "A2A", "A2B", "A2C", "A2D", "A3", "A4A", "A4B", "A4C",
+            "A5A", "A5B", "A5C", "A5D", "A6", "A7", "A8", "A9A", "A9B",
+            "A9C", "A9D", "A9E", "A9F", "A9G", "A9H", "Total A",
+            "B1", "B2", "B3", "B4", "B5", "B6", "B7", "Total B",
+            "C1", "C2", "C3", "C4", "C5", "C6", "C7", "C8", "C9", "C10", "Total C",
+            "D1", "D2", "D3", "D4", "D5", "D6", "D7", "D8", "Total D",
+            "Total \\(ABC\\)", "Discount", "GST", "PST", "Total D_2", "Grand Total",
+            "3A Goods and Services", "3B MonumentMarker", "3C Other Expenses",
+            "3D Final Documents Service", "3E Journey Home", "Total 3",
+            "4A Single Pay", "4B Time Pay", "4C Single Pay Journey Home", "4D LPR", "Total 4 \\(ABCD\\)",
+            ('-DISCOUNT-AMT-', 0)
+        ]
+        
+        self.postal_input_keys = [
+            "-POSTAL-", "Postal Code_4"
+        ]
+        
+        self.last_value = {}
+        
+        self.location_data = profile.location_data
+        self.locations = profile.locations
+        
+        self.gst_fields = pricing.GST_FIELDS
+        
+        self.pst_fields = pricing.PST_FIELDS
+
+        # Packages and price lists for the brand
+        self.packages = profile.packages
+        self.viewings = profile.viewings
+        self.limousines = profile.limousines
+        self.caskets = profile.caskets
+        self.urns = profile.urns
+        self.crematorium = profile.crematorium
+        self.other_3 = profile.other_3
+        self.reception_facilities = profile.reception_facilities
+        self.weekend = profile.weekend
+        self.discounts = profile.discounts
+        # Autocomplete inputs: the catalog each one searches and the price field it fills
+        self.autocomplete_fields = {
+            'Weekend or Statutory Holiday': (self.weekend, "A7"),
+            'Reception Facilities': (self.reception_facilities, "A8"),
+            'Other_3': (self.other_3, "C10"),
+            'Crematorium': (self.crematorium, "C2"),
+            'Evening Prayers or Visitation': (self.viewings, "A6"),
+            'Limousine': (self.limousines, "A9F"),
+            'Casket': (self.caskets, "B1"),
+            'Keepsake': (self.urns, "B3"),
+            'Urn': (self.urns, "B2")
+        }
+                
+        self.payment_factors = pricing.PAYMENT_FACTORS
+        
+        self.selected_package = ""
+        self.pdf_paths = self.initialize_pdf_paths()
+        # PDF sets being written in the background, keyed by batch number
+        self.pdf_batches = {}
+        self.pdf_batch_count = 0
+        # Calculated fields, recomputed only downstream of whatever changed
+        self.recalc = recalc.RecalcGraph(self.gst_fields, self.pst_fields, self.payment_factors)
+        self.recalc_pending = set()
+        self.recalc_timer = None
+        
+        # The headless engine only needs the catalogs and form paths, not the window
+        if headless:
+            self.window = None
+            return
+
+        personal_info_layout = [
+            [sg.Text("Applicant Information", font=("Helvetica", 14, "bold"))],
+            [sg.Text("First Name:"), sg.Input(key="-FIRST-", size=(20, 1)),
+             sg.Text("Middle Name:"), sg.Input(key="-MIDDLE-", size=(20, 1)),
+             sg.Text("Last Name:"), sg.Input(key="-LAST-", size=(20, 1))],
+            [sg.Text("Birthdate:"), sg.Input(key="-BIRTHDATE-", size=(20, 1), enable_events=True),
+             sg.Text("Age:"), sg.Input(key="-AGE-", size=(5, 1), default_text=""),
+             sg.Text("Gender:"), sg.Input(key="-GENDER-", size=(20, 1)),
+             sg.Text("SIN:"), sg.Input(key="SIN", size=(20, 1), enable_events=True)],
+            [sg.Text("Phone:"), sg.Input(key="-PHONE-", size=(20, 1), enable_events=True),
+             sg.Text("Email:"), sg.Input(key="-EMAIL-", size=(30, 1)),
+             sg.Text("Occupation:"), sg.Input(key="-OCCUPATION-", size=(20, 1))],
+            [sg.Text("Address:"), sg.Input(key="-ADDRESS-", size=(30, 1)),
+             sg.Text("City:"), sg.Input(key="-CITY-", size=(20, 1)),
+             sg.Text("Province:"), sg.Input(key="-PROVINCE-", size=(10, 1)),
+             sg.Text("Postal Code:"), sg.Input(key="-POSTAL-", size=(10, 1), enable_events=True)],
+            [sg.HorizontalSeparator()],
+            [sg.Text("Beneficiary Information", font=("Helvetica", 14, "bold"))],
+            [sg.Text("Full Name:"), sg.Input(key="Name", size=(30, 1)),
+             sg.Text("Relationship:"), sg.Input(key="Relationship", size=(20, 1)),
+             sg.Text("Phone:"), sg.Input(key="Phone_3", size=(20, 1), enable_events=True)],
+            [sg.Text("Email:"), sg.Input(key="Email_3", size=(30, 1)),
+             sg.Checkbox("Same address as Applicant", key="-SAME_ADDRESS-", enable_events=True)],
+            [sg.Text("Address:"), sg.Input(key="Address \\(if different\\)", size=(30, 1)),
+             sg.Text("City:"), sg.Input(key="City_4", size=(20, 1)),
+             sg.Text("Province:"), sg.Input(key="Province_4", size=(10, 1)),
+             sg.Text("Postal Code:"), sg.Input(key="Postal Code_4", size=(10, 1), enable_events=True)]
+        ]
+
+        section_a_layout = [
+            # A. Professional Services
+            [sg.Text("A. Professional Services", font=("Helvetica", 16, "bold")), sg.Text("(GST applicable)", font=("Helvetica", 10, "italic"))],
+            [sg.Column([
+                [sg.Text("1. Securing Release of Deceased and Transfer:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("2. Services of Licensed Funeral Directors and Staff:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Pallbearers:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Alternate Day Interment:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Alternate Day Interment 2:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("3. Administration, Documentation & Registration:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("4. Facilities and/or Equipment and Supplies:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Sheltering of Remains:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    A/V Equipment:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("5. Preparation Services", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    a) Basic Sanitary Care, Dressing and Casketing:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    b) Embalming:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    c) Pacemaker Removal:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    d) Autopsy Care:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("6. Evening Prayers or Visitation:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("7. Weekend or Statutory Holiday:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("8. Reception Facilities:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("9. Vehicles", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Delivery of Cremated Remains:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Transfer Vehicle for Transfer to Crematorium or Airport:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Lead Vehicle:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Service Vehicle:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Funeral Coach:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Limousine:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Additional Limousines:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("    Flower Van:", size=(self.TEXT_WIDTH, 1))],
+            ]), sg.Column([
+                [sg.Push(), sg.Text("$"), sg.Input(key="A1", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="A2A", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Pallbearers", size=(self.INPUT_WIDTH, 1)), sg.Text("$"), sg.Input(key="A2B", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Alternate Day Interment 1", size=(self.INPUT_WIDTH, 1)), sg.Text("$"), sg.Input(key="A2C", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Alternate Day Interment 2", size=(self.INPUT_WIDTH, 1)), sg.Text("$"), sg.Input(key="A2D", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="A3", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="A4A", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="A4B", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="A4C", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Text("")],  # Empty space for "5. Preparation Services"
+                [sg.Push(), sg.Text("$"), sg.Input(key="A5A", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="A5B", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Pacemaker Removal", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A5C", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Autopsy Care", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A5D", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Evening Prayers or Visitation", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A6", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Weekend or Statutory Holiday", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A7", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Reception Facilities", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A8", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Text("")],  # Empty space for "9. Vehicles"
+                [sg.Push(), sg.Input(key="Delivery of Cremated Remains", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A9A", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Transfer to Crematorium or Airport", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A9B", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Lead Vehicle", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A9C", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Service Vehicle", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A9D", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Funeral Coach", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A9E", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Limousine", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A9F", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Additional Limousines", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A9G", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Flower Van", size=(self.INPUT_WIDTH, 1), enable_events=True), sg.Text("$"), sg.Input(key="A9H", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+            ])],
+            [sg.Text("TOTAL A:", font=("Helvetica", 10, "bold"), size=(self.TEXT_WIDTH, 1)), sg.Push(), sg.Text("$"), sg.Input(key="Total A", size=(self.DOLLAR_WIDTH, 1), enable_events=True)]
+        ]
+        
+        section_b_layout = [
+            # B. Merchandise
+            [sg.Text("B. Merchandise", font=("Helvetica", 16, "bold")), sg.Text("(GST and/or PST applicable)", font=("Helvetica", 10, "italic"))],
+            [sg.Column([
+                [sg.Text("Casket:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Urn:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Keepsake:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Traditional Mourning Items:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Memorial Stationary:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Funeral Register:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Other:", size=(self.TEXT_WIDTH, 1))],
+            ]), sg.Column([
+                [sg.Push(), sg.Input(size=(40, 1),
+                                     enable_events=True,
+                                     key='Casket',
+                                     background_color='white',
+                                     text_color='black'),
+                 sg.Text("$"), sg.Input(key="B1", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(size=(40, 1),
+                                     enable_events=True,
+                                     key='Urn',
+                                     background_color='white',
+                                     text_color='black'),
+                 sg.Text("$"), sg.Input(key="B2", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(size=(40, 1),
+                                     enable_events=True,
+                                     key="Keepsake",
+                                     background_color='white',
+                                     text_color='black'),
+                 sg.Text("$"), sg.Input(key="B3", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Traditional Mourning Items", size=(40 , 1)), sg.Text("$"), sg.Input(key="B4", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Memorial Stationary", size=(40, 1), visible=False, readonly=True),
+                 sg.Text("Cards:"), sg.Input(key="Cards_Qty", size=(5, 1), enable_events=True), sg.Text("x $2.95 ="),
+                 sg.Push(), sg.Text("$"), sg.Input(key="B5", size=(self.DOLLAR_WIDTH, 1), readonly=True)],
+                [sg.Push(), sg.Text("Guest Book:"), sg.Input(key="Guest_Book_Qty", size=(5, 1), enable_events=True),
+                 sg.Text("x $75.00 ="), sg.Push(), sg.Text("$"), sg.Input(key="B6", size=(self.DOLLAR_WIDTH, 1), readonly=True)],
+                [sg.Push(), sg.Input(key="Other_1", size=(40, 1)), sg.Text("$"), sg.Input(key="B7", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+            ])],
+            [sg.Text("TOTAL B:", font=("Helvetica", 10, "bold"), size=(self.TEXT_WIDTH, 1)), sg.Push(), sg.Text("$"), sg.Input(key="Total B", size=(self.DOLLAR_WIDTH, 1), enable_events=True)]
+        ]
+        
+        section_c_layout = [
+            # C. Cash Disbursements
+            [sg.Text("C. Cash Disbursements", font=("Helvetica", 16, "bold")), sg.Text("(GST and/or PST applicable)", font=("Helvetica", 10, "italic"))],
+            [sg.Column([
+                [sg.Text("Cemetery:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Crematorium:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Obituary Notices:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Flowers:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("CPBC Administration Fee:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Hostess:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Markers:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Catering:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Other:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Other 2:", size=(self.TEXT_WIDTH, 1))],
+            ]), sg.Column([
+                [sg.Push(), sg.Input(key="Cemetery", size=(40, 1), enable_events=True), sg.Text("$"), sg.Input(key="C1", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Crematorium", size=(40, 1), enable_events=True), sg.Text("$"), sg.Input(key="C2", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Obituary Notices", size=(40, 1), enable_events=True), sg.Text("$"), sg.Input(key="C3", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Flowers", size=(40, 1), enable_events=True), sg.Text("$"), sg.Input(key="C4", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="CPBC Administration Fee", size=(40, 1), enable_events=True), sg.Text("$"), sg.Input(key="C5", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Hostess", size=(40, 1), enable_events=True), sg.Text("$"), sg.Input(key="C6", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Markers", size=(40, 1), enable_events=True), sg.Text("$"), sg.Input(key="C7", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Catering", size=(40, 1), enable_events=True), sg.Text("$"), sg.Input(key="C8", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Other_2", size=(40, 1), enable_events=True), sg.Text("$"), sg.Input(key="C9", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Other_3", size=(40, 1), enable_events=True), sg.Text("$"), sg.Input(key="C10", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+            ])],
+            [sg.Text("TOTAL C:", font=("Helvetica", 10, "bold"), size=(self.TEXT_WIDTH, 1)), sg.Push(), sg.Text("$"), sg.Input(key="Total C", size=(self.DOLLAR_WIDTH, 1), enable_events=True)]
+        ]
+        
+        section_d_layout = [
+            # D. Cash Disbursements
+            [sg.Text("D. Cash Disbursements", font=("Helvetica", 16, "bold")), sg.Text("(GST exempt)", font=("Helvetica", 10, "italic"))],
+            [sg.Column([
+                [sg.Text("Clergy Honorarium:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Church Honorarium:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Altar Servers:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Organist:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Soloist:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Harpist:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Death Certificates:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Other:", size=(self.TEXT_WIDTH, 1))],
+            ]), sg.Column([
+                [sg.Push(), sg.Input(key="Clergy Honorarium", size=(40, 1)), sg.Text("$"), sg.Input(key="D1", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Church Honorarium", size=(40, 1)), sg.Text("$"), sg.Input(key="D2", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Altar Servers", size=(40, 1)), sg.Text("$"), sg.Input(key="D3", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Organist", size=(40, 1)), sg.Text("$"), sg.Input(key="D4", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Soloist", size=(40, 1)), sg.Text("$"), sg.Input(key="D5", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Input(key="Harpist", size=(40, 1)), sg.Text("$"), sg.Input(key="D6", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(),sg.Text("Quantity:"), sg.Input(key="Death_Certificates_Quantity", size=(5, 1), enable_events=True),
+                 sg.Text("x $27.00 ="), sg.Push(), sg.Text("$"), sg.Input(key="D7", size=(self.DOLLAR_WIDTH, 1), readonly=True)],
+                [sg.Push(), sg.Input(key="Other_4", size=(self.INPUT_WIDTH, 1)), sg.Text("$"), sg.Input(key="D8", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+            ])],
+            [sg.Text("TOTAL D:", font=("Helvetica", 10, "bold"), size=(self.TEXT_WIDTH, 1)), sg.Push(), sg.Text("$"), sg.Input(key="Total D", size=(self.DOLLAR_WIDTH, 1), enable_events=True)]
+        ]
+        
+        discount_layout = self.create_discount_layout()
+        
+        total_charges_layout = [
+            # TOTAL CHARGES
+            [sg.Text("TOTAL CHARGES", font=("Helvetica", 16, "bold"))],
+            [sg.Column([
+                [sg.Text("TOTAL A, B, & C SECTIONS:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("DISCOUNT:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("G.S.T.:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("P.S.T.:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("TOTAL D:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("GRAND TOTAL:", font=("Helvetica", 10, "bold"), size=(self.TEXT_WIDTH, 1))],
+            ]), sg.Column([
+                [sg.Push(), sg.Text("$"), sg.Input(key="Total \\(ABC\\)", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="Discount", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="GST", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="PST", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="Total D_2", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="Grand Total", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+            ])]
+        ]
+        
+        preplanned_amount_layout = [
+            [sg.Text("Preplanned Amount", font=("Helvetica", 16, "bold"))],
+            [sg.Column([
+                [sg.Text("A. Goods and Services:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("B. Monument/Marker:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("C. Other Expenses:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("D. Final Documents Service:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("E. Journey Home (Time Pay Only):", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Total (A+B+C+D+E):", size=(self.TEXT_WIDTH, 1))],
+            ]), sg.Column([
+                [sg.Push(), sg.Text("$"), sg.Input(key="3A Goods and Services", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="3B MonumentMarker", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="3C Other Expenses", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="3D Final Documents Service", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="3E Journey Home", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="Total 3", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+            ])]
+        ]
+        
+        pmt_select_layout = [
+            [sg.Text("Payment Selection", font=("Helvetica", 16, "bold"))],
+            [sg.Column([
+                [sg.Text("Term:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("A. Single Pay:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("B. Time Pay:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("C. Single Pay Journey Home:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("D. LPR:", size=(self.TEXT_WIDTH, 1))],
+                [sg.Text("Total (A+B+C+D):", size=(self.TEXT_WIDTH, 1))],
+            ]), sg.Column([
+                [sg.Push(), sg.Combo(["3-year", "5-year", "10-year", "15-year", "20-year"], 
+                          key="Payment Term", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="4A Single Pay", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="4B Time Pay", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="4C Single Pay Journey Home", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="4D LPR", size=(self.DOLLAR_WIDTH, 1), enable_events=True)],
+                [sg.Push(), sg.Text("$"), sg.Input(key="Total 4 \\(ABCD\\)", size=(self.DOLLAR_WIDTH, 1), enable_events=True)]
+            ])]
+        ]
+        
+        monthly_payments_chart = [
+            [sg.Text("Monthly Payment Options", font=("Helvetica", 16, "bold"), justification='center', expand_x=True)],
+            [sg.Push(),
+             sg.Table(
+                values=[['0.00', '0.00', '0.00', '0.00', '0.00']],
+                headings=['3-year', '5-year', '10-year', '15-year', '20-year'],
+                auto_size_columns=False,
+                col_widths=[20, 20, 20, 20, 20],
+                justification='center',
+                key='-MONTHLY_PAYMENTS_TABLE-',
+                num_rows=1,
+                row_height=50,
+                display_row_numbers=False,
+                enable_events=True,
+                enable_click_events=True,
+                pad=(10,5),
+                expand_x=True,
+                font=("Helvetica", 16)),
+             sg.Push()],
+            [sg.Text("*Note: Make sure there is an age value in 'Age' field to calculate the monthly payment", font=("Helvetica", 13, "italic"), justification='center', expand_x=True)]
+        ]
+
+        time_pay_layout = [
+            [sg.Column(preplanned_amount_layout, expand_x=True)],
+            [sg.HorizontalSeparator()],
+            [sg.Checkbox("Single Pay Journey Home", key="-SINGLE_PAY_JH-", enable_events=True)],  # Added checkbox
+            [sg.Column(pmt_select_layout, expand_x=True)],
+            [sg.HorizontalSeparator()],
+            [sg.Column(monthly_payments_chart, expand_x=True)]
+        ]
+        
+        other_layout = [
+            [sg.Text("Location", font=("Helvetica", 16, "bold"))],
+            [sg.Text(self.profile.location_label)],
+            [sg.Input(key=self.profile.location_key, size=(40, 1), readonly=True,
+                      default_text=self.profile.fixed_location, enable_events=True)
+             if self.profile.fixed_location else
+             sg.Combo(self.locations, key=self.profile.location_key, size=(40, 1), enable_events=True)],
+            [sg.Text("Location Where Signed:")],
+            [sg.Text("City:"), sg.Input(key="Signed City", size=(20, 1)),
+             sg.Text("Province:"), sg.Input(key="Signed Province", size=(10, 1))]
+        ]
+        
+        representative_layout = [
+            [sg.Text("Representative Information", font=("Helvetica", 16, "bold"))],
+            [sg.Text("First Name:"), sg.Input(key="Representative First Name", size=(20, 1))],
+            [sg.Text("Middle Name:"), sg.Input(key="Representative Middle Name", size=(20, 1))],
+            [sg.Text("Last Name:"), sg.Input(key="Representative Last Name", size=(20, 1))],
+            [sg.Text("ID:"), sg.Input(key="Representative ID", size=(20, 1))],
+            [sg.Text("Phone:"), sg.Input(key="Representative Phone", size=(20, 1), enable_events=True)],
+            [sg.Text("Email:"), sg.Input(key="Representative Email", size=(20, 1), enable_events=True)]
+        ]
+        
+        other_info_layout = [
+            [sg.Column(other_layout, expand_x=True)],
+            [sg.HorizontalSeparator()],
+            [sg.Column(representative_layout, expand_x=True)]
+        ]
+        
+        main_content = [
+            [sg.Column([
+                [sg.Image(source=resize_image(self.left_logo, (300, 80)), size=(300, 80)),
+                 sg.Push(),
+                 sg.Text("Client Forms", font=("Helvetica", 30, "bold"), justification='center', expand_x=True),
+                 sg.Push(),
+                 sg.Image(source=resize_image(self.right_logo, (300, 80)), size=(300, 80))],
+            ], expand_x=True, expand_y=True)],
+            [sg.HorizontalSeparator()],
+            [sg.TabGroup([
+                [
+                    sg.Tab("Personal Info", [
+                        [sg.Frame("Personal Information", personal_info_layout, expand_x=True, expand_y=True)]
+                    ], key='-TAB-PERSONAL-', expand_x=True, expand_y=True),
+                    sg.Tab("Packages", [], key='-TAB-PACKAGES-', expand_x=True, expand_y=True),
+                    sg.Tab("Time Pay", [], key='-TAB-TIME-PAY-', expand_x=True, expand_y=True),
+                    sg.Tab("Other Info", [], key='-TAB-OTHER-INFO-', expand_x=True, expand_y=True)
+                ]
+            ], key='-TABS-', enable_events=True, expand_x=True)]
+        ]
+        
+        # Only the first tab is created with the window; the others are built on
+        # their first visit, after a quiet spell, or before a whole-form event
+        self.deferred_tabs = {
+            '-TAB-PACKAGES-': [
+                [sg.Frame("Packages", [
+                    [sg.Text("Select Package:"), sg.Combo(list(self.packages.keys()), key="-PACKAGE-", enable_events=True)],
+                    [sg.Text("Type of Service:"), sg.Input(key="Type of Service")],
+                    [sg.Column(section_a_layout, scrollable=True, vertical_scroll_only=False, expand_x=True, expand_y=True),
+                    sg.VerticalSeparator(),
+                    sg.Column([
+                        [sg.Frame("Section B", section_b_layout, expand_x=True)],
+                        [sg.Frame("Section C", section_c_layout, expand_x=True)],
+                        [sg.Frame("Section D", section_d_layout, expand_x=True)],
+                        [sg.Frame("Discount", discount_layout, expand_x=True)],
+                        [sg.Frame("Total Charges", total_charges_layout, expand_x=True)]
+                    ], scrollable=True, vertical_scroll_only=False, expand_x=True, expand_y=True, key='-SECTIONS-COLUMN-')]
+                ], expand_x=True, expand_y=True)]
+            ],
+            '-TAB-TIME-PAY-': [
+                [sg.Frame("Time Pay", time_pay_layout, expand_x=True, expand_y=True)]
+            ],
+            '-TAB-OTHER-INFO-': [
+                [sg.Frame("Other Information", other_info_layout, expand_x=True, expand_y=True)]
+            ]
+        }
+
+        layout = [
+            [sg.Column(
+                main_content,
+                scrollable=True,
+                vertical_scroll_only=False,
+                expand_x=True,
+                expand_y=True,
+                key='-CONTENT-'
+            )],
+            [sg.HorizontalSeparator()],
+            [sg.Column(
+                [
+                    [sg.Listbox([], key='-PDF-STATUS-', size=(80, 5), expand_x=True, visible=False)],
+                    [sg.Button("Autofill PDFs", expand_x=True),
+                    sg.Button("Cancel PDFs", key="-CANCEL-PDFS-", expand_x=True, disabled=True),
+                    sg.Button("Calculate Monthly Payment", key="-CALCULATE_MONTHLY_PAYMENT-", expand_x=True),
+                    sg.Button("Compare Payments", key="-COMPARE-PAYMENTS-", expand_x=True),
+                    sg.Button("Refresh Form", key="-REFRESH-", expand_x=True),
+                    sg.Button("Exit", expand_x=True)]
+                ],
+                expand_x=True,
+                element_justification='center',
+                key='-BUTTON-COLUMN-',
+                pad=(0, 0)
+            )]
+        ]
+
+        self.window = sg.Window(self.profile.title,
+                              layout,
+                              resizable=True,
+                              finalize=True,
+                              margins=(0, 0),
+                              icon=self.icon,
+                              size=(800, 600))
+        
+        # Add the Tkinter binding for dynamic content width
+        frame_id = self.window['-CONTENT-'].Widget.frame_id
+        canvas = self.window['-CONTENT-'].Widget.canvas
+        canvas.bind("<Configure>", lambda event, canvas=canvas, frame_id=frame_id: self.configure_scroll_frame(event, canvas, frame_id))
+        
+        self.window.set_min_size((800, 600))
+        self.window.maximize()
+        # Initialize window metadata for tracking discount rows
+        self.window.metadata = 0
+        
+        # One floating suggestion list shared by every catalog input
+        self.autocomplete = autocomplete.Autocomplete(self.window, self.autocomplete_fields, self.select_catalog_item)
+        
+        # Inputs are bound as their tab is built
+        self.bound_inputs = set()
+        self.bind_inputs()
+            
+        try:
+            self.window.TKroot.protocol("WM_DELETE_WINDOW", self.on_closing)
+        except Exception as e:
+            logging.error(f"Error setting up TK root: {str(e)}")
+            
+    def bind_inputs(self):
+        """Bind the phone and dollar inputs that exist so far"""
+        for key in self.phone_input_keys:
+            if key in self.window.AllKeysDict and key not in self.bound_inputs:
+                self.window[key].Widget.bind('<Key>', lambda e, key=key: self.validate_phone_input(key))
+                self.last_value[key] = ''
+                self.bound_inputs.add(key)
+            
+        for key in self.dollar_input_keys:
+            if key in self.window.AllKeysDict and key not in self.bound_inputs:
+                self.window[key].Widget.bind('<Key>', lambda e, key=key: self.validate_dollar_input(key))
+                self.window[key].Widget.bind('<Return>', lambda e, key=key: self.handle_dollar_input(key))
+                self.window[key].Widget.bind('<FocusOut>', lambda e, key=key: self.handle_dollar_input(key))
+                self.last_value[key] = ''
+                self.bound_inputs.add(key)
+
+    def build_tab(self, tab_key):
+        """Create a deferred tab's widgets and bind its inputs"""
+        rows = self.deferred_tabs.pop(tab_key, None)
+        if rows is None:
+            return
+        start = time.perf_counter()
+        self.window.extend_layout(self.window[tab_key], rows)
+        # extend_layout wraps the rows in a Column, which has to fill the tab like the original layout did
+        self.window.Rows[-1][0].expand(expand_x=True, expand_y=True)
+        self.bind_inputs()
+        # Totals recalculated before the tab existed
+        self.paint_calculated(self.recalc.displayed)
+        self.window.refresh()
+        self.window['-CONTENT-'].contents_changed()
+        logging.info(f"Built tab {tab_key} in {time.perf_counter() - start:.3f}s")
+
+    def build_deferred_tabs(self, values):
+        """Build every remaining tab and add their (default) values to an event's values"""
+        for tab_key in list(self.deferred_tabs):
+            self.build_tab(tab_key)
+        current = self.get_current_values()
+        return {**current, **values}
+
+    def prepare_whole_form(self, values):
+        """Build every tab and finish any queued recalculation before an event that reads the whole form"""
+        if self.deferred_tabs:
+            values = self.build_deferred_tabs(values)
+        if self.recalc_pending or self.recalc_timer:
+            self.run_recalculation()
+            # The event's values were read before the totals caught up
+            values = dict(values)
+            for key in self.recalc.nodes:
+                if key in self.window.AllKeysDict:
+                    values[key] = self.window[key].get()
+        return values
+
+    def report_time_to_interactive(self):
+        """Log how long it took from START_TIME until the window responds to input"""
+        self.window.refresh()
+        elapsed = time.perf_counter() - START_TIME
+        if elapsed > INTERACTIVE_TARGET_S:
+            logging.warning(f"Window interactive after {elapsed:.2f}s, over the {INTERACTIVE_TARGET_S}s target")
+        else:
+            logging.info(f"Window interactive after {elapsed:.2f}s (target {INTERACTIVE_TARGET_S}s)")
+
+    def on_closing(self):
+        """Cleanup method for proper window closing"""
+        try:
+            self.cancel_pdf_fills()
+            self.autocomplete.cancel()
+            if self.recalc_timer:
+                self.window.TKroot.after_cancel(self.recalc_timer)
+            if hasattr(self, 'window'):
+                self.window.close()
+            sys.exit(0)  # Ensure complete program termination
+        except Exception as e:
+            logging.error(f"Error during cleanup: {str(e)}")
+            sys.exit(1)
+
+    def configure_scroll_frame(self, event, canvas, frame_id):
+        """Configure the scrollable frame to expand with window width"""
+        canvas.itemconfig(frame_id, width=canvas.winfo_width())
+
+
+        # Add this list of all package input keys
+
+        self.last_value = {key: '' for key in self.dollar_input_keys}
+        locale.setlocale(locale.LC_ALL, '')  # Set the locale to the user's default
+        
+        
+        self.current_monthly_payments = {}
+        
+    def calculate_cards(self, quantity):
+        try:
+            qty = int(quantity)
+            total = qty * 2.95
+            self.window["B5"].update(f"{total:.2f}")
+        except ValueError:
+            self.window["B5"].update("")
+        self.recalculate("B5")
+        
+    def calculate_guest_books(self, quantity):
+        try:
+            qty = int(quantity)
+            total = qty * 75.00
+            self.window["B6"].update(f"{total:.2f}")
+        except ValueError:
+            self.window["B6"].update("")
+        self.recalculate("B6")
+            
+    
+        
+    def handle_single_pay_jh_checkbox(self, values):
+        """Handle the Single Pay Journey Home checkbox state change"""
+        try:
+            if values["-SINGLE_PAY_JH-"]:  # If checkbox is checked
+                journey_home_value = values["3E Journey Home"]
+                if journey_home_value:
+                    self.window["4C Single Pay Journey Home"].update(journey_home_value)
+                    self.window["3E Journey Home"].update("")
+            else:  # If checkbox is unchecked
+                single_pay_value = values["4C Single Pay Journey Home"]
+                if single_pay_value:
+                    self.window["3E Journey Home"].update(single_pay_value)
+                    self.window["4C Single Pay Journey Home"].update("")
+                    
+            # Recalculate the totals that depend on the moved amount
+            self.recalculate("3E Journey Home", "4C Single Pay Journey Home")
+        except Exception as e:
+            logging.error(f"Error in handle_single_pay_jh_checkbox: {str(e)}")
+
+    def handle_input(self, event, values):
+        """Show the catalog matches for an autocomplete input"""
+        try:
+            self.autocomplete.update(event, values[event])
+        except Exception as e:
+            logging.error(f"Error updating listbox: {str(e)}")
+
+    def select_catalog_item(self, input_key, item, price_key, price):
+        """Put an item picked from the autocomplete list and its price on the form"""
+        self.window[input_key].update(item)
+        self.window[price_key].update(f"{price:.2f}")
+        self.format_dollar_field(price_key, f"{price:.2f}")
+
+        # Trigger calculation after updating values
+        self.calculate_grand_total(self.get_current_values())
+
+    def apply_package(self, package_name):
+        """Apply the selected package to the form"""
+        try:
+            logging.info(f"Starting apply_package for: {package_name}")
+            
+            # Clear all fields that might be affected by packages
+            fields_to_clear = set()
+            for package in self.packages.values():
+                fields_to_clear.update(package.keys())
+            cleared = [field for field in fields_to_clear if field in self.window.AllKeysDict]
+            for field in cleared:
+                self.window[field].update('')
+            
+            # Store the selected package name
+            self.selected_package = package_name
+            # Update the 'Type of Service' field
+            self.window['Type of Service'].update(package_name)
+            package_data = self.packages[package_name]
+            
+            # Brands that sell Cadence add its discount with every package
+            if self.profile.cadence_discount:
+                # Check if Cadence discount already exists
+                cadence_exists = False
+                empty_discount_row = None
+            
+                # Look for existing Cadence discount and empty discount rows
+                for i in range(getattr(self.window, 'metadata', 0) + 1):
+                    if self.window[('-DISCOUNT-ROW-', i)].visible:
+                        desc = self.window[('-DISCOUNT-DESC-', i)].get()
+                        amt = self.window[('-DISCOUNT-AMT-', i)].get()
+                    
+                        if desc == "Cadence":
+                            cadence_exists = True
+                            break
+                        elif not desc and not amt:
+                            empty_discount_row = i
+            
+                # Add Cadence discount if it doesn't exist
+                if not cadence_exists:
+                    if empty_discount_row is not None:
+                        # Use existing empty row
+                        self.window[('-DISCOUNT-DESC-', empty_discount_row)].update("Cadence")
+                        self.window[('-DISCOUNT-AMT-', empty_discount_row)].update(self.profile.cadence_discount)
+                        self.handle_dollar_input({('-DISCOUNT-AMT-', empty_discount_row): self.profile.cadence_discount})
+                    else:
+                        # Create new row if no empty one exists
+                        new_item_num = getattr(self.window, 'metadata', 0) + 1
+                        self.add_discount_field()
+                    
+                        self.window[('-DISCOUNT-DESC-', new_item_num)].update("Cadence")
+                        self.window[('-DISCOUNT-AMT-', new_item_num)].update(self.profile.cadence_discount)
+                        self.handle_dollar_input({('-DISCOUNT-AMT-', new_item_num): self.profile.cadence_discount})
+                    
+                        self.window[('-DISCOUNT-ROW-', new_item_num)].update(visible=True)
+            
+            # Apply package data to the form
+            updated = {}
+            for field, value in package_data.items():
+                if field in self.window.AllKeysDict:
+                    if field in self.dollar_input_keys:
+                        self.window[field].update(f"{float(value):,.2f}")
+                        self.format_dollar_field(field)
+                    else:
+                        self.window[field].update(value)
+                    updated[field] = value
+            
+            # Recalculate totals after applying the package
+            data = self.get_current_values()
+            self.calculate_grand_total(data)
+            logging.info(f"Applied package: {package_name} ({len(cleared)} fields cleared)")
+            app_logging.log_fields(f"Package {package_name}", updated)
+            
+        except Exception as e:
+            logging.error(f"Error applying package {package_name}: {str(e)}")
+            sg.popup_error(f"An error occurred while applying the package: {str(e)}")
+
+    def get_base_path(self):
+        if getattr(sys, 'frozen', False):
+            # Running as compiled executable
+            return sys._MEIPASS
+        else:
+            # Running as a normal Python script
+            return os.path.dirname(os.path.abspath(__file__))
+
+    def setup_logging(self):
+        # Records are written on a listener thread, never on the Tk thread
+        app_logging.setup_logging(os.path.join(self.get_base_path(), "Logs"))
+        logging.info("Logging initialized")
+
+    def initialize_pdf_paths(self):
+        return form_mapping.pdf_paths(self.base_path, self.profile)
+
+    def validate_pdf_mappings(self):
+        """Check the mapped fields against the PDF templates on a background thread"""
+        threading.Thread(target=self.validate_pdf_mappings_worker, daemon=True).start()
+
+    def validate_pdf_mappings_worker(self):
+        """Send any mapped fields the PDF templates don't have back to the window as -MAPPING-PROBLEMS-"""
+        if not all(os.path.exists(pdf) for pdf in self.pdf_paths.values()):
+            return  # Reported when the PDFs are filled
+        try:
+            schemas = form_schema.load_schemas(self.base_path, self.pdf_paths)
+            problems = form_mapping.validate_mappings(self.profile, schemas)
+        except Exception as e:
+            logging.error(f"Could not check the PDF field mappings: {str(e)}")
+            return
+        if problems:
+            self.window.write_event_value('-MAPPING-PROBLEMS-', problems)
+
+    def show_mapping_problems(self, problems):
+        sg.popup_error("The field mappings don't match the PDF templates:\n\n" + "\n".join(
+            f"{form_mapping.FORMS[pdf]}: {problem}" for pdf, found in problems.items() for problem in found))
+        
+    def get_current_values(self):
+        """Get current values from all input elements in the window."""
+        return {
+            key: elem.get() 
+            for key, elem in self.window.key_dict.items() 
+            if hasattr(elem, 'get')
+        }
+        
+    def handle_dollar_input(self, key):
+        """Handle dollar input formatting"""
+        try:
+            self.format_dollar_field(key)
+        except Exception as e:
+            logging.error(f"Error handling dollar input: {str(e)}")
+            
+    def discount_row(self, item_num):
+        """
+        Creates a single discount row with a description input, amount input, and delete button
+        """
+        row = [sg.pin(sg.Col([[
+            sg.Input(size=(40, 1), key=('-DISCOUNT-DESC-', item_num), enable_events=True),
+            sg.Text("$"),
+            sg.Input(size=(self.DOLLAR_WIDTH, 1), key=('-DISCOUNT-AMT-', item_num), enable_events=True),
+            sg.Button("×", key=('-DEL-DISCOUNT-', item_num), 
+                     size=(2, 1), 
+                     button_color=('black', 'lightgray'),
+                     tooltip='Delete this discount')
+        ]], key=('-DISCOUNT-ROW-', item_num)))]
+        return row
+
+    def create_discount_layout(self):
+        """
+        Creates the initial discount section layout
+        """
+        return [
+            [sg.Text("Discounts", font=("Helvetica", 16, "bold"))],
+            [sg.Button("+", key="-ADD-DISCOUNT-", size=(2, 1)), 
+             sg.Text("Add Discount", font=("Helvetica", 10))],
+            [sg.Column([self.discount_row(0)], key='-DISCOUNT-SECTION-', expand_x=True, expand_y=True)]
+        ]   
+    
+    def update_scroll_region(self):
+        """Update the scroll region of the scrollable area"""
+        try:
+            # Get the sections column widget
+            sections_column = self.window['-SECTIONS-COLUMN-'].Widget
+            
+            # Force geometry update
+            sections_column.update_idletasks()
+            
+            # Get the canvas (first child of the widget)
+            canvas = sections_column.winfo_children()[0]
+            
+            # Get the frame inside the canvas
+            frame = canvas.winfo_children()[0]
+            
+            # Force frame to update its geometry
+            frame.update_idletasks()
+            
+            # Calculate new scroll region based on frame size
+            canvas.configure(scrollregion=canvas.bbox('all'))
+            
+            # Scroll to the bottom
+            canvas.yview_moveto(1.0)
+            
+            logging.debug("Scroll region updated successfully")
+            
+        except Exception as e:
+            logging.error(f"Error updating scroll region: {str(e)}")
+
+    def add_discount_field(self):
+        """Add a new discount field row"""
+        try:
+            # Increment counter stored in window metadata
+            self.window.metadata = getattr(self.window, 'metadata', 0) + 1
+            item_num = self.window.metadata
+            
+            # Add new row to layout
+            self.window.extend_layout(self.window['-DISCOUNT-SECTION-'], 
+                                    [self.discount_row(item_num)])
+            
+            # Use the same tuple format as the initial key
+            amount_key = ('-DISCOUNT-AMT-', item_num)
+            
+            # Add to dollar_input_keys if not already there
+            if amount_key not in self.dollar_input_keys:
+                self.dollar_input_keys.append(amount_key)
+                # Add the same event bindings as in __init__
+                self.window[amount_key].Widget.bind('<Key>', lambda e, key=amount_key: self.validate_dollar_input(key))
+                self.window[amount_key].Widget.bind('<Return>', lambda e, key=amount_key: self.format_dollar_field(key))
+                self.window[amount_key].Widget.bind('<FocusOut>', lambda e, key=amount_key: self.format_dollar_field(key))
+                    
+            # Initialize last_value for this key
+            if amount_key not in self.last_value:
+                self.last_value[amount_key] = ''
+            
+            # Force window to process all pending events
+            self.window.refresh()
+            
+            # Add a small delay before updating scroll region
+            self.window.TKroot.after(100, self.update_scroll_region)
+            
+            logging.info(f"Successfully added discount field {item_num}")
+            
+        except Exception as e:
+            logging.error(f"Error adding discount field: {str(e)}")
+
+
+    def remove_discount_field(self, item_num):
+        """Remove a discount field row or clear it if it's the last one"""
+        try:
+            # Count total visible discount rows
+            visible_rows = sum(1 for i in range(getattr(self.window, 'metadata', 0) + 1) 
+                        if self.window[('-DISCOUNT-ROW-', i)].visible)
+        
+            if visible_rows <= 1:
+                # If this is the last visible row, just clear its values
+                self.window[('-DISCOUNT-DESC-', item_num)].update('')
+                self.window[('-DISCOUNT-AMT-', item_num)].update('')
+                logging.info(f"Cleared discount field {item_num} (last remaining row)")
+            else:
+                # Hide the row and clear its values
+                self.window[('-DISCOUNT-ROW-', item_num)].update(visible=False)
+                self.window[('-DISCOUNT-DESC-', item_num)].update('')
+                self.window[('-DISCOUNT-AMT-', item_num)].update('')
+            
+                # Remove tracking for amount field
+                amount_key = ('-DISCOUNT-AMT-', item_num)
+                if amount_key in self.dollar_input_keys:
+                    self.dollar_input_keys.remove(amount_key)
+                if amount_key in self.discount_amount_keys:
+                    self.discount_amount_keys.remove(amount_key)
+                if amount_key in self.last_value:
+                    del self.last_value[amount_key]
+            
+                logging.info(f"Successfully removed discount field {item_num}")
+        
+            # Recalculate totals
+            self.recalculate(('-DISCOUNT-AMT-', item_num))
+            
+            # Force window to process all pending events
+            self.window.refresh()
+            
+            # Add a small delay before updating scroll region
+            self.window.TKroot.after(100, self.update_scroll_region)
+        
+        except Exception as e:
+            logging.error(f"Error handling discount field {item_num}: {str(e)}")
+
+    
+    def run(self):
+        self.report_time_to_interactive()
+        self.validate_pdf_mappings()
+        while True:
+            try:
+                # While tabs are still deferred, a read with no events for IDLE_BUILD_MS builds the next one
+                event, values = self.window.read(timeout=self.IDLE_BUILD_MS if self.deferred_tabs else None)
+                if event == sg.WINDOW_CLOSED or event == "Exit":
+                    break
+                if event in self.WHOLE_FORM_EVENTS:
+                    values = self.prepare_whole_form(values)
+                if event == sg.TIMEOUT_EVENT:
+                    if self.deferred_tabs:
+                        self.build_tab(next(iter(self.deferred_tabs)))
+                elif event == '-TABS-':
+                    self.build_tab(values['-TABS-'])
+                elif event == "-REFRESH-":
+                    self.refresh_form()
+                elif event == "-SINGLE_PAY_JH-":
+                    self.handle_single_pay_jh_checkbox(values)
+                elif event in self.dollar_input_keys:
+                    # Every keystroke only recomputes the totals downstream of this field
+                    self.recalculate(event)
+                elif event in self.autocomplete_fields:
+                    self.handle_input(event, values)
+                    if event == 'Casket':
+                        self.recalculate("Casket")
+                elif event == self.profile.location_key:
+                    self.update_establishment_constants(values[self.profile.location_key])
+                elif event == "-PACKAGE-":
+                    logging.info(f"Selected package: {values['-PACKAGE-']}")
+                    self.apply_package(values["-PACKAGE-"])
+                    self.calculate_grand_total(self.get_current_values())
+                elif event == "-BIRTHDATE-":
+                    self.update_age(values["-BIRTHDATE-"])
+                elif event == "-CALCULATE_MONTHLY_PAYMENT-":
+                    self.calculate_monthly_payment(values)
+                    self.update_monthly_payments(values)
+                elif event == "-COMPARE-PAYMENTS-":
+                    self.show_payment_comparison(values)
+                elif event == "SIN":
+                    self.window["SIN"].update(self.format_sin(values["SIN"]))
+                elif event in self.phone_input_keys:
+                    self.window[event].update(self.format_phone_number(values[event]))
+                elif event in self.postal_input_keys:
+                    self.window[event].update(self.format_postal_code(values[event]))
+                elif event == "-SAME_ADDRESS-":
+                    self.toggle_beneficiary_address_fields(values["-SAME_ADDRESS-"])
+                elif event == "Payment Term":
+                    logging.info(f"Selected payment term: {values['Payment Term']}")
+                    self.recalculate("Payment Term")
+                elif event == "Cards_Qty":
+                    self.calculate_cards(values["Cards_Qty"])
+                elif event == "Guest_Book_Qty":
+                    self.calculate_guest_books(values["Guest_Book_Qty"])
+                elif event == "Death_Certificates_Quantity":
+                    self.calculate_death_certificates(values["Death_Certificates_Quantity"])
+                elif event == "Autofill PDFs":
+                    self.autofill_pdfs(values)
+                elif event == "-PDF-PROGRESS-":
+                    self.handle_pdf_progress(*values[event])
+                elif event == "-PDF-DONE-":
+                    self.handle_pdf_done(values[event])
+                elif event == "-PDF-ERROR-":
+                    self.handle_pdf_error(*values[event])
+                elif event == "-MAPPING-PROBLEMS-":
+                    self.show_mapping_problems(values[event])
+                elif event == "-CANCEL-PDFS-":
+                    self.cancel_pdf_fills()
+                # New discount field handling
+                elif event == "-ADD-DISCOUNT-":
+                    self.add_discount_field()
+                elif isinstance(event, tuple) and event[0] == '-DEL-DISCOUNT-':
+                    self.remove_discount_field(event[1])
+                elif event == '-CLEANUP-WIDGETS-':
+                    field_to_cleanup = values[event]
+                    try:
+                        # Cleanup widgets after form refresh
+                        for element in field_to_cleanup['row']:
+                            try:
+                                if hasattr(element, 'Widget') and element.Widget:
+                                    element.Widget.destroy()
+                                elif hasattr(element, 'TKButton') and element.TKButton:
+                                    element.TKButton.destroy()
+                            except tk.TclError:
+                                pass
+                    except Exception as e:
+                        logging.warning(f"Error during widget cleanup: {str(e)}")
+
+            except Exception as e:
+                logging.error(f"Error in main event loop: {str(e)}")
+                sg.popup_error(f"An unexpected error occurred: {str(e)}")
+
+        self.window.close()
+
+    def refresh_form(self):
+        """Refresh all form fields by clearing them"""
+        try:
+            logging.info("Starting form refresh")
+            
+            # Remove all discount rows except the first one using remove_discount_field
+            for i in range(1, getattr(self.window, 'metadata', 0) + 1):  # Start from 1 to keep first row
+                if self.window[('-DISCOUNT-ROW-', i)].visible:
+                    self.remove_discount_field(i)
+                    
+            # Clear the first row's values but keep it visible
+            self.window[('-DISCOUNT-DESC-', 0)].update('')
+            self.window[('-DISCOUNT-AMT-', 0)].update('')            
+            
+            # Clear all input fields
+            for key in self.window.AllKeysDict:
+                try:
+                    # Skip all discount-related fields (we handle them separately)
+                    if isinstance(key, tuple) and key[0] in ['-DISCOUNT-DESC-', '-DISCOUNT-AMT-', '-DEL-DISCOUNT-', '-DISCOUNT-ROW-']:
+                        continue
+                    widget = self.window[key]
+                    if isinstance(widget, sg.Input) or isinstance(widget, sg.Multiline):
+                        widget.update('')
+                    elif isinstance(widget, sg.Combo):
+                        widget.update(value='')
+                    elif isinstance(widget, sg.Checkbox):
+                        widget.update(value=False)
+                except Exception as e:
+                    logging.warning(f"Could not clear widget {key}: {str(e)}")
+            
+            # Reset selections
+            self.window["-PACKAGE-"].update(value='')
+            self.selected_package = ""
+            self.window[self.profile.location_key].update(value=self.profile.fixed_location or '')
+            
+            # Clear calculated fields
+            for field in ["Total A", "Total B", "Total C", "Total D", "Total \\(ABC\\)", 
+                        "Discount", "GST", "PST", "Total D_2", "Grand Total"]:
+                try:
+                    self.window[field].update('')
+                except Exception as e:
+                    continue
+
+            # Reset payment selection fields
+            self.window["Payment Term"].update(value='')
+            for field in ["4A Single Pay", "4B Time Pay", "4C Single Pay Journey Home", 
+                        "4D LPR", "Total 4 \\(ABCD\\)"]:
+                try:
+                    self.window[field].update('')
+                except Exception as e:
+                    continue
+                    
+            # Clear the monthly payments table
+            self.window['-MONTHLY_PAYMENTS_TABLE-'].update(values=[['' for _ in range(5)]])
+            
+            # Forget the calculated values along with the cleared fields
+            self.recalc.reset()
+
+            # Reset current_monthly_payments dictionary
+            self.current_monthly_payments = {
+                '3-year': None,
+                '5-year': None,
+                '10-year': None,
+                '15-year': None,
+                '20-year': None
+            }
+
+            # Force window refresh at the end
+            self.window.refresh()
+            logging.info("Form refreshed successfully")
+            sg.popup("Form has been refreshed. You can start a new entry.")
+            
+        except Exception as e:
+            logging.error(f"Error refreshing form: {str(e)}")
+            sg.popup_error(f"An error occurred while refreshing the form: {str(e)}")
+            
+            
+    def calculate_death_certificates(self, quantity):
+        try:
+            qty = int(quantity)
+            total = qty * 27.00
+            self.window["D7"].update(f"{total:.2f}")
+        except ValueError:
+            self.window["D7"].update("")
+        self.recalculate("D7")
+    
+    def calculate_monthly_payment(self, values):
+        """Calculate monthly payments for different terms"""
+        try:
+            # Get the total preplanned amount and single pay amount in cents
+            total_preplanned = parse_or_zero(values["Total 3"])
+            single_pay = parse_or_zero(values["4A Single Pay"])
+            
+            if total_preplanned - single_pay <= 0:
+                logging.debug("Amount to finance is zero or negative")
+                self.window['-MONTHLY_PAYMENTS_TABLE-'].update(values=[['0.00'] * 5])
+                self.current_monthly_payments = {term: ZERO for term in pricing.PAYMENT_TERMS}
+                return False
+
+            # Get age
+            try:
+                age = int(values["-AGE-"].strip())
+            except ValueError:
+                raise ValueError("Please enter a valid age before calculating monthly payments")
+
+            # Calculate and store monthly payments
+            self.current_monthly_payments = pricing.calculate_monthly_payments(
+                total_preplanned, single_pay, age, self.payment_factors)
+            display_values = [payment.format() if payment is not None else 'N/A'
+                              for payment in self.current_monthly_payments.values()]
+
+            # Update the table with the new values
+            self.window['-MONTHLY_PAYMENTS_TABLE-'].update(values=[display_values])
+            
+            # Force a window refresh
+            self.window.refresh()
+            
+            logging.debug(f"Monthly payments calculated: {display_values}")
+            logging.debug(f"Current monthly payments stored: {self.current_monthly_payments}")
+            
+            # If a payment term is already selected, update it
+            selected_term = values.get("Payment Term")
+            if selected_term and selected_term in self.current_monthly_payments:
+                self.handle_payment_term_selection(selected_term)
+            
+            return True
+
+        except Exception as e:
+            logging.error(f"Error in monthly payment calculation: {str(e)}")
+            self.window['-MONTHLY_PAYMENTS_TABLE-'].update(values=[['N/A'] * 5])
+            self.current_monthly_payments = {term: None for term in pricing.PAYMENT_TERMS}
+            sg.popup_error(f"An error occurred during calculation: {str(e)}")
+            return False
+
+    def update_monthly_payments(self, values):
+        """Update the monthly payments table with new values"""
+        try:
+            # Create a list of formatted values from current_monthly_payments
+            formatted_values = []
+            for term in ['3-year', '5-year', '10-year', '15-year', '20-year']:
+                value = self.current_monthly_payments.get(term)
+                if value is None:
+                    formatted_values.append('N/A')
+                else:
+                    try:
+                        formatted_values.append(pricing.format_dollars(value))
+                    except (ValueError, TypeError):
+                        formatted_values.append('0.00')
+            
+            # Update the table with a single row of values
+            self.window['-MONTHLY_PAYMENTS_TABLE-'].update(values=[formatted_values])
+            logging.debug(f"Updated monthly payments table with values: {formatted_values}")
+            return True
+        except Exception as e:
+            logging.error(f"Error updating monthly payments table: {str(e)}")
+            self.window['-MONTHLY_PAYMENTS_TABLE-'].update(values=[['0.00'] * 5])
+            return False
+        
+    def show_payment_comparison(self, values):
+        """Show monthly payments for the next ten years of ages and several single pays"""
+        try:
+            try:
+                age = int(values["-AGE-"].strip())
+            except ValueError:
+                raise ValueError("Please enter a valid age before comparing monthly payments")
+
+            total_preplanned = parse_or_zero(values["Total 3"])
+            single_pays = pricing.comparison_single_pays(total_preplanned, parse_or_zero(values["4A Single Pay"]))
+            comparison = pricing.payment_comparison(total_preplanned, age, single_pays,
+                                                    payment_factors=self.payment_factors)
+            rows = [[str(each), single_pay.format(), financed.format()]
+                    + [payment.format() if payment is not None else 'N/A' for payment in payments.values()]
+                    for each, single_pay, financed, payments in comparison]
+            logging.info(f"Payment comparison for age {age}: {len(rows)} rows")
+
+            # The whole matrix goes into the table when it is created, nothing is updated cell by cell
+            layout = [
+                [sg.Text(f"Monthly payments on Total 3 of ${total_preplanned.format()}",
+                         font=("Helvetica", 14, "bold"))],
+                [sg.Table(values=rows,
+                          headings=['Age', 'Single Pay', 'Financed'] + pricing.PAYMENT_TERMS,
+                          auto_size_columns=False,
+                          col_widths=[6, 14, 14] + [12] * len(pricing.PAYMENT_TERMS),
+                          justification='center',
+                          num_rows=min(len(rows), 20),
+                          display_row_numbers=False,
+                          expand_x=True,
+                          expand_y=True)],
+                [sg.Push(), sg.Button("Close")]
+            ]
+            window = sg.Window("Payment Comparison", layout, modal=True, resizable=True, finalize=True)
+            while True:
+                event, _ = window.read()
+                if event in (sg.WIN_CLOSED, "Close"):
+                    break
+            window.close()
+        except Exception as e:
+            logging.error(f"Error comparing monthly payments: {str(e)}")
+            sg.popup_error(f"An error occurred during calculation: {str(e)}")
+
+    def handle_payment_term_selection(self, selected_term):
+        """Handle payment term selection and update relevant fields"""
+        try:
+            if selected_term in self.current_monthly_payments:
+                payment_value = self.current_monthly_payments[selected_term]
+                if payment_value is not None:
+                    # Format the payment value directly
+                    payment_value = Money.parse(payment_value)
+                    formatted_payment = payment_value.format()
+                    self.window["4B Time Pay"].update(value=formatted_payment)
+                    
+                    try:
+                        # Get other values directly in cents
+                        single_pay = Money.parse(self.window["4A Single Pay"].get())
+                        journey_home = Money.parse(self.window["4C Single Pay Journey Home"].get())
+                        lpr = Money.parse(self.window["4D LPR"].get())
+                        
+                        # Calculate total
+                        total_4_abcd = single_pay + payment_value + journey_home + lpr
+                        
+                        # Update Total 4
+                        self.window["Total 4 \\(ABCD\\)"].update(value=total_4_abcd.format())
+                        self.window.refresh()
+                        
+                    except ValueError as e:
+                        logging.error(f"Error converting values: {str(e)}")
+                        return False
+                    
+                    logging.debug(f"Updated 4B Time Pay with {formatted_payment} for {selected_term}")
+                    return True
+                else:
+                    self.window["4B Time Pay"].update(value="")
+                    self.window.refresh()
+                    logging.info(f"Payment term {selected_term} not available for current age")
+                    return False
+            
+        except Exception as e:
+            logging.error(f"Error handling payment term selection: {str(e)}")
+            self.window["4B Time Pay"].update(value="")
+            self.window.refresh()
+            return False
+            
+    def calculate_grand_total(self, values):
+        """Sync every field from values and recalculate whatever changed"""
+        try:
+            self.recalc.load(values)
+            self.run_recalculation()
+            logging.debug("Grand Total and Preplanned Amount calculations completed successfully")
+            
+        except Exception as e:
+            logging.error(f"Error in calculations: {str(e)}")
+            sg.popup_error(f"An error occurred during calculation: {str(e)}")
+
+    def recalculate(self, *keys):
+        """Queue the changed keys and recalculate once after the burst of edits settles"""
+        self.recalc_pending.update(keys)
+        try:
+            if self.recalc_timer:
+                self.window.TKroot.after_cancel(self.recalc_timer)
+            self.recalc_timer = self.window.TKroot.after(self.RECALC_DELAY_MS, self.run_recalculation)
+        except Exception as e:
+            logging.error(f"Error scheduling recalculation: {str(e)}")
+            self.run_recalculation()
+
+    def run_recalculation(self):
+        """Recompute and repaint only the calculated fields downstream of the queued keys"""
+        if self.recalc_timer:
+            self.window.TKroot.after_cancel(self.recalc_timer)
+            self.recalc_timer = None
+        keys, self.recalc_pending = self.recalc_pending, set()
+        for key in keys:
+            # One unreadable field doesn't hold back the other queued edits
+            try:
+                self.recalc.set_value(key, self.window[key].get())
+            except Exception as e:
+                logging.error(f"Could not read {key} for recalculation: {str(e)}")
+        try:
+            changes, errors = self.recalc.recompute()
+
+            if recalc.MONTHLY_PAYMENTS in changes:
+                self.current_monthly_payments = dict(self.recalc.values[recalc.MONTHLY_PAYMENTS])
+            self.paint_calculated(changes)
+
+            if errors:
+                sg.popup_error("An error occurred during calculation:\n" + "\n".join(
+                    str(error) for error in errors.values()))
+        except Exception as e:
+            logging.error(f"Error recalculating {keys}: {str(e)}")
+
+    def paint_calculated(self, shown):
+        """Show calculated field text, skipping fields on tabs that aren't built yet"""
+        for field, value in shown.items():
+            if field == recalc.MONTHLY_PAYMENTS:
+                if '-MONTHLY_PAYMENTS_TABLE-' in self.window.AllKeysDict:
+                    self.window['-MONTHLY_PAYMENTS_TABLE-'].update(values=[value])
+            elif field in self.window.AllKeysDict:
+                self.window[field].update(value)
+
+    def validate_dollar_input(self, key):
+        """Validate dollar input to only allow digits, decimal point, and commas"""
+        try:
+            widget = self.window[key].Widget
+            current_value = widget.get()
+            last_stored = self.last_value.get(key, '')
+
+            # Quick handling of deletion/backspace
+            if len(current_value) < len(last_stored):
+                self.last_value[key] = current_value
+                return True
+
+            # If empty, allow it
+            if not current_value:
+                self.last_value[key] = ''
+                return True
+
+            # Only check the last character for validity
+            last_char = current_value[-1] if current_value else ''
+            if not (last_char.isdigit() or last_char in '.,'):
+                widget.delete(0, tk.END)
+                widget.insert(0, last_stored)
+                return "break"
+
+            # Simple decimal point check
+            if last_char == '.' and current_value.count('.') > 1:
+                widget.delete(0, tk.END)
+                widget.insert(0, last_stored)
+                return "break"
+
+            # Store valid value
+            self.last_value[key] = current_value
+            return True
+
+        except Exception as e:
+            logging.error(f"Error in validate_dollar_input: {str(e)}")
+            return True
+
+    def format_dollar_field(self, key, value=None):
+        """Format dollar field to two decimal places"""
+        try:
+            widget = self.window[key].Widget
+            
+            # If value is provided, use it; otherwise get from widget
+            if value is None:
+                value = widget.get()
+            else:
+                # Update widget with provided value first
+                self.window[key].update(value)
+                
+            # Handle empty or non-digit values
+            if not value or not any(c.isdigit() for c in value):
+                self.window[key].update('')  # Clear the field
+                self.last_value[key] = ''
+                
+                # Still trigger calculations even when clearing field
+                self.recalculate(key)
+                return
+                
+            # Parse to cents and format with comma separators and two decimal places
+            formatted_value = Money.parse(value).format()
+            
+            # Update the field with formatted value
+            self.window[key].update(formatted_value)
+            self.last_value[key] = formatted_value
+            
+            # Trigger calculations after formatting
+            self.recalculate(key)
+            
+        except ValueError as e:
+            logging.error(f"Error formatting dollar field {key}: {str(e)}")
+            # Revert to last valid value if available
+            if key in self.last_value:
+                self.window[key].update(self.last_value[key])
+                    
+    def update_establishment_constants(self, location):
+        if location in self.location_data:
+            data = self.location_data[location]
+            global ESTABLISHMENT_NAME, ESTABLISHMENT_EMAIL, ESTABLISHMENT_PHONE, ESTABLISHMENT_ADDRESS, ESTABLISHMENT_CITY, ESTABLISHMENT_PROVINCE, ESTABLISHMENT_POSTAL_CODE
+            
+            ESTABLISHMENT_NAME = data['ESTABLISHMENT_NAME']
+            ESTABLISHMENT_EMAIL = data['ESTABLISHMENT_EMAIL']
+            ESTABLISHMENT_PHONE = data['ESTABLISHMENT_PHONE']
+            ESTABLISHMENT_ADDRESS = data['ESTABLISHMENT_ADDRESS']
+            ESTABLISHMENT_CITY = data['ESTABLISHMENT_CITY']
+            ESTABLISHMENT_PROVINCE = data['ESTABLISHMENT_PROVINCE']
+            ESTABLISHMENT_POSTAL_CODE = data['ESTABLISHMENT_POSTAL_CODE']
+
+            logging.info(f"Updated establishment constants for {location}")
+        else:
+            logging.warning(f"Unknown location selected: {location}")
+
+    def validate_inputs(self, values):
+        if values["-EMAIL-"] and not self.validate_email(values["-EMAIL-"]):
+            sg.popup_error(
+                "Invalid email address. Please enter a valid email or leave it blank.")
+            return False
+        if values["Email_3"] and not self.validate_email(values["Email_3"]):
+            sg.popup_error("Invalid email address for Beneficiary. Please enter a valid email or leave it blank.")
+            return False
+        if values["Representative Email"] and not self.validate_email(values["Representative Email"]):
+            sg.popup_error("Invalid email address for Representative. Please enter a valid email or leave it blank.")
+            return False
+        if values["-BIRTHDATE-"] and not self.validate_email(values["-BIRTHDATE-"]):
+            sg.popup_error(
+                "Invalid birthdate. Please use the format 'Month Day, Year' (e.g., January 1, 1990) or leave it blank.")
+            return False
+        return True
+
+    def validate_email(self, email):
+        if not email:  # Allow empty email fields
+            return True
+        pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
+        return re.match(pattern, email) is not None
+
+    def validate_birthdate(self, birthdate):
+        from dateutil import parser
+        try:
+            parser.parse(birthdate)
+            return True
+        except ValueError:
+            return False
+    
+    def validate_phone_input(self, event):
+        """Validate phone number input to only allow digits and hyphens"""
+        try:
+            widget = self.window[event].Widget
+            value = widget.get()
+            
+            # Allow backspace/delete
+            if len(value) < len(self.last_value.get(event, '')):
+                self.last_value[event] = value
+                return True
+                
+            # Only allow digits
+            if value and not value[-1].isdigit():
+                # Revert to previous valid value
+                widget.delete(0, tk.END)
+                widget.insert(0, self.last_value.get(event, ''))
+                return False
+                
+            # Format the number if it's valid
+            formatted = self.format_phone_number(value)
+            if formatted != value:
+                widget.delete(0, tk.END)
+                widget.insert(0, formatted)
+                
+            self.last_value[event] = formatted
+            return True
+            
+        except Exception as e:
+            logging.error(f"Error in validate_phone_input: {str(e)}")
+            return True
+
+    def validate_phone_input(self, event):
+        """Validate phone number input to only allow digits and hyphens"""
+        try:
+            widget = self.window[event].Widget
+            value = widget.get()
+            
+            # Allow backspace/delete
+            if len(value) < len(self.last_value.get(event, '')):
+                self.last_value[event] = value
+                return True
+                
+            # Only allow digits
+            if value and not value[-1].isdigit():
+                # Revert to previous valid value
+                widget.delete(0, tk.END)
+                widget.insert(0, self.last_value.get(event, ''))
+                return False
+                
+            # Format the number if it's valid
+            formatted = self.format_phone_number(value)
+            if formatted != value:
+                widget.delete(0, tk.END)
+                widget.insert(0, formatted)
+                
+            self.last_value[event] = formatted
+            return True
+            
+        except Exception as e:
+            logging.error(f"Error in validate_phone_input: {str(e)}")
+            return True
+    
+    def format_phone_number(self, phone):
+        # Remove any non-digit characters
+        phone = ''.join(filter(str.isdigit, phone))
+        # Format as XXX-XXX-XXXX
+        if len(phone) <= 3:
+            return phone
+        elif len(phone) <= 6:
+            return f"{phone[:3]}-{phone[3:]}"
+        else:
+            return f"{phone[:3]}-{phone[3:6]}-{phone[6:10]}"
+
+    def format_postal_code(self, postal_code):
+        # Remove any non-alphanumeric characters and convert to uppercase
+        postal_code = ''.join(filter(str.isalnum, postal_code)).upper()
+        # Format as XXX XXX
+        if len(postal_code) <= 3:
+            return postal_code
+        else:
+            return f"{postal_code[:3]} {postal_code[3:6]}"
+
+    def format_sin(self, sin):
+        # Remove any non-digit characters
+        sin = ''.join(filter(str.isdigit, sin))
+        # Format as XXX-XXX-XXX
+        if len(sin) <= 3:
+            return sin
+        elif len(sin) <= 6:
+            return f"{sin[:3]}-{sin[3:]}"
+        else:
+            return f"{sin[:3]}-{sin[3:6]}-{sin[6:9]}"
+
+    def calculate_age(self, birthdate):
+        return pricing.calculate_age(birthdate)
+    
+    def update_age(self, birthdate):
+        try:
+            age = self.calculate_age(birthdate)
+            self.window["-AGE-"].update(str(age))
+        except ValueError:
+            self.window["-AGE-"].update("")
+        self.recalculate("-AGE-")
+
+    def toggle_beneficiary_address_fields(self, same_address):
+        for key in ["Address \\(if different\\)", "City_4", "Province_4", "Postal Code_4"]:
+            self.window[key].update(disabled=same_address)
+            
+    def show_pdf_open_error(self, filename):
+        """Show error popup when PDF is open and can't be overwritten"""
+        sg.popup_error(
+            f"Cannot save PDF because it is currently open:\n\n"
+            f"{filename}\n\n"
+            "Please close the PDF and try again.",
+            title="PDF File In Use",
+            keep_on_top=True
+        )
+
+    def autofill_pdfs(self, values):
+        if not all(os.path.exists(pdf) for pdf in self.pdf_paths.values()):
+            logging.error(f"One or more PDF files not found. Base path: {self.base_path}")
+            sg.popup_error(f"One or more PDF files not found. Please check the Forms directory.\nLooking in: {self.base_path}")
+            return
+
+        # Create 'Filled_Forms' folder in the same directory as the executable
+        if getattr(sys, 'frozen', False):
+            output_dir = Path(sys.executable).parent / "Filled Forms"
+        else:
+            output_dir = Path(os.getcwd()) / "Filled Forms"
+        output_dir.mkdir(exist_ok=True)
+
+        output_filenames = self.get_output_filenames(values)
+
+        output_pdfs = {
+            i: output_dir / filename for i, filename in output_filenames.items()
+        }
+
+        try:
+            # Create data dictionaries
+            data_dicts = self.prepare_data_dictionaries(values)
+        except Exception as e:
+            logging.error(f"Error filling PDFs: {str(e)}")
+            sg.popup_error(f"Error filling PDFs: {str(e)}")
+            return
+
+        # Drop finished sets from the status list before starting the next one
+        for batch in [b for b, info in self.pdf_batches.items() if info['finished']]:
+            del self.pdf_batches[batch]
+
+        # The PDFs are written on a worker thread so the form stays usable
+        self.pdf_batch_count += 1
+        batch = self.pdf_batch_count
+        cancel = threading.Event()
+        self.pdf_batches[batch] = {
+            'filenames': output_filenames,
+            'data_dicts': data_dicts,
+            'status': {i: "Queued" for i in output_pdfs},
+            'failed': {},
+            'cancel': cancel,
+            'finished': False
+        }
+        jobs = {i: (input_pdf, output_pdfs[i], data_dicts[i]) for i, input_pdf in self.pdf_paths.items()}
+        logging.info(f"Starting PDF set {batch} for {values['-FIRST-']} {values['-LAST-']}")
+        threading.Thread(target=self.fill_pdfs_worker, args=(batch, jobs, cancel), daemon=True).start()
+        self.update_pdf_status()
+
+    def fill_pdfs_worker(self, batch, jobs, cancel):
+        """Background thread: fill the PDFs and report each result as a window event"""
+        try:
+            import pdf_templates
+            for i, output_pdf, error in pdf_templates.fill_pdfs(jobs, cancel=cancel):
+                self.window.write_event_value('-PDF-PROGRESS-', (batch, i, output_pdf, error))
+            self.window.write_event_value('-PDF-DONE-', batch)
+        except Exception as e:
+            logging.error(f"Error filling PDFs: {str(e)}")
+            try:
+                self.window.write_event_value('-PDF-ERROR-', (batch, e))
+            except Exception:
+                pass  # Window already closed
+
+    def handle_pdf_progress(self, batch, i, output_pdf, error):
+        """Record the result of one filled PDF"""
+        import pdf_templates
+        info = self.pdf_batches.get(batch)
+        if info is None:
+            return
+        if error is None:
+            info['status'][i] = "Done"
+            logging.info(f"Filled PDF {i} written to: {output_pdf}")
+            app_logging.log_fields(f"PDF {i}", info['data_dicts'][i])
+        elif isinstance(error, pdf_templates.FillCancelled):
+            info['status'][i] = "Cancelled"
+            logging.info(f"PDF {i} cancelled: {output_pdf}")
+        elif isinstance(error, PermissionError):
+            info['status'][i] = "File open"
+            info['failed'][i] = (output_pdf, error)
+            logging.error(f"Permission denied when writing to: {output_pdf}")
+        else:
+            info['status'][i] = "Error"
+            info['failed'][i] = (output_pdf, error)
+            logging.error(f"Error filling PDF {i}: {str(error)}")
+        self.update_pdf_status()
+
+    def handle_pdf_done(self, batch):
+        """Report the outcome once every PDF in a set has been handled"""
+        info = self.pdf_batches.get(batch)
+        if info is None:
+            return
+        info['finished'] = True
+        self.update_pdf_status()
+
+        for i, (output_pdf, error) in sorted(info['failed'].items()):
+            if isinstance(error, PermissionError):
+                self.show_pdf_open_error(output_pdf)
+            else:
+                sg.popup_error(f"Error filling PDFs: {str(error)}")
+        if info['failed']:
+            return
+        if info['cancel'].is_set():
+            logging.info(f"PDF set {batch} cancelled")
+            return
+
+        output_filenames = info['filenames']
+        sg.popup(f"""PDFs have been filled successfully.
+    Saved as:
+    {chr(10).join([f"{i}. {filename}" for i, filename in output_filenames.items()])}
+    In the Filled_Forms directory next to the application.""")
+
+    def handle_pdf_error(self, batch, error):
+        """The worker thread stopped before finishing the set"""
+        info = self.pdf_batches.get(batch)
+        if info is not None:
+            info['finished'] = True
+            for i, status in info['status'].items():
+                if status == "Queued":
+                    info['status'][i] = "Error"
+            self.update_pdf_status()
+        sg.popup_error(f"Error filling PDFs: {str(error)}")
+
+    def cancel_pdf_fills(self):
+        """Stop every PDF that has not started writing yet"""
+        for batch, info in self.pdf_batches.items():
+            if not info['finished']:
+                info['cancel'].set()
+                logging.info(f"Cancelling PDF set {batch}")
+
+    def update_pdf_status(self):
+        """Show the per-file status of the current PDF sets"""
+        lines = []
+        for info in self.pdf_batches.values():
+            for i, filename in info['filenames'].items():
+                lines.append(f"{info['status'][i]:<10} {filename}")
+        running = any(not info['finished'] for info in self.pdf_batches.values())
+        self.window['-PDF-STATUS-'].update(values=lines, visible=bool(lines))
+        self.window['-CANCEL-PDFS-'].update(disabled=not running)
+
+    def get_output_filenames(self, values):
+        """Output file names for each of the filled PDFs"""
+        return form_mapping.output_filenames(values)
+
+    def prepare_data_dictionaries(self, values):
+        """Build the per-PDF data dictionaries from the current form values"""
+        return form_mapping.prepare_data_dictionaries(values, self.profile)
+
+
+def main(profile):
+    """Run the window for a brand"""
+    multiprocessing.freeze_support()  # PDF worker processes in the frozen executable
+    autofiller = PDFAutofiller(profile)
+    autofiller.run()
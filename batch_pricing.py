@@ -0,0 +1,164 @@
+"""Vectorized re-pricing of many saved plans at once.
+
+Plans are given as columns: one integer-cents array per line item (A1..D8), plus
+Discount, the section 3/4 amounts, -AGE- and Payment Term. 4B is the typed amount,
+kept when no term is selected. price_plans computes the same figures as
+pricing.quote for every plan in a single NumPy pass, with the same half-up cent
+rounding.
+
+    columns = batch_pricing.to_columns(saved_plans)   # list of form value dicts
+    totals = batch_pricing.price_plans(columns)
+    totals["Grand Total"][i], totals["-MONTHLY-PAYMENTS-"][i, term_index]
+"""
+from decimal import Decimal
+
+import numpy as np
+
+import pricing
+from money import Money, parse_or_zero
+
+AMOUNT_COLUMNS = pricing.LINE_ITEMS + ["Discount"] + pricing.SECTION_3_FIELDS[1:] + [
+    "4A Single Pay", "4B Time Pay", "4C Single Pay Journey Home", "4D LPR"]
+NO_AGE = np.iinfo(np.int64).min
+NO_TERM = -1
+NOT_OFFERED = np.iinfo(np.int64).min  # Payment cell for a term the age group doesn't offer
+
+
+def _ratio(rate):
+    """A rate such as 0.008925 as an exact (numerator, denominator) pair"""
+    return Decimal(str(rate)).as_integer_ratio()
+
+
+def _apply_rate(cents, numerator, denominator):
+    """cents * numerator / denominator rounded half up (away from zero), like Money.percent"""
+    scaled = np.abs(cents) * numerator
+    rounded = (2 * scaled + denominator) // (2 * denominator)
+    return np.where(cents < 0, -rounded, rounded)
+
+
+def _factor_table(payment_factors):
+    """pricing.factor_table as integer numerators over one shared denominator.
+
+    Row i is age i; the extra last row stands for ages with no payment terms.
+    """
+    table = pricing.factor_table(payment_factors)
+    ratios = [[_ratio(factor) if factor is not None else None for factor in factors]
+              for factors in table if factors is not None]
+    denominator = int(np.lcm.reduce([ratio[1] for row in ratios for ratio in row if ratio] or [1]))
+
+    numerators = np.zeros((len(table) + 1, len(pricing.PAYMENT_TERMS)), dtype=np.int64)
+    offered = np.zeros(numerators.shape, dtype=bool)
+    in_range = np.zeros(len(table) + 1, dtype=bool)
+    for age, factors in enumerate(table):
+        if factors is None:
+            continue
+        in_range[age] = True
+        for col, factor in enumerate(factors):
+            if factor is not None:
+                n, d = _ratio(factor)
+                numerators[age, col] = n * (denominator // d)
+                offered[age, col] = True
+    return numerators, offered, in_range, denominator
+
+
+def to_columns(plans):
+    """Columnar arrays from a list of form value dictionaries"""
+    plans = [pricing.prepare_values(plan) for plan in plans]
+    columns = {key: np.fromiter((parse_or_zero(plan.get(key)) for plan in plans), dtype=np.int64, count=len(plans))
+               for key in AMOUNT_COLUMNS if key != "Discount"}
+    columns["Discount"] = np.fromiter((pricing.calculate_total_discount(plan) for plan in plans),
+                                      dtype=np.int64, count=len(plans))
+
+    def age(plan):
+        value = str(plan.get("-AGE-") or "").strip()
+        return int(value) if value.lstrip('-').isdigit() else NO_AGE
+
+    columns["-AGE-"] = np.fromiter((age(plan) for plan in plans), dtype=np.int64, count=len(plans))
+    terms = {term: i for i, term in enumerate(pricing.PAYMENT_TERMS)}
+    columns["Payment Term"] = np.fromiter((terms.get(plan.get("Payment Term"), NO_TERM) for plan in plans),
+                                          dtype=np.int64, count=len(plans))
+    columns["Basic Cremation"] = np.fromiter((bool(pricing.pst_exempt_fields(plan)) for plan in plans),
+                                             dtype=bool, count=len(plans))
+    return columns
+
+
+def price_plans(columns, gst_fields=pricing.GST_FIELDS, pst_fields=pricing.PST_FIELDS,
+                payment_factors=pricing.PAYMENT_FACTORS):
+    """Totals, taxes, Total 3 and monthly payments (cents) for every plan in the columns.
+
+    Missing columns count as zero / no age / no term. Returns a dict of arrays keyed
+    like the form fields, plus '-MONTHLY-PAYMENTS-' (N x 5, NOT_OFFERED where a term
+    isn't available) and '-AGE-ERROR-' (an amount is financed but the age has no group,
+    so every term is NOT_OFFERED).
+    """
+    n = len(next(iter(columns.values())))
+    zeros = np.zeros(n, dtype=np.int64)
+
+    def column(key):
+        return np.asarray(columns.get(key, zeros), dtype=np.int64)
+
+    items = np.stack([column(field) for field in pricing.LINE_ITEMS], axis=1)
+    index = pricing.LINE_INDEX
+    results = {}
+    for section, fields in pricing.SECTION_FIELDS.items():
+        results[f"Total {section}"] = items[:, [index[f] for f in fields]].sum(axis=1)
+
+    discount = column("Discount")
+    taxable = items[:, [index[f] for f in gst_fields]].sum(axis=1)
+    pst_columns = [f for f in gst_fields if f in pst_fields]
+    pst_base = items[:, [index[f] for f in pst_columns]].sum(axis=1)
+    if "B1" in pst_columns:
+        basic_cremation = np.asarray(columns.get("Basic Cremation", np.zeros(n, dtype=bool)), dtype=bool)
+        pst_base = pst_base - np.where(basic_cremation, items[:, index["B1"]], 0)
+
+    gst = _apply_rate(taxable - discount, *_ratio(pricing.GST_RATE))
+    pst = _apply_rate(pst_base, *_ratio(pricing.PST_RATE))
+    total_abc = results["Total A"] + results["Total B"] + results["Total C"]
+    grand_total = total_abc - discount + gst + pst + results["Total D"]
+    total_3 = grand_total + sum(column(f) for f in pricing.SECTION_3_FIELDS[1:])
+
+    results.update({
+        "Total D_2": results["Total D"],
+        "Total \\(ABC\\)": total_abc,
+        "Discount": discount,
+        "GST": gst,
+        "PST": pst,
+        "Grand Total": grand_total,
+        "3A Goods and Services": grand_total,
+        "Total 3": total_3
+    })
+
+    # Monthly payments on the financed amount, rounded up to whole dollars
+    numerators, offered, in_range, denominator = _factor_table(payment_factors)
+    age = column("-AGE-")
+    has_age = age != NO_AGE
+    rows = np.where(age < len(numerators) - 1, np.maximum(age, 0), len(numerators) - 1)
+    to_finance = -(-(total_3 - column("4A Single Pay")) // 100) * 100
+    financed = has_age & (to_finance > 0)
+
+    payments = _apply_rate(np.maximum(to_finance, 0)[:, None], numerators[rows], denominator)
+    payments = np.where(financed[:, None], payments, 0)
+    payments = np.where(financed[:, None] & ~offered[rows], NOT_OFFERED, payments)
+    age_error = financed & ~in_range[rows]
+    payments[age_error] = NOT_OFFERED  # Like pricing.quote, no term is offered for the age
+    results["-MONTHLY-PAYMENTS-"] = payments
+    results["-AGE-ERROR-"] = age_error
+
+    # 4B follows the selected term when there is one
+    term = column("Payment Term")
+    selected = has_age & (term != NO_TERM)
+    chosen = payments[np.arange(n), np.clip(term, 0, len(pricing.PAYMENT_TERMS) - 1)]
+    time_pay = np.where(selected & (chosen != NOT_OFFERED), chosen, np.where(selected, 0, column("4B Time Pay")))
+    results["4B Time Pay"] = time_pay
+    results["Total 4 \\(ABCD\\)"] = column("4A Single Pay") + time_pay + column("4C Single Pay Journey Home") + column("4D LPR")
+    return results
+
+
+def plan_totals(results, i):
+    """The priced fields of plan i as Money, with monthly payments keyed by term"""
+    totals = {key: Money(int(values[i])) for key, values in results.items()
+              if key not in ("-MONTHLY-PAYMENTS-", "-AGE-ERROR-")}
+    totals["-MONTHLY-PAYMENTS-"] = {
+        term: None if payment == NOT_OFFERED else Money(int(payment))
+        for term, payment in zip(pricing.PAYMENT_TERMS, results["-MONTHLY-PAYMENTS-"][i])}
+    return totals
@@ -0,0 +1,459 @@
+"""Brand profiles: everything that differs between the Kearney, EO and ACB builds.
+
+The window, pricing, form mapping and PDF writer are shared; a profile supplies
+the brand's PDF templates, logos, locations, packages and local price lists.
+
+    autofiller = autofill_core.PDFAutofiller(brands.PROFILES["eo"])
+"""
+import catalogs
+
+TRUSTAGE_APPLICATION = "Protector Plus TruStage Application form - New.pdf"
+JOURNEY_HOME = "Journey Home Enrollment Form - New.pdf"
+
+
+class BrandProfile:
+    """One brand's templates, branding, locations and catalogs"""
+
+    def __init__(self, key, title, pdf_files, logos, icon, location_key, location_label, location_data,
+                 packages, crematorium, other_3, viewings=catalogs.VIEWINGS, caskets=catalogs.CASKETS,
+                 fixed_location=None, location_checkboxes=None, location_checked=None, cadence_discount=None):
+        self.key = key
+        self.title = title
+        self.pdf_files = pdf_files
+        self.logos = logos  # (left, right) image files in Logos/
+        self.icon = icon
+        self.location_key = location_key
+        self.location_label = location_label
+        self.location_data = location_data
+        self.locations = list(location_data)
+        # A single-establishment brand shows its location read-only instead of a combo
+        self.fixed_location = fixed_location
+        # Location -> checkbox field on the forms, and the value that ticks it on each form
+        self.location_checkboxes = location_checkboxes or {}
+        self.location_checked = location_checked or {}
+        # Packages add a Cadence discount row of this amount
+        self.cadence_discount = cadence_discount
+
+        self.packages = packages
+        self.viewings = viewings
+        self.limousines = catalogs.LIMOUSINES
+        self.caskets = caskets
+        self.urns = catalogs.URNS
+        self.crematorium = crematorium
+        self.other_3 = other_3
+        self.reception_facilities = catalogs.RECEPTION_FACILITIES
+        self.weekend = catalogs.WEEKEND
+        self.discounts = catalogs.DISCOUNTS
+
+
+ROB_LOCATION_DATA = {
+    "Kearney Funeral Services (KFS)": {'ESTABLISHMENT_NAME': 'Kearney Funeral Services (KFS)', 'ESTABLISHMENT_EMAIL': 'Vancouver.Chapel@KearneyFS.com', 'ESTABLISHMENT_PHONE': '604-736-2668', 'ESTABLISHMENT_ADDRESS': '450 W 2nd Ave', 'ESTABLISHMENT_CITY': 'Vancouver', 'ESTABLISHMENT_PROVINCE': 'BC', 'ESTABLISHMENT_POSTAL_CODE': 'V5Y 1E2'},
+    "Kearney Burnaby Chapel (KBC)": {'ESTABLISHMENT_NAME': 'Kearney Burnaby Chapel', 'ESTABLISHMENT_EMAIL': 'Burnaby@KearneyFS.com', 'ESTABLISHMENT_PHONE': '604-299-6889', 'ESTABLISHMENT_ADDRESS': '4715 Hastings St', 'ESTABLISHMENT_CITY': 'Burnaby', 'ESTABLISHMENT_PROVINCE': 'BC', 'ESTABLISHMENT_POSTAL_CODE': 'V5C 2K8'},
+    "Kearney Burquitlam Funeral Home (BFH)": {'ESTABLISHMENT_NAME': 'Kearney Burquitlam Funeral Home', 'ESTABLISHMENT_EMAIL': 'Info@BurquitlamFuneralHome.ca', 'ESTABLISHMENT_PHONE': '604-936-9987', 'ESTABLISHMENT_ADDRESS': '102-200 Bernatchey St', 'ESTABLISHMENT_CITY': 'Coquitlam', 'ESTABLISHMENT_PROVINCE': 'BC', 'ESTABLISHMENT_POSTAL_CODE': 'V3K 0H8'},
+    "Kearney Columbia-Bowell Chapel (CBC)": {'ESTABLISHMENT_NAME': 'Kearney Columbia-Bowell Chapel', 'ESTABLISHMENT_EMAIL': 'Columbia-Bowell@KearneyFS.com', 'ESTABLISHMENT_PHONE': '604-521-4881', 'ESTABLISHMENT_ADDRESS': '219 6th Street', 'ESTABLISHMENT_CITY': 'New Westminster', 'ESTABLISHMENT_PROVINCE': 'BC', 'ESTABLISHMENT_POSTAL_CODE': 'V3L 3A3'},
+    "Kearney Cloverdale & South Surrey (CLO)": {'ESTABLISHMENT_NAME': 'Kearney Clovedale & South Surrey', 'ESTABLISHMENT_EMAIL': 'Cloverdale@KearneyFS.com', 'ESTABLISHMENT_PHONE': '604-574-2603', 'ESTABLISHMENT_ADDRESS': '17667 57th Ave', 'ESTABLISHMENT_CITY': 'Surrey', 'ESTABLISHMENT_PROVINCE': 'BC', 'ESTABLISHMENT_POSTAL_CODE': 'V3S 1H1'}
+}
+
+ROB_PACKAGES = {
+    "Full Funeral Church - Cremation": {
+        'A1': 525.00, 'A2A': 2755.00, 'A3': 895.00, 'A4B': 365.00,
+        'A5A': 365.00, 'A5B': 695.00, 'A9D': 295.00, 'A9E': 525.00,
+        'Casket': 'Mazri','B1': 795.00, 'Urn': 'Basic Cardboard Urn', 'B2': 35.00, 'Crematorium': 'West Shore',
+        'C2': 745.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Full Funeral Church - Burial": {
+        'A1': 525.00, 'A2A': 2755.00, 'A3': 895.00, 'A4B': 365.00,
+        'A5A': 365.00, 'A5B': 695.00, 'A9D': 295.00, 'A9E': 525.00, 'Casket': 'Mazri',
+        'B1': 795.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Full Funeral Chapel - Cremation": {
+        'A1': 525.00, 'A2A': 2755.00, 'A3': 895.00, 'A4A': 895.00, 'A4B': 365.00, 
+        'A5A': 365.00, 'A5B': 695.00, 'A9D': 295.00, 'A9E': 525.00, 'Casket': 'Mazri',
+        'B1': 795.00, 'Urn': 'Basic Cardboard Urn', 'B2': 35.00, 'Crematorium': 'West Shore',
+        'C2': 745.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner', 'C9': 599.00, 
+        'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Full Funeral Chapel - Burial": {
+        'A1': 525.00, 'A2A': 2755.00, 'A3': 895.00, 'A4A': 895.00, 'A4B': 365.00,
+        'A5A': 365.00, 'A5B': 695.00, 'A9D': 295.00, 'A9E': 525.00, 'Casket': 'Mazri',
+        'B1': 795.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner', 'C9': 599.00,
+        'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Full Funeral Chapel - Cremation, Reception": {
+        'A1': 525.00, 'A2A': 2755.00, 'A3': 895.00, 'A4A': 895.00, 'A4B': 365.00,
+        'A5A': 365.00, 'A5B': 695.00, 'Reception Facilities': 'KFS New West Reception Room Rental (Disp Dishes, Coffee, Tea)',
+        'A8': 595.00, 'A9D': 295.00, 'A9E': 525.00, 'Casket': 'Mazri',
+        'B1': 795.00, 'Urn': 'Basic Cardboard Urn', 'B2': 35.00, 'Crematorium': 'West Shore',
+        'C2': 745.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner', 'C9': 599.00,
+        'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Full Funeral Chapel - Burial, Reception": {
+        'A1': 525.00, 'A2A': 2755.00, 'A3': 895.00, 'A4A': 895.00, 'A4B': 365.00, 
+        'A5A': 365.00, 'A5B': 695.00, 'Reception Facilities': 'KFS New West Reception Room Rental (Disp Dishes, Coffee, Tea)',
+        'A8': 595.00, 'A9D': 295.00, 'A9E': 525.00, 'Casket': 'Mazri',
+        'B1': 795.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner', 'C9': 599.00, 
+        'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Minimum Cremation - No Viewing": {
+        'A1': 525.00, 'A2A': 765.00, 'A3': 595.00, 'A4B': 365.00,
+        'Casket': 'Basic Cremation Container', 'B1': 395.00, 'Urn': 'Basic Cardboard Urn',
+        'B2': 35.00, 'Crematorium': 'West Shore',
+        'C2': 745.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': 1,
+        'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Minimum Cremation - With Viewing": {
+        'A1': 525.00, 'A2A': 895.00, 'A3': 350.00, 'A4B': 365.00, 'A5A': 365.00, 'A5B': 695.00,
+        'Evening Prayers or Visitation': 'Viewing at New West', 'A6': 500.00,
+        'Casket': 'Mazri', 'B1': 795.00, 'Urn': 'Basic Cardboard Urn', 'B2': 35.00, 'Crematorium': 'West Shore',
+        'C2': 745.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Graveside - No Viewing": {
+        'A1': 525.00, 'A2A': 1195.00, 'A3': 595.00, 'A4B': 365.00,
+        'A5A': 365.00, 'A9E': 525.00, 'Casket': 'Mazri', 'B1': 795.00,'C5': 40.00,
+        'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Graveside - With Viewing": {
+        'A1': 525.00, 'A2A': 1195.00, 'A3': 595.00, 'A4B': 365.00, 'A5A': 365.00,
+        'A5B': 695.00, 'Evening Prayers or Visitation': 'Viewing at New West',
+        'A6': 500.00, 'A9E': 525.00, 'Casket': 'Mazri', 'B1': 795.00,'C5': 40.00,
+        'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Memorial Service - No Reception, No Viewing": {
+        'A1': 525.00, 'A2A': 1895.00, 'A3': 795.00, 'A4A': 895.00, 'A4B': 365.00, 'Casket': 'Basic Cremation Container',
+        'B1': 395.00, 'Urn': 'Basic Cardboard Urn', 'B2': 35.00, 'Crematorium': 'West Shore', 'C2': 745.00, 'C5': 40.00,
+        'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Memorial Service - No Reception, With Viewing": {
+        'A1': 525.00, 'A2A': 1895.00, 'A3': 795.00, 'A4A': 895.00, 'A4B': 365.00, 'A5B': 695.00,
+        'Evening Prayers or Visitation': 'Viewing at New West', 'A6': 500.00,
+        'Casket': 'Basic Cremation Container', 'B1': 395.00, 'Urn': 'Basic Cardboard Urn',
+        'B2': 35.00, 'Crematorium': 'West Shore', 'C2': 745.00, 'C5': 40.00,
+        'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Memorial Service - With Reception, No Viewing": {
+        'A1': 525.00, 'A2A': 1895.00, 'A3': 795.00, 'A4A': 895.00, 'A4B': 365.00,
+        'Reception Facilities': 'KFS New West Reception Room Rental (Disp Dishes, Coffee, Tea)', 'A8': 595.00,
+        'Casket': 'Basic Cremation Container', 'B1': 395.00, 'Urn': 'Basic Cardboard Urn', 'B2': 35.00, 'Crematorium': 'West Shore',
+        'C2': 745.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Memorial Service - With Reception, With Viewing": {
+        'A1': 525.00, 'A2A': 1895.00, 'A3': 795.00, 'A4A': 895.00, 'A4B': 365.00, 'A5B': 695.00,
+        'Evening Prayers or Visitation': 'Viewing at New West', 'A6': 500.00,
+        'Reception Facilities': 'KFS New West Reception Room Rental (Disp Dishes, Coffee, Tea)', 'A8': 595.00,
+        'Casket': 'Mazri', 'B1': 795.00, 'Urn': 'Basic Cardboard Urn', 'B2': 35.00, 'Crematorium': 'West Shore',
+        'C2': 745.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Witness Cremation - No Viewing": {
+        'A1': 525.00, 'A2A': 1295.00, 'A3': 595.00, 'A4B': 365.00, 'A5A': 365.00, 'A9E': 525.00, 'Casket': 'Basic Cremation Container',
+        'B1': 395.00, 'Urn': 'Basic Cardboard Urn', 'B2': 35.00, 'Crematorium': 'Watch Start Cremation (Maple Ridge)',
+        'C2': 1495.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Witness Cremation - With Viewing": {
+        'A1': 525.00, 'A2A': 1295.00, 'A3': 595.00, 'A4B': 365.00, 'A5A': 365.00, 'A5B': 695.00,
+        'A9E': 525.00, 'Evening Prayers or Visitation': 'Viewing at New West', 'A6': 500.00,
+        'Casket': 'Mazri', 'B1': 795.00, 'Urn': 'Basic Cardboard Urn', 'B2': 35.00, 'Crematorium': 'Watch Start Cremation (Maple Ridge)',
+        'C2': 1495.00, 'C5': 40.00, 'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Chapel Rental Reception - Cremation or Burial Elsewhere": {
+        'A2A': 2495.00, 'A4A': 895.00, 'Reception Facilities': 'KFS New West Reception Room Rental (Disp Dishes, Coffee, Tea)',
+        'A8': 595.00, 'Other_2': 'Cadence Legacy Planner', 'C9': 599.00,
+        'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Ship Out International - Service at Church": {
+        'A1': 525.00, 'A2A': 2755.00, 'A3': 895.00, 'A4B': 695.00, 'A5A': 365.00, 'A5B': 695.00,
+        'A9B': 395.00, 'Casket': 'Misty Blue - 18 gauge steel',
+        'B1': 3995.00, 'Other_1': 'Casket Shipping Outer Container', 'B7': 750.00,
+        'C5': 40.00, 'Other_2': 'Cadence Legacy Planner',
+        'C9': 599.00, 'Death_Certificates_Quantity': 1, 'D7': 27.00,
+        'Other_4': 'Airfare Estimate', 'D8': 3500.00, '3E Journey Home': 595.00
+    },
+    "Ship Out International - Service at Chapel": {
+        'A1': 525.00, 'A2A': 2755.00, 'A3': 895.00, 'A4A': 895.00, 'A4B': 695.00, 'A5A': 365.00, 'A5B': 695.00,
+        'Reception Facilities': 'KFS New West Reception Room Rental (Disp Dishes, Coffee, Tea)', 'A8': 595.00,
+        'A9B': 395.00, 'Casket': 'Misty Blue - 18 gauge steel',
+        'B1': 3995.00, 'Other_1': 'Casket Shipping Outer Container', 'B7': 750.00,
+        'C5': 40.00, 'Other_2': 'Cadence Legacy Planner', 'C9': 599.00,
+        'Death_Certificates_Quantity': 1, 'D7': 27.00, '3E Journey Home': 595.00,
+        'Other_4': 'Airfare Estimate', 'D8': 3500.00
+    },
+    "Ship Out International - No Service": {
+        'A1': 525.00, 'A2A': 995.00, 'A3': 895.00, 'A4B': 695.00, 'A5A': 365.00, 'A5B': 695.00,
+        'A9B': 395.00, 'Casket': 'Misty Blue - 18 gauge steel', 'B1': 3995.00,
+        'Other_1': 'Casket Shipping Outer Container', 'B7': 750.00,
+        'C5': 40.00, 'Other_2': 'Cadence Legacy Planner', 'C9': 599.00,
+        'Death_Certificates_Quantity': 1, 'D7': 27.00,
+        'Other_4': 'Airfare Estimate', 'D8': 3500.00
+    }
+}
+
+ROB_CREMATORIUM = {
+    "West Shore": 745.00,
+    "Maple Ridge": 945.00,
+    "Oversized - West Shore (300+)": 1045.00,
+    "Oversized - Maple Ridge (300+)": 1255.00,
+    "Watch Start Cremation (Maple Ridge)": 1495.00
+}
+
+ROB_OTHER_3 = {
+    "Rush Cremation Fee (72 hours from registration)": 350.00,
+    "Scheduled Start Cremation Fee (no family)": 1245.00
+}
+
+EO_LOCATION_DATA = {
+    "Earth's Option Cremation and Burial Services": {'ESTABLISHMENT_NAME': 'Earth\'s Option Cremation and Burial Services',
+                     'ESTABLISHMENT_EMAIL': 'info@earthsoption.com',
+                     'ESTABLISHMENT_PHONE': '778-440-8500', 'ESTABLISHMENT_ADDRESS': 'Unit 5 - 831 Devonshire Rd.',
+                     'ESTABLISHMENT_CITY': 'Victoria', 'ESTABLISHMENT_PROVINCE': 'BC',
+                     'ESTABLISHMENT_POSTAL_CODE': 'V9A 4T5'}
+}
+
+EO_PACKAGES = {
+    "Minimum Cremation - No Viewing": {
+        'A1': 300.00, 'A3': 595.00,
+        'Casket': 'Basic Cremation Container','B1': 175.00, 'Crematorium': 'West Shore',
+        'C2': 725.00, 'C5': 40.00, 'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Minimum Cremation - With Viewing": {
+        'A1': 300.00, 'A3': 595.00, 'A5B': 495.00, 'A6': 295.00,
+        'Casket': 'Basic Cremation Container','B1': 175.00, 'Crematorium': 'West Shore',
+        'C2': 725.00, 'C5': 40.00, 'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Witness Cremation - No Viewing": {
+        'A1': 300.00, 'A3': 595.00,
+        'Casket': 'Basic Cremation Container', 'B1': 175.00, 'Crematorium': 'West Shore',
+        'C2': 725.00, 'C5': 40.00, 'Other_3': 'Watch Start Cremation Addition', 'C10': 275.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Witness Cremation - With Viewing": {
+        'A1': 300.00, 'A3': 595.00, 'A5B': 495.00, 'A6': 295.00,
+        'Casket': 'Basic Cremation Container','B1': 175.00, 'Crematorium': 'West Shore',
+        'C2': 725.00, 'C5': 40.00, 'Other_3': 'Watch Start Cremation Addition', 'C10': 275.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Traditional Service - No Viewing": {
+        'A1': 300.00, 'A2A': 450.00,'A3': 1085.00, 'A5B': 495.00,
+        'Transfer to Crematorium or Airport': 'Transfer to Graveside or Crematorium',
+        'A9B': 350.00, 'A9E': 525.00, 'Casket': 'Mazri', 'B1': 795.00,
+        'Crematorium': 'West Shore', 'C2': 725.00, 'C5': 40.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Traditional Service - With Viewing": {
+        'A1': 300.00, 'A2A': 450.00,'A3': 1085.00, 'A5B': 495.00, 'A6': 295.00,
+        'Transfer to Crematorium or Airport': 'Transfer to Graveside or Crematorium',
+        'A9B': 350.00, 'A9E': 525.00, 'Casket': 'Mazri', 'B1': 795.00,
+        'Crematorium': 'West Shore', 'C2': 725.00, 'C5': 40.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Memorial Service - No Viewing": {
+        'A1': 300.00, 'A2A': 695.00,'A3': 695.00,
+        'Casket': 'Basic Cremation Container', 'B1': 175.00,
+        'Crematorium': 'West Shore', 'C2': 725.00, 'C5': 40.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Memorial Service - With Viewing": {
+        'A1': 300.00, 'A2A': 695.00,'A3': 695.00, 'A5B': 495.00, 'A6': 295.00,
+        'Casket': 'Basic Cremation Container', 'B1': 175.00,
+        'Crematorium': 'West Shore', 'C2': 725.00, 'C5': 40.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Graveside Service - No Viewing": {
+        'A1': 300.00, 'A2A': 450.00,'A3': 785.00, 'A9E': 525.00,
+        'Transfer to Crematorium or Airport': 'Transfer to Graveside or Crematorium',
+        'A9B': 350.00, 'Casket': 'Mazri', 'B1': 795.00, 'C5': 40.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Graveside Service - With Viewing": {
+        'A1': 300.00, 'A2A': 450.00,'A3': 785.00, 'A5B': 495.00, 'A6': 295.00, 'A9E': 525.00,
+        'Transfer to Crematorium or Airport': 'Transfer to Graveside or Crematorium',
+        'A9B': 350.00, 'Casket': 'Mazri', 'B1': 795.00, 'C5': 40.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "International Shipout - No Viewing": {
+        'A1': 300.00, 'A3': 1085.00, 'A5B': 495.00, 'A9E': 525.00,
+        'Transfer to Crematorium or Airport': 'To Graveside/Crematorium, To Vancouver Airport',
+        'A9B': 950.00, 'B1': 1900.00, 'Other_1': 'Casket Shipping Outer Container',
+        'B7': 600.00,'C5': 40.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00,
+        'Other_4': 'Airfare Estimate', 'D8': 2500.00
+    },
+    "International Shipout - With Viewing": {
+        'A1': 300.00, 'A2A': 450.00, 'A3': 1085.00, 'A5B': 495.00, 'A6': 295.00, 'A9E': 525.00,
+        'Transfer to Crematorium or Airport': 'To Graveside/Crematorium, To Vancouver Airport',
+        'A9B': 950.00, 'B1': 1900.00, 'Other_1': 'Casket Shipping Outer Container',
+        'B7': 600.00,'C5': 40.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00,
+        'Other_4': 'Airfare Estimate', 'D8': 2500.00
+    }
+}
+
+EO_CREMATORIUM = {
+    "West Shore": 725.00,
+    "Fraser Valley": 645.00,
+    "Oversized - 300+": 895.00,
+    "Oversized - West Shore (300+)": 990.00,
+    "Oversized - Fraser Valley (300+)": 990.00
+}
+
+EO_OTHER_3 = {
+    "Rush Cremation Fee (72 hours from registration)": 200.00,
+    "Watch Start Cremation Addition": 295.00,
+    "Watch Start Cremation (Fraser Valley) Addition": 895.00
+}
+
+ACB_LOCATION_DATA = {
+    "ACB Mainland": {'ESTABLISHMENT_NAME': 'Affordable Cremation & Burial Mainland',
+                     'ESTABLISHMENT_EMAIL': 'info@affordablecremationandburial.ca',
+                     'ESTABLISHMENT_PHONE': '604-936-9913', 'ESTABLISHMENT_ADDRESS': '2801 Shaughnessy St.',
+                     'ESTABLISHMENT_CITY': 'Port Coquitlam', 'ESTABLISHMENT_PROVINCE': 'BC',
+                     'ESTABLISHMENT_POSTAL_CODE': 'V3C 3H1'},
+    "ACB Vancouver Island": {'ESTABLISHMENT_NAME': 'Affordable Cremation & Burial Vancouver Island',
+                             'ESTABLISHMENT_EMAIL': 'island@affordablecremationandburial.ca',
+                             'ESTABLISHMENT_PHONE': '250-391-1548', 'ESTABLISHMENT_ADDRESS': '4392 West Shore Parkway',
+                             'ESTABLISHMENT_CITY': 'Langford', 'ESTABLISHMENT_PROVINCE': 'BC',
+                             'ESTABLISHMENT_POSTAL_CODE': 'V9B 5Z1'}
+}
+
+ACB_PACKAGES = {
+    "Minimum Cremation - No Viewing (ACB Mainland)": {
+        'A1': 195.00, 'A3': 300.00,
+        'Casket': 'Basic Cremation Container','B1': 70.00, 'Crematorium': 'West Shore',
+        'C2': 645.00, 'C5': 40.00, 'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Witness Cremation - No Viewing (ACB Mainland)": {
+        'A1': 195.00, 'A3': 300.00,
+        'Casket': 'Basic Cremation Container','B1': 70.00, 'Crematorium': 'West Shore',
+        'C2': 645.00, 'C5': 40.00,
+        'Other_3': 'Watch Start Cremation (Fraser Valley) Addition', 'C10': 895.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Minimum Cremation - No Viewing (ACB Island)": {
+        'A1': 275.00, 'A3': 286.00,
+        'Casket': 'Basic Cremation Container','B1': 164.00, 'Crematorium': 'West Shore',
+        'C2': 725.00, 'C5': 40.00, 'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Minimum Cremation - With Viewing (ACB Island)": {
+        'A1': 275.00, 'A2A': 200.00, 'A3': 286.00, 'A5A': 500.00,
+        'Evening Prayers or Visitation': 'Arbutus Room Basic Rental (1 Hr)', 'A6': 200.00,
+        'Casket': 'Basic Cremation Container','B1': 164.00, 'Crematorium': 'West Shore',
+        'C2': 725.00, 'C5': 40.00, 'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Witness Cremation - No Viewing (ACB Island)": {
+        'A1': 275.00, 'A3': 286.00,
+        'Casket': 'Basic Cremation Container','B1': 164.00, 'Crematorium': 'West Shore',
+        'C2': 725.00, 'C5': 40.00, 'Other_3': 'Watch Start Cremation Addition', 'C10': 295.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    },
+    "Witness Cremation - With Viewing (ACB Island)": {
+        'A1': 275.00, 'A2A': 200.00, 'A3': 286.00, 'A5A': 500.00,
+        'Evening Prayers or Visitation': 'Arbutus Room Basic Rental (1 Hr)', 'A6': 200.00,
+        'Casket': 'Basic Cremation Container','B1': 164.00, 'Crematorium': 'West Shore',
+        'C2': 725.00, 'C5': 40.00, 'Other_3': 'Watch Start Cremation Addition', 'C10': 295.00,
+        'Death_Certificates_Quantity': '1', 'D7': 27.00, '3E Journey Home': 595.00
+    }
+}
+
+ACB_CREMATORIUM = {
+    "West Shore": 725.00,
+    "Fraser Valley": 645.00,
+    "Oversized - 300+": 895.00,
+    "Oversized - West Shore (300+)": 990.00,
+    "Oversized - Fraser Valley (300+)": 990.00
+}
+
+ACB_OTHER_3 = {
+    "Rush Cremation Fee (72 hours from registration)": 200.00,
+    "Watch Start Cremation Addition": 295.00,
+    "Watch Start Cremation (Fraser Valley) Addition": 895.00
+}
+
+ROB = BrandProfile(
+    "rob", "Kearney Client Forms",
+    pdf_files={
+        1: TRUSTAGE_APPLICATION,
+        2: "Personal Information Sheet - New.pdf",
+        3: "Instructions Concerning My Arrangements - New.pdf",
+        4: "Pre-Arranged Funeral Service Agreement - New.pdf",
+        5: JOURNEY_HOME
+    },
+    logos=("Kearney Logo.png", "Burquitlam Logo.png"),
+    icon="Kearney Pin.ico",
+    location_key="Kearney Location",
+    location_label="Kearney Location:",
+    location_data=ROB_LOCATION_DATA,
+    packages=ROB_PACKAGES,
+    crematorium=ROB_CREMATORIUM,
+    other_3=ROB_OTHER_3,
+    location_checkboxes={
+        "Kearney Funeral Services (KFS)": "Kearney Vancouver Chapel",
+        "Kearney Burnaby Chapel (KBC)": "Kearney Burnaby Chapel",
+        "Kearney Burquitlam Funeral Home (BFH)": "Kearney Burquitlam Funeral Home",
+        "Kearney Columbia-Bowell Chapel (CBC)": "Kearney ColumbiaBowell Chapel",
+        "Kearney Cloverdale & South Surrey (CLO)": "Kearney Cloverdale South Surrey"
+    },
+    location_checked={2: 'Yes', 3: 'Yes', 4: 'On'},
+    cadence_discount="400.00"
+)
+
+EO = BrandProfile(
+    "eo", "EO Client Forms",
+    pdf_files={
+        1: TRUSTAGE_APPLICATION,
+        2: "Personal Information Sheet - New (EO).pdf",
+        3: "Instructions Concerning My Arrangements - New (EO).pdf",
+        4: "Pre-Arranged Funeral Service Agreement - New (EO).pdf",
+        5: JOURNEY_HOME
+    },
+    logos=("EO Logo.png", "EO Logo.png"),
+    icon="EO Pin.ico",
+    location_key="EO Location",
+    location_label="Establishment:",
+    location_data=EO_LOCATION_DATA,
+    packages=EO_PACKAGES,
+    crematorium=EO_CREMATORIUM,
+    other_3=EO_OTHER_3,
+    viewings=catalogs.with_prices(catalogs.VIEWINGS, {"Arbutus Room Basic Rental (1 Hr)": 200.00}),
+    caskets=catalogs.with_prices(catalogs.CASKETS, {"Basic Cremation Container": 175.00,
+                                                    "Oversize Cremation Container": 395.00}),
+    fixed_location="Earth's Option Cremation and Burial Services"
+)
+
+ACB = BrandProfile(
+    "acb", "ACB Client Forms",
+    pdf_files={
+        1: TRUSTAGE_APPLICATION,
+        2: "Personal Information Sheet - New (ACB).pdf",
+        3: "Instructions Concerning My Arrangements - New (ACB).pdf",
+        4: "Pre-Arranged Funeral Service Agreement - New (ACB).pdf",
+        5: JOURNEY_HOME
+    },
+    logos=("ACB Mainland Logo.png", "ACB VI Logo.png"),
+    icon="ACB Pin.ico",
+    location_key="ACB Location",
+    location_label="ACB Location:",
+    location_data=ACB_LOCATION_DATA,
+    packages=ACB_PACKAGES,
+    crematorium=ACB_CREMATORIUM,
+    other_3=ACB_OTHER_3,
+    viewings=catalogs.with_prices(catalogs.VIEWINGS, {"Arbutus Room Basic Rental (1 Hr)": 200.00}),
+    caskets=catalogs.with_prices(catalogs.CASKETS, {"Basic Cremation Container": 164.00,
+                                                    "Oversize Cremation Container": 395.00}),
+    location_checkboxes={
+        "ACB Mainland": "ACB Mainland",
+        "ACB Vancouver Island": "ACB VI"
+    },
+    location_checked={2: 'On', 3: 'On', 4: 'On'}
+)
+
+PROFILES = {profile.key: profile for profile in (ROB, EO, ACB)}
@@ -0,0 +1,169 @@
+"""Search indexes over the price catalogs for the autocomplete listboxes.
+
+Each catalog is indexed once: its names are lower-cased and every 1-3
+character n-gram points at the entries containing it, so a keystroke looks
+up a few small sets instead of scanning every name. Results are ranked:
+
+    0  the name starts with the text
+    1  a word in the name starts with the text
+    2  the text appears anywhere in the name
+    3  every word typed starts a word of the name, in any order
+
+and keep catalog order within a rank. Typing more characters narrows the
+previous result instead of searching the whole catalog again.
+
+When that finds only a few names, the closest names by trigram similarity
+follow, so typos like "brwnsville" still find "Brownsville Pine". Each
+name's word trigrams are computed with the index. A name sharing enough of
+the typed trigrams must have one of the rarest few, so only their postings
+are scored, and the best few are kept with a heap rather than a full sort.
+"""
+import heapq
+import math
+import re
+import threading
+
+NGRAM = 3
+WORD = re.compile(r'\w+')
+FUZZY_LIMIT = 10  # Suggestions shown when the exact matches don't fill the list
+FUZZY_MIN_SIMILARITY = 0.4  # Share of the typed trigrams a suggestion must have
+
+
+def ngrams(text, n):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def word_trigrams(words):
+    """Trigrams of each word padded with spaces, so word starts and ends count too"""
+    grams = set()
+    for word in words:
+        grams |= ngrams(f"  {word} ", NGRAM)
+    return grams
+
+
+class CatalogIndex:
+    """Ranked substring and word search over the names of one catalog"""
+
+    def __init__(self, items):
+        self.names = list(items)
+        self.lowered = [name.lower() for name in self.names]
+        self.words = [WORD.findall(name) for name in self.lowered]
+        self.grams = {}
+        for i, name in enumerate(self.lowered):
+            for n in range(1, NGRAM + 1):
+                for gram in ngrams(name, n):
+                    self.grams.setdefault(gram, set()).add(i)
+        self.trigrams = [frozenset(word_trigrams(words)) for words in self.words]
+        self.trigram_postings = {}
+        for i, grams in enumerate(self.trigrams):
+            for gram in grams:
+                self.trigram_postings.setdefault(gram, []).append(i)
+        self._last = ("", None)  # Previous query and the entries it could match
+        self._short = {}  # One- and two-character queries match most names, so keep their results
+
+    def _candidates(self, text):
+        """Entries that may contain text, from the n-gram sets"""
+        grams = ngrams(text, NGRAM) if len(text) > NGRAM else {text}
+        candidates = None
+        for gram in sorted(grams, key=lambda g: len(self.grams.get(g, ()))):
+            found = self.grams.get(gram)
+            if not found:
+                return set()
+            candidates = set(found) if candidates is None else candidates & found
+        return candidates
+
+    def _rank(self, i, text, typed_words):
+        name = self.lowered[i]
+        if name.startswith(text):
+            return 0
+        words = self.words[i]
+        if any(word.startswith(text) for word in words):
+            return 1
+        if text in name:
+            return 2
+        if typed_words and all(any(word.startswith(typed) for word in words) for typed in typed_words):
+            return 3
+        return None
+
+    def search(self, text):
+        """Catalog names matching text, best matches first; every name for empty text"""
+        text = text.strip().lower()
+        if not text:
+            return list(self.names)
+
+        if text in self._short:
+            found, matched = self._short[text]
+            self._last = (text, matched)
+            return [self.names[i] for i in found]
+
+        previous, pool = self._last
+        typed_words = WORD.findall(text)
+        if pool is None or not text.startswith(previous):
+            # Substring matches come from the n-grams; word matches need every typed word's n-grams
+            pool = self._candidates(text)
+            if len(typed_words) > 1:
+                pool = pool | set.intersection(*(self._candidates(typed) for typed in typed_words))
+
+        ranked = []
+        for i in pool:
+            rank = self._rank(i, text, typed_words)
+            if rank is not None:
+                ranked.append((rank, i))
+        ranked.sort()
+        self._last = (text, {i for _, i in ranked})
+        found = [i for _, i in ranked]
+        if len(found) < FUZZY_LIMIT:
+            found += self.similar(typed_words, FUZZY_LIMIT - len(found), exclude=self._last[1])
+        if len(text) < NGRAM:
+            self._short[text] = (found, self._last[1])
+        return [self.names[i] for i in found]
+
+    def similar(self, typed_words, limit, exclude=()):
+        """Up to limit entries sharing the most word trigrams with the typed words, best first"""
+        if sum(len(word) for word in typed_words) < NGRAM:
+            return []
+        grams = word_trigrams(typed_words)
+        needed = max(1, math.ceil(len(grams) * FUZZY_MIN_SIMILARITY))
+        rarest = sorted(grams, key=lambda gram: len(self.trigram_postings.get(gram, ())))
+        candidates = set()
+        for gram in rarest[:len(grams) - needed + 1]:
+            candidates.update(self.trigram_postings.get(gram, ()))
+
+        scored = []
+        for i in candidates:
+            if i in exclude:
+                continue
+            count = len(grams & self.trigrams[i])
+            if count >= needed:
+                # Most shared trigrams first, then the name with the fewest others, then catalog order
+                scored.append((-count, len(self.trigrams[i]) - count, i))
+        return [i for _, _, i in heapq.nsmallest(limit, scored)]
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def catalog_index(catalog):
+    """The CatalogIndex of a catalog dict, built the first time it's asked for.
+
+    Catalogs are shared between inputs and brands (Urn and Keepsake both
+    list catalogs.URNS), so each is indexed once.
+    """
+    with _indexes_lock:
+        entry = _indexes.get(id(catalog))
+        if entry is None or entry[0] is not catalog:
+            entry = _indexes[id(catalog)] = (catalog, CatalogIndex(catalog))
+        return entry[1]
+
+
+def listbox_edit(shown, items):
+    """(start, stop, inserted): replace shown[start:stop] with inserted to show items"""
+    start = 0
+    limit = min(len(shown), len(items))
+    while start < limit and shown[start] == items[start]:
+        start += 1
+    end = 0
+    while end < limit - start and shown[-1 - end] == items[-1 - end]:
+        end += 1
+    return start, len(shown) - end, items[start:len(items) - end]
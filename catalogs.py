@@ -0,0 +1,234 @@
+"""Price catalogs shared by every brand.
+
+Brand profiles (brands.py) add their own packages, crematoria and fees and can
+re-price or add catalog entries with with_prices.
+"""
+
+
+def with_prices(catalog, prices):
+    """A copy of catalog with the given entries first, replacing any existing price"""
+    return {**prices, **{item: price for item, price in catalog.items() if item not in prices}}
+
+
+VIEWINGS = {
+    "Evening Prayers (includes Staff)": 695.00,
+    "Viewing at New West": 500.00,
+    "Viewing at Burnaby": 895.00,
+    "Viewing at Vancouver": 895.00,
+    "Viewing after 5PM (per hour)": 150.00,
+    "Afterhours Visitation Staff": 695.00,
+    "St Clare of Assisi Hall Viewing": 500.00,
+    "St Clare of Assisi Hall Service": 1200.00
+}
+
+LIMOUSINES = {
+    "KFS Limousine (4 hour use)": 695.00,
+    "KFS Horse Drawn Carriage": 2500.00
+}
+
+CASKETS = {
+    "Basic Cremation Container": 395.00,
+    "125 Oak Veneer": 2195.00,
+    "Aspen Pine": 1795.00,
+    "Moka Pine": 1795.00,
+    "Brownsville Pine": 1995.00,
+    "Brownsville Pine (oversize)": 3595.00,
+    "Brownsville Cedar": 3595.00,
+    "Brownsville Cedar (without blanket or paddle handles)": 2695.00,
+    "60 Ash": 2695.00,
+    "Windfield PC": 3560.00,
+    "Wheat Maple": 2995.00,
+    "Atlantic Poplar": 2995.00,
+    "Stewart Ash": 3495.00,
+    "Heavenly White Poplar": 3695.00,
+    "Langara - Pawlownia": 3595.00,
+    "Riley - Poplar": 3695.00,
+    "700 Octagon Oak": 4195.00,
+    "725 Octagon Oak": 4195.00,
+    "Branson - Poplar": 3695.00,
+    "Apostle Oak": 4395.00,
+    "Stanley Oak": 4195.00,
+    "Sherwood Oak": 3895.00,
+    "Homeward - Poplar": 4295.00,
+    "Basilica - Poplar": 4895.00,
+    "Lotus - Poplar": 4695.00,
+    "Michelangelo - Maple": 5795.00,
+    "Carnaby Poplar": 3995.00,
+    "Morgan Cherry": 8188.00,
+    "Ambassador Full Couch - Mahogany": 7195.00,
+    "168 Oak Full Couch": 5795.00,
+    "Diplomat - Mahogany": 9888.00,
+    "Executive Full Couch - Mahogany": 9888.00,
+    "Dynasty - Mahogany": 14888.00,
+    "Misty Blue - 18 gauge steel": 3995.00,
+    "Capilano Blue - 18 gauge steel": 3995.00,
+    "Nelson Brown - 18 gauge steel": 3995.00,
+    "Deauville White - 18 gauge steel": 4395.00,
+    "Aurora Copper - 32 oz Brushed Copper": 10495.00,
+    "Natura": 3195.00,
+    "Willow": 2995.00,
+    "Bamboo shroud with use of Ceremonial willow carrier": 755.00,
+    "Seagrass": 3495.00,
+    "Eco Pine w/ rope handles and simple lining": 695.00,
+    "Eco Pine w/ rope handles and simple lining (oversize)": 1095.00,
+    "Mazri": 795.00,
+    "Mazri (Oversized)": 1795.00,
+    "30 Grey": 1075.00,
+    "Genoa": 2195.00,
+    "Navy Tabor": 2095.00,
+    "White Ventura": 2195.00,
+    "Dominion Maple Ceremonial (Rental casket)": 1795.00,
+    "Northgate Oak Ceremonial (Rental casket)": 1355.00,
+    "Burlington Cremation Container": 795.00,
+    "McConnell Cremation Container": 995.00,
+    "BP2 - BC Pine": 1195.00,
+    "BP2 - BC Pine (oversize)": 1395.00,
+    "BPO - BC Pine": 695.00,
+    "BPO - BC Pine (oversize)": 795.00,
+    "Basic Wooden (Oversize Wooden)": 495.00,
+    "Cremation Tray (Minimum requirement)": 395.00
+}
+
+URNS = {
+    "Basic Cardboard Urn": 35.00,
+    "Cherry/Maple/Walnut": 475.00,
+    "LGV original series Natural/Red/Ebony": 895.00,
+    "LGV ecologique series Natural/Red/Ebony": 695.00,
+    "LGV Keepsake Natural/Red/Ebony": 195.00,
+    "Sheesham": 250.00,
+    "Sheesham Small": 85.00,
+    "Providence Mahogany/Oak": 400.00,
+    "Winchester Cherry/Oak": 475.00,
+    "Hamilton Cherry/Natural": 175.00,
+    "Hamilton Keepsake Cherry/Natural": 75.00,
+    "Photo Urn Cherry/Natural/Black": 250.00,
+    "Photo Urn Keepsake Cherry/Natural/Black": 95.00,
+    "Metro Mantel Urn": 495.00,
+    "Cathedral Ivory/Forest Green": 445.00,
+    "Round Marble": 650.00,
+    "Rectangular Marble": 595.00,
+    "Modern Companion Urn Collection": 695.00,
+    "Together Forever Companion (EA1007-E)": 1095.00,
+    "Divine Square Companion": 1095.00,
+    "Divine Heart Companion": 1195.00,
+    "Aria Wheat/Bird/Tree/Butterfly/Rose": 485.00,
+    "Aria Heart Wheat/Bird/Tree/Butterfly/Rose": 115.00,
+    "Aria Keepsake Wheat/Bird/Tree/Butterfly/Rose": 65.00,
+    "Classic Going Home": 395.00,
+    "Classic Going Home Heart": 115.00,
+    "Classic Going Home Keepsake": 65.00,
+    "Mother of Pearl Aristocrat": 495.00,
+    "Mother of Pearl Keepsake": 65.00,
+    "Aristocrat Going Home": 445.00,
+    "Aristocrat Going Home Heart": 115.00,
+    "Quad Gold or Copper (Incl. 1 emblem)": 595.00,
+    "Aristocrat Going Home Keepsake": 65.00,
+    "Aristocrat Black & Gold": 495.00,
+    "Aristocrat Black & Gold Keepsake": 65.00,
+    "Classic Bronze/Pewter": 395.00,
+    "Classic Heart Bronze/Pewter": 115.00,
+    "Classic Keepsake Bronze/Pewter": 65.00,
+    "Trinity Midnight Blue/Pearl White": 495.00,
+    "Trinity Heart Midnight Blue/Pearl White": 115.00,
+    "Trinity Keepsake Midnight Blue/Pearl White": 75.00,
+    "Grecian Crimson Red/Rustic Bronze/Pewter": 495.00,
+    "Grecian Keepsake Red/Bronze/Pewter": 85.00,
+    "Monterey Purple/Blue/Ruby": 445.00,
+    "Monterey Keepsake Purple/Blue/Ruby": 85.00,
+    "Anoka Shimmering Grey/Blue": 515.00,
+    "Anoka Keepsake Shimmering Grey/Blue": 85.00,
+    "Celeste Charcoal/Pearl/Indigo": 445.00,
+    "Celeste Heart Charcoal/Pearl/Indigo": 115.00,
+    "Celeste Keepsake Charcoal/Pearl/Indigo": 75.00,
+    "Blessing": 595.00,
+    "Blessing Keepsake Pearl": 145.00,
+    "Monarch Jali": 595.00,
+    "Monarch Jali Keepsake": 145.00,
+    "LoveBird Bronze/Midnight": 635.00,
+    "LoveBird Keepsake Bronze/Midnight": 165.00,
+    "LoveHeart Pearl/Red": 495.00,
+    "LoveHeart Medium Blue/Pink": 295.00,
+    "CuddleBear Medium Blue/Pink": 375.00,
+    "Wings of Hope Pink/Blue/Pearl": 495.00,
+    "Wing of Hope Medium Pink/Blue/Pearl": 295.00,
+    "Saturn Bronze": 595.00,
+    "Art Deco Classic": 495.00,
+    "Art Deco Classic Keepsake": 165.00,
+    "Adore Bronze/Midnight": 635.00,
+    "Adore Keepsake Bronze/Midnight": 165.00,
+    "Bright Silver Keepsake Heart": 165.00,
+    "Bright Silver Keepsake Star": 165.00,
+    "Brushed Gold Keepsake Star": 165.00,
+    "Pride Rainbow": 395.00,
+    "Pride Rainbow Heart Keepsake": 115.00,
+    "Pride Rainbow Tealight Urn": 175.00,
+    "Tealight Urn Bronze/Midnight": 175.00,
+    "Pearl Tealight Urn Lavender/Pink/Blue": 175.00,
+    "Princess Cat Bronze/Midnight/Pearl": 195.00,
+    "Bright Silver Keepsake Paw": 95.00,
+    "Tall Pet Tealight Urn Bronze/Midnight": 295.00,
+    "Pet Tealight Urn Bronze/Midnight": 175.00,
+    "Etienne Autumn/Butterfly/Rose": 545.00,
+    "Etienne Keepsake Autumn/Butterfly/Rose": 135.00,
+    "Essence Opal": 495.00,
+    "Essence Cloisonné Heart Opal": 135.00,
+    "Essence Keepsake Opal": 135.00,
+    "Elite Pink/Blue": 545.00,
+    "Elite Cloisonné Heart Pink/Blue": 135.00,
+    "Elite Keepsake Pink/Blue": 135.00,
+    "Scattering Tubes (Variety)": 185.00,
+    "Scattering Tube Keepsake (Variety)": 65.00,
+    "Journey Earth Aqua/Navy/Natural/Green": 295.00,
+    "Journey Keepsake Aqua/Navy/Natural/Green": 95.00,
+    "Bios Urn": 275.00,
+    "Himalayan Rock Salt": 545.00,
+    "Himalayan Salt Keepsake": 295.00,
+    "Embrace Autumn Leaves": 295.00,
+    "Turtle": 495.00,
+    "Turtle Small Keepsake": 195.00,
+    "Oceane Natural Urn": 545.00,
+    "Oceane Natural Urn Keepsake": 195.00,
+    "Bamboo Simplicity": 295.00,
+    "Heart Urn (EA1002-E)": 545.00,
+    "Heart Photo (EA4002-E)": 145.00,
+    "Heart Keepsake (EA3002-E)": 145.00,
+    "Heart Candle (EA2002-E)": 145.00,
+    "Sunrays Candle (EA3005-E)": 145.00,
+    "Seashells Candle (EA3006-E)": 145.00,
+    "InFlight (EA1001)": 595.00,
+    "InFlight Keepsake (EA3001)": 145.00,
+    "Slate": 695.00,
+    "Slate keepsake": 295.00,
+    "Resin Urn": 445.00,
+    "Arielle Heart Pink/Blue": 175.00,
+    "Teddybear Pink/Blue": 145.00,
+    "Heart Stands (each)": 20.00,
+    "Temporary plastic urn": 40.00,
+    "Together Forever (EA5007) holds no remains": 125.00,
+    "Heart Plaque (EA5002-E)holds no remains": 145.00,
+    "Engraving (Name and Dates)": 155.00,
+    "Engraving (Per Line) Marble rectangle": 185.00,
+    "Sticker Back Tags (name and dates)": 65.00,
+    "Pendants (incl. satin string name and dates)": 95.00
+}
+
+RECEPTION_FACILITIES = {
+    "KFS New West Reception Room Rental (Disp Dishes, Coffee, Tea)": 595.00,
+    "KFS New West Reception Room Rental (Glassware, Coffee, Tea)": 395.00,
+    "KFS Vancouver Reception Room Rental (Facility Only)": 795.00
+}
+
+WEEKEND = {
+    "Sundays and Holiday Service Fee": 895.00,
+    "Saturday Service Fee": 895.00
+}
+
+DISCOUNTS = {
+    "Cadence": 400.00,
+    "Casket": 0.00,
+    "Urn": 0.00,
+    "Keepsake": 0.00,
+    "Traditional Mourning Items": 0.00,
+    "Memorial Stationary": 0.00,
+    "Funeral Register": 0.00
+}
@@ -0,0 +1,481 @@
+"""Form values -> PDF field dictionaries, shared by every brand.
+
+Each PDF has a declarative mapping: rows of (target field, source, transform).
+A source is a form key, a derived value ('@full name', '@date', ...) computed
+once per fill, a Const, or a function of the fill context. The mappings are
+compiled once per brand into a list of getters, so a fill only evaluates them,
+and can be checked against the templates' real AcroForm fields up front.
+The five PDFs are the same for every brand apart from the establishment details
+and the location checkboxes, which come from the brand's profile.
+"""
+import logging
+import os
+import threading
+from datetime import date
+
+import pricing
+from money import Money
+
+FORMS = {
+    1: "Protector Plus TruStage Application form",
+    2: "Personal Information Sheet",
+    3: "Instructions Concerning My Arrangements",
+    4: "Pre-Arranged Funeral Service Agreement",
+    5: "Journey Home Enrollment Form"
+}
+
+
+def pdf_paths(base_path, profile):
+    """Template path for each of the five PDFs"""
+    return {i: os.path.join(base_path, "Forms", filename) for i, filename in profile.pdf_files.items()}
+
+
+def ordinal(n):
+    if 10 <= n % 100 <= 20:
+        suffix = 'th'
+    else:
+        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f"{n}{suffix}"
+
+
+def convert_to_float(value):
+    """Convert formatted dollar string to float"""
+    try:
+        if not value:
+            return ''
+        # Parse to cents, dropping currency symbol, commas and spaces
+        return Money.parse(value).format(grouping=False)
+    except (ValueError, AttributeError):
+        return ''
+
+
+def output_filenames(values):
+    """Output file names for each of the filled PDFs"""
+    return {i: f"{values['-FIRST-']} {values['-LAST-']} - {form}.pdf" for i, form in FORMS.items()}
+
+
+def prepare_data_dictionaries(values, profile):
+    """Build the per-PDF data dictionaries from the current form values"""
+    plans = compile_mappings(profile)
+    context = fill_context(values, profile)
+    return {pdf: {target: getter(context) for target, getter in plan} for pdf, plan in plans.items()}
+
+
+def format_birthdate_short(birthdate_str):
+    from dateutil import parser
+    try:
+        # Parse the input date (e.g., "April 8, 1995")
+        birth_date = parser.parse(birthdate_str)
+        # Format to dd/mm/yy
+        return birth_date.strftime("%d/%m/%y")
+    except (ValueError, TypeError):
+        return birthdate_str
+
+
+def discount_descriptions(values):
+    """Get all discount descriptions combined with ' + '"""
+    try:
+        descriptions = []
+        # Hidden rows are cleared when removed, so every filled row is a visible one
+        for key in sorted(k for k in values if isinstance(k, tuple) and k[0] == '-DISCOUNT-DESC-'):
+            desc = (values[key] or '').strip()
+            if desc:  # Only add non-empty descriptions
+                descriptions.append(desc)
+
+        # Combine descriptions with ' + ' if there are multiple
+        combined_description = " + ".join(descriptions) if descriptions else ""
+        logging.debug(f"Combined discount descriptions: {combined_description}")
+        return combined_description
+
+    except Exception as e:
+        logging.error(f"Error getting discount descriptions: {str(e)}")
+        return ""
+
+
+def cadence_discount_amount(values):
+    """Find the Cadence discount amount from the dynamic discount rows"""
+    try:
+        # Search through all filled discount rows
+        for key in sorted(k for k in values if isinstance(k, tuple) and k[0] == '-DISCOUNT-DESC-'):
+            desc = (values[key] or '').strip().lower()
+            if desc == 'cadence':
+                amount = values.get(('-DISCOUNT-AMT-', key[1])) or ''
+                # Clean up the amount string
+                amount = amount.replace('$', '').replace(',', '')
+                return amount if amount else ''
+        return ''
+
+    except Exception as e:
+        logging.error(f"Error finding Cadence discount: {str(e)}")
+        return ''
+
+
+class Const:
+    """A mapping source that is always the same value"""
+
+    def __init__(self, value):
+        self.value = value
+
+
+ON = Const('On')
+BLANK = Const('')
+
+
+def full_name(first, middle, last):
+    return (f"{first} {middle} {last}" if middle else f"{first} {last}").strip()
+
+
+def joined(*values):
+    return ', '.join(filter(None, values))
+
+
+def fill_context(values, profile):
+    """The form values plus every derived value the mappings read, computed once per fill"""
+    data = {k: v for k, v in values.items() if v}
+    context = dict(data)
+    get = data.get
+    today = date.today()
+
+    establishment = profile.location_data.get(get(profile.location_key, ""), {})
+    for key, value in establishment.items():
+        context[f'@{key}'] = value
+    context['@location field'] = profile.location_checkboxes.get(get(profile.location_key, ""))
+
+    context['@age'] = str(pricing.calculate_age(values["-BIRTHDATE-"]) if values.get("-BIRTHDATE-") else "")
+    context['@birthdate ddmmyy'] = format_birthdate_short(get('-BIRTHDATE-', ''))
+    context['@date'] = today.strftime("%B %d, %Y")
+    context['@date ddmmyy'] = today.strftime("%d/%m/%y")
+    context['@day'] = ordinal(today.day)
+    context['@month'] = today.strftime("%B")
+    context['@year'] = str(today.year)
+
+    context['@full name'] = full_name(get('-FIRST-', ''), get('-MIDDLE-', ''), get('-LAST-', ''))
+    context['@beneficiary name'] = f"{get('-FIRST-', '')} {get('-MIDDLE-', '')} {get('-LAST-', '')}"
+    context['@representative name'] = full_name(get('Representative First Name', ''),
+                                                get('Representative Middle Name', ''),
+                                                get('Representative Last Name', ''))
+    context['@address'] = joined(get('-ADDRESS-', ''), get('-CITY-', ''), get('-PROVINCE-', ''), get('-POSTAL-', ''))
+    context['@establishment address'] = joined(*(establishment.get(key, '') for key in (
+        'ESTABLISHMENT_ADDRESS', 'ESTABLISHMENT_CITY', 'ESTABLISHMENT_PROVINCE', 'ESTABLISHMENT_POSTAL_CODE')))
+    context['@signed at'] = joined(get('Signed City', ''), get('Signed Province', ''))
+    context['@discount description'] = discount_descriptions(data)
+    context['@cadence discount'] = cadence_discount_amount(data)
+
+    selected_term = get('Payment Term', '')
+    if selected_term and selected_term not in PAYMENT_TERM_FIELDS:
+        logging.warning(f"Selected term '{selected_term}' has no checkbox on the application form")
+    return context
+
+
+# Transforms
+
+def initial(value):
+    return value[:1]
+
+
+class Checked:
+    """Transform ticking a checkbox with on ('On' by default) when the source is one of options"""
+
+    def __init__(self, *options, on='On', ignore_case=False):
+        self.options = options
+        self.on = on
+        self.ignore_case = ignore_case
+
+    def __call__(self, value):
+        if self.ignore_case:
+            value = str(value).lower().strip()
+        return self.on if value in self.options else ''
+
+
+def when_set(template):
+    """Format the source into template, or blank when it is empty"""
+    return lambda value: template.format(value) if value else ''
+
+
+def bracketed_dollars(value):
+    return f"({convert_to_float(value)})" if value else ''
+
+
+# Sources computed from several fields
+
+def beneficiary(own_key, applicant_key):
+    """Beneficiary address field, copied from the applicant when Same Address is ticked"""
+    return lambda context: context.get(applicant_key if context.get('-SAME_ADDRESS-') else own_key, '')
+
+
+def item_with_price(*items):
+    """'Item - $price' for the first (item, price key) pair that is filled in"""
+    def source(context):
+        for item, price in items:
+            if context.get(item):
+                return f"{context[item]} - ${context[price]}" if context.get(price) else context[item]
+        return ''
+    return source
+
+
+def casket_with_discount(context):
+    casket = context.get('Casket', '')
+    if casket and context.get('Discount_Casket'):
+        return f"{casket} (Discount - {context['Discount_Casket']})"
+    return casket
+
+
+def other_2_with_cadence(context):
+    other_2 = context.get('Other_2', '')
+    if other_2 and context['@cadence discount']:
+        return f"{other_2} (Discount - ${context['@cadence discount']})"
+    return other_2
+
+
+PAYMENT_TERM_FIELDS = ['1-year'] + pricing.PAYMENT_TERMS
+
+# "Protector Plus TruStage Application form - New"
+TRUSTAGE_APPLICATION_MAPPING = [
+    ('I understand that this is an enrollment into a group policy in order to provide funding for funeral expenses', ON),
+    ('Establishment Name', '@ESTABLISHMENT_NAME'),
+    ('Phone', '@ESTABLISHMENT_PHONE'),
+    ('Email', '@ESTABLISHMENT_EMAIL'),
+    ('Address', '@ESTABLISHMENT_ADDRESS'),
+    ('City', '@ESTABLISHMENT_CITY'),
+    ('Province', '@ESTABLISHMENT_PROVINCE'),
+    ('Postal Code', '@ESTABLISHMENT_POSTAL_CODE'),
+    ('First Name', '-FIRST-'),
+    ('MI', '-MIDDLE-', initial),
+    ('Last Name', '-LAST-'),
+    ('Birthdate ddmmyy', '@birthdate ddmmyy'),
+    ('Age', '@age'),
+    ('Gender', '-GENDER-'),
+    ('SIN', 'SIN'),
+    ('Occupation', '-OCCUPATION-'),
+    ('Phone_2', '-PHONE-'),
+    ('Email_2', '-EMAIL-'),
+    ('Mailing Address', '-ADDRESS-'),
+    ('City_2', '-CITY-'),
+    ('Province_2', '-PROVINCE-'),
+    ('Postal Code_2', '-POSTAL-'),
+    ('Name', 'Name'),
+    ('Relationship', 'Relationship'),
+    ('Phone_3', 'Phone_3'),
+    ('Email_3', 'Email_3'),
+    ('Address \\(if different\\)', beneficiary('Address \\(if different\\)', '-ADDRESS-')),
+    ('City_4', beneficiary('City_4', '-CITY-')),
+    ('Province_4', beneficiary('Province_4', '-PROVINCE-')),
+    ('Postal Code_4', beneficiary('Postal Code_4', '-POSTAL-')),
+    ('3A Goods and Services', '3A Goods and Services'),
+    ('3B MonumentMarker', '3B MonumentMarker'),
+    ('3C Other Expenses', '3C Other Expenses'),
+    ('3D Final Documents Service', '3D Final Documents Service'),
+    ('3E Journey Home', '3E Journey Home'),
+    ('Total 3', 'Total 3'),
+] + [(term, 'Payment Term', Checked(term)) for term in PAYMENT_TERM_FIELDS] + [
+    ('4A Single Pay', '4A Single Pay'),
+    ('4B Time Pay', '4B Time Pay'),
+    ('4C Single Pay Journey Home', '4C Single Pay Journey Home'),
+    ('4D LPR', '4D LPR'),
+    ('Total 4 \\(ABCD\\)', 'Total 4 \\(ABCD\\)'),
+    ('Monthly', ON),
+    ('Location Where Signed', '@signed at'),
+    ('Date ddmmyy', '@date ddmmyy'),
+    ('Representative Name', '@representative name'),
+    ('ID', 'Representative ID'),
+    ('Phone_5', 'Representative Phone'),
+    ('Email_5', 'Representative Email'),
+    ('Date ddmmyy_3', '@date ddmmyy'),
+    ('Payment \\(PAC\\)', ON),
+    ('I hereby assign as its interest may lie the death benefit of the certificate applied for and to be issued to the funeral Establishment indicated above to provide funeral goods and', ON),
+    ('I request that no new product be offered to me by TruStage Life of Canada or their affiliates or partners', ON),
+    ('I also hereby assign the death benefit of the certificate to the funeral Establishment to provide certain cemetery goods and services and elect my certificate to be an EFA', ON),
+    ('Protector Plus not available on FEGA IP', ON)
+]
+
+# "Personal Information Sheet - New"
+PERSONAL_INFO_SHEET_MAPPING = [
+    ('Date', '@date'),
+    ('Last name', '-LAST-'),
+    ('First name', '-FIRST-'),
+    ('Middle name', '-MIDDLE-'),
+    ('Address_1', '@address'),
+    ('Phone', '-PHONE-'),
+    ('Email', '-EMAIL-'),
+    ('Date of Birth', '-BIRTHDATE-'),
+    ('Occupation', '-OCCUPATION-'),
+    ('SIN', 'SIN'),
+    ('Death Certificate #', 'Death_Certificates_Quantity')
+]
+
+# "Instructions Concerning My Arrangements - New"
+INSTRUCTIONS_MAPPING = [
+    ('Date', '@date'),
+    ('Name', '@full name'),
+    ('Phone', '-PHONE-'),
+    ('Email', '-EMAIL-'),
+    ('Type of Service', 'Type of Service'),
+    ('Service to be Held at', '@ESTABLISHMENT_NAME'),
+    ('Address', '@establishment address'),
+    ('Death Certificates', 'Death_Certificates_Quantity'),
+    ('Casket', item_with_price(('Casket', 'B1'))),
+    ('Urn', item_with_price(('Keepsake', 'B3'), ('Urn', 'B2')))
+]
+
+# "Pre-Arranged Funeral Service Agreement - New": item descriptions and their dollar amounts
+PRE_ARRANGED_ITEMS = [
+    (None, 'A1'), (None, 'A2A'), ('Pallbearers', 'A2B'), ('Alternate Day Interment 1', 'A2C'),
+    ('Alternate Day Interment 2', 'A2D'), (None, 'A3'), (None, 'A4A'), (None, 'A4B'), (None, 'A4C'),
+    (None, 'A5A'), (None, 'A5B'), ('Pacemaker Removal', 'A5C'), ('Autopsy Care', 'A5D'),
+    ('Evening Prayers or Visitation', 'A6'), ('Weekend or Statutory Holiday', 'A7'),
+    ('Reception Facilities', 'A8'), ('Delivery of Cremated Remains', 'A9A'),
+    ('Transfer to Crematorium or Airport', 'A9B'), ('Lead Vehicle', 'A9C'), ('Service Vehicle', 'A9D'),
+    ('Funeral Coach', 'A9E'), ('Limousine', 'A9F'), ('Additional Limousines', 'A9G'), ('Flower Van', 'A9H'),
+    (None, 'Total A'),
+    (None, 'B1'), ('Urn', 'B2'), ('Keepsake', 'B3'), ('Traditional Mourning Items', 'B4'), (None, 'B5'),
+    (None, 'B6'), ('Other_1', 'B7'), (None, 'Total B'),
+    ('Cemetery', 'C1'), ('Crematorium', 'C2'), ('Obituary Notices', 'C3'), ('Flowers', 'C4'),
+    ('CPBC Administration Fee', 'C5'), ('Hostess', 'C6'), ('Markers', 'C7'), ('Catering', 'C8'),
+    (None, 'C9'), ('Other_3', 'C10'), (None, 'Total C'),
+    ('Clergy Honorarium', 'D1'), ('Church Honorarium', 'D2'), ('Altar Servers', 'D3'), ('Organist', 'D4'),
+    ('Soloist', 'D5'), ('Harpist', 'D6'), (None, 'D7'), ('Other_4', 'D8'), (None, 'Total D'),
+    (None, 'Total \\(ABC\\)'), (None, 'GST'), (None, 'PST'), (None, 'Total D_2'), (None, 'Grand Total')
+]
+
+PRE_ARRANGED_MAPPING = [
+    ('Purchaser', '@full name'),
+    ('PURCHASERS NAME', '@full name'),
+    ('Phone Number', '-PHONE-'),
+    ('Address', '@address'),
+    ('Type of Service', 'Type of Service'),
+    ('FUNERAL HOME REPRESENTATIVE NAME', '@representative name'),
+    ('BENEFICIARY', '@beneficiary name'),
+    ('DATE OF BIRTH', '-BIRTHDATE-'),
+    ('ADDRESS CITY PROVINCE POSTAL CODE', '@address'),
+    ('TELEPHONE NUMBER', '-PHONE-'),
+    ('Day', '@day'),
+    ('Month', '@month'),
+    ('Year', '@year'),
+    ('SIN', 'SIN')
+] + [(description, description) for description, _ in PRE_ARRANGED_ITEMS if description] + [
+    (amount, amount, convert_to_float) for _, amount in PRE_ARRANGED_ITEMS
+] + [
+    ('Casket', casket_with_discount),
+    ('Memorial Stationary', 'Cards_Qty', when_set("Cards ({} x $2.95)")),
+    ('Funeral Register', 'Guest_Book_Qty', when_set("Guest Book ({} x $75.00)")),
+    ('Other_2', other_2_with_cadence),
+    ('Death Certificates', 'Death_Certificates_Quantity', when_set("{} x $27.00")),
+    ('Discount_description', '@discount description'),
+    ('Discount', 'Discount', bracketed_dollars),
+    ('City Province', '@signed at')
+]
+
+# "Journey Home Enrollment Form - New"
+JOURNEY_HOME_MAPPING = [
+    ('Purchase Date ddmmyy', '@date ddmmyy'),
+    ('First Name', '-FIRST-'),
+    ('MI', '-MIDDLE-', initial),
+    ('Last Name', '-LAST-'),
+    ('Date of Birth', '@birthdate ddmmyy'),
+    ('Address', '-ADDRESS-'),
+    ('City', '-CITY-'),
+    ('Province', '-PROVINCE-'),
+    ('Postal Code', '-POSTAL-'),
+    ('Phone Number', '-PHONE-'),
+    ('Email', '-EMAIL-'),
+    ('Rep First Name', 'Representative First Name'),
+    ('Rep MI', 'Representative Middle Name', initial),
+    ('Rep Last Name', 'Representative Last Name'),
+    ('Representative ID', 'Representative ID'),
+    ('Rep Phone Number', 'Representative Phone'),
+    ('Funeral Home Name if known', '@ESTABLISHMENT_NAME'),
+    ('Amount Due', '3E Journey Home'),
+    ('Male', '-GENDER-', Checked('m', 'male', ignore_case=True)),
+    ('Female', '-GENDER-', Checked('f', 'female', ignore_case=True))
+]
+
+MAPPINGS = {
+    1: TRUSTAGE_APPLICATION_MAPPING,
+    2: PERSONAL_INFO_SHEET_MAPPING,
+    3: INSTRUCTIONS_MAPPING,
+    4: PRE_ARRANGED_MAPPING,
+    5: JOURNEY_HOME_MAPPING
+}
+
+
+# The templates store these field names with each backslash escaped again
+TEMPLATE_FIELD_NAMES = {
+    'Address \\(if different\\)': r'Address \\\(if different\\\)',
+    'Total 4 \\(ABCD\\)': r'Total 4 \\\(ABCD\\\)',
+    'Payment \\(PAC\\)': r'Payment \\\(PAC\\\)',
+    'Total \\(ABC\\)': r'Total \\\(ABC\\\)'
+}
+
+
+def location_mapping(profile, pdf):
+    """Rows for the brand's location checkboxes on one PDF"""
+    if pdf not in profile.location_checked:
+        return []
+    return [(field, '@location field', Checked(field, on=profile.location_checked[pdf]))
+            for field in profile.location_checkboxes.values()]
+
+
+def mapping_rows(profile, pdf):
+    """One PDF's mapping rows for the brand, with targets named as in the template"""
+    return [(TEMPLATE_FIELD_NAMES.get(row[0], row[0]),) + tuple(row[1:])
+            for row in MAPPINGS[pdf] + location_mapping(profile, pdf)]
+
+
+def is_checkbox(row):
+    """Whether a mapping row ticks a checkbox rather than filling in text"""
+    source = row[1]
+    transform = row[2] if len(row) > 2 else None
+    return (isinstance(source, Const) and source.value == 'On') or isinstance(transform, Checked)
+
+
+def compile_rule(source, transform=None):
+    """Turn one mapping row's source and transform into a getter of the fill context"""
+    if isinstance(source, Const):
+        value = source.value
+        return lambda context: value
+    if callable(source):
+        get = source
+    else:
+        get = lambda context, key=source: context.get(key, '')
+    if transform is None:
+        return get
+    return lambda context: transform(get(context))
+
+
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+
+def compile_mappings(profile):
+    """The brand's mappings as {pdf: [(target field, getter), ...]}, compiled once per profile"""
+    with _compiled_lock:
+        plans = _compiled.get(profile.key)
+        if plans is None:
+            plans = {pdf: [(row[0], compile_rule(*row[1:])) for row in mapping_rows(profile, pdf)]
+                     for pdf in MAPPINGS}
+            _compiled[profile.key] = plans
+        return plans
+
+
+def validate_mappings(profile, schemas):
+    """Problems with the brand's mappings against the templates' field schemas.
+
+    schemas is {pdf: {field name: {"type", "on"}}} as form_schema.load_schemas
+    returns it. Returns {pdf: [problem, ...]} for the PDFs that have any.
+    """
+    problems = {}
+    for pdf in MAPPINGS:
+        fields = schemas[pdf]
+        found = []
+        for row in mapping_rows(profile, pdf):
+            target = row[0]
+            field = fields.get(target)
+            if field is None:
+                found.append(f"no field named '{target}'")
+            elif is_checkbox(row) != (field["type"] == "Btn"):
+                expected = "a checkbox" if is_checkbox(row) else "a text field"
+                found.append(f"'{target}' is mapped as {expected} but is a {field['type']} field")
+        if found:
+            problems[pdf] = found
+            logging.error(f"Field mapping problems in {FORMS[pdf]}: {'; '.join(found)}")
+    return problems
@@ -0,0 +1,68 @@
+"""AcroForm field schemas of the PDF templates, cached in a small JSON index.
+
+Each template's field names, types and checkbox on-values are read once and
+stored with the file's SHA-256 in field_schema.json next to Forms/. A template
+is only parsed again when its hash changes, so checking the field mappings at
+startup doesn't cost a parse of every PDF.
+"""
+import hashlib
+import json
+import logging
+import os
+
+SCHEMA_FILE = "field_schema.json"
+
+
+def file_hash(path):
+    """SHA-256 of the file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_index(index_path):
+    """The saved index, or an empty one when it is missing or unreadable"""
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+        return index if isinstance(index, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable field schema index {index_path}: {str(e)}")
+        return {}
+
+
+def write_index(index_path, index):
+    try:
+        with open(index_path, 'w', encoding="utf-8") as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+    except OSError as e:
+        # e.g. a read-only install; the schemas are simply rebuilt next time
+        logging.warning(f"Could not save the field schema index {index_path}: {str(e)}")
+
+
+def load_schemas(base_path, pdf_paths):
+    """{pdf number: {field name: {"type", "on"}}} for the templates, parsing only changed ones"""
+    index_path = os.path.join(base_path, SCHEMA_FILE)
+    index = read_index(index_path)
+    changed = False
+
+    schemas = {}
+    for pdf, path in pdf_paths.items():
+        name = os.path.basename(path)
+        digest = file_hash(path)
+        entry = index.get(name)
+        if not entry or entry.get("sha256") != digest:
+            import pdf_templates  # pdfrw is only loaded when a template has changed
+            logging.info(f"Reading the field schema of {name}")
+            entry = {"sha256": digest, "fields": pdf_templates.template_cache.get(path).schema}
+            index[name] = entry
+            changed = True
+        schemas[pdf] = entry["fields"]
+
+    if changed:
+        write_index(index_path, index)
+    return schemas
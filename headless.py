@@ -0,0 +1,326 @@
+"""Fill the client PDF forms without building the PySimpleGUI window.
+
+Each input record is a plain dict of the form keys (-FIRST-, A1, Payment Term, ...).
+Discount rows can be given as ('-DISCOUNT-DESC-', i) / ('-DISCOUNT-AMT-', i) keys
+from Python, or as a "Discounts" list of [description, amount] pairs in JSON.
+
+A batch of clients (.csv with the form keys as column headers, .jsonl or .json)
+is streamed through a process pool, optionally on top of one of the brand's
+packages. Each client's PDF set goes into its own folder (or, with --zip or
+--merged, a single <client>.zip or <client>.pdf), and a per-row
+batch_summary.csv is written alongside them. --flatten bakes the values into
+the page content of every form, or with --flatten=1,3 of just those form numbers.
+
+    python -m headless --brand rob --package "Minimum Cremation - No Viewing" clients.csv --output-dir "Filled Forms"
+"""
+import argparse
+import csv
+import io
+import json
+import locale
+import logging
+import os
+import re
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import brands
+import form_mapping
+import form_schema
+import pdf_output
+import pdf_templates
+import pricing
+from money import Money
+
+# Forms/ sits next to the modules, or in the bundle when frozen
+BASE_PATH = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+
+DOLLAR_FIELDS = frozenset(pricing.LINE_ITEMS + pricing.SECTION_3_FIELDS + pricing.SECTION_4_FIELDS)
+
+
+def normalize_values(record):
+    """Turn a JSON record into the values dictionary the form would produce"""
+    values = {k: v for k, v in record.items() if k != "Discounts"}
+    for i, (description, amount) in enumerate(record.get("Discounts", [])):
+        values[('-DISCOUNT-DESC-', i)] = description
+        values[('-DISCOUNT-AMT-', i)] = amount
+
+    # Dollar fields are strings like "1,234.00" in the form
+    for key, value in list(values.items()):
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and key not in (
+                "-AGE-", "Cards_Qty", "Guest_Book_Qty", "Death_Certificates_Quantity"):
+            values[key] = pricing.format_dollars(value)
+        elif value is not None and not isinstance(value, (str, bool)):
+            values[key] = str(value)
+
+    # The form prices a field it can't read as 0; a file or request should say so instead
+    for key, value in values.items():
+        if key in DOLLAR_FIELDS or (isinstance(key, tuple) and key[0] == '-DISCOUNT-AMT-'):
+            try:
+                Money.parse(value)
+            except ValueError:
+                raise ValueError(f"{key if isinstance(key, str) else 'Discount'}: '{value}' is not a dollar amount")
+    return values
+
+
+def apply_package(values, profile, package_name):
+    """The package's fields and Type of Service, overridden by anything the record sets itself"""
+    if package_name not in profile.packages:
+        raise ValueError(f"Unknown package '{package_name}' for {profile.title}")
+    values = dict(profile.packages[package_name], **{"Type of Service": package_name}) | {
+        k: v for k, v in values.items() if v not in (None, "")}
+
+    # Brands that sell Cadence add its discount with every package
+    if profile.cadence_discount:
+        rows = [k[1] for k in values if isinstance(k, tuple) and k[0] == '-DISCOUNT-DESC-']
+        if not any(values[('-DISCOUNT-DESC-', i)] == "Cadence" for i in rows):
+            i = max(rows, default=-1) + 1
+            values[('-DISCOUNT-DESC-', i)] = "Cadence"
+            values[('-DISCOUNT-AMT-', i)] = profile.cadence_discount
+    return values
+
+
+def client_folder(values, n):
+    """Folder name for a client's PDF set: their name without characters Windows rejects"""
+    name = f"{values.get('-FIRST-', '')} {values.get('-LAST-', '')}"
+    name = re.sub(r'[<>:"/\\|?*]', '', name).strip()
+    return name or f"Row {n}"
+
+
+class HeadlessAutofiller:
+    """Runs the totals/tax/payment logic and writes the PDFs for one brand"""
+
+    def __init__(self, brand="rob", output_dir=None, flatten=False):
+        if brand not in brands.PROFILES:
+            raise ValueError(f"Unknown brand '{brand}', expected one of {', '.join(brands.PROFILES)}")
+        locale.setlocale(locale.LC_ALL, '')  # Match the grouping the window uses
+
+        self.brand = brand
+        self.profile = brands.PROFILES[brand]
+        self.pdf_paths = form_mapping.pdf_paths(BASE_PATH, self.profile)
+        self.output_dir = Path(output_dir) if output_dir else Path(os.getcwd()) / "Filled Forms"
+        self.flatten = self.flatten_templates(flatten)
+
+        missing = [pdf for pdf in self.pdf_paths.values() if not os.path.exists(pdf)]
+        if missing:
+            raise FileNotFoundError(f"PDF templates not found: {', '.join(missing)}")
+        problems = form_mapping.validate_mappings(self.profile, form_schema.load_schemas(BASE_PATH, self.pdf_paths))
+        if problems:
+            raise ValueError(f"PDF field mappings don't match the templates: {problems}")
+
+    def flatten_templates(self, flatten):
+        """flatten as the fill functions take it: True/False, or the templates of some form numbers"""
+        if isinstance(flatten, bool):
+            return flatten
+        try:
+            return frozenset(self.pdf_paths[int(n)] for n in flatten)
+        except (KeyError, ValueError):
+            raise ValueError(f"Forms to flatten must be numbers from {min(self.pdf_paths)} to {max(self.pdf_paths)}")
+
+    def calculate(self, values):
+        """Return the values with every calculated field filled in"""
+        return pricing.quote(values)
+
+    def fill_jobs(self, values):
+        """Calculated values plus {output filename: (template, data_dict)} for the PDF set"""
+        values = self.calculate(values)
+        values.setdefault('-FIRST-', '')
+        values.setdefault('-LAST-', '')
+        data_dicts = form_mapping.prepare_data_dictionaries(values, self.profile)
+        output_filenames = form_mapping.output_filenames(values)
+        return values, {output_filenames[i]: (input_pdf, data_dicts[i]) for i, input_pdf in self.pdf_paths.items()}
+
+    def fill(self, values, output_dir=None):
+        """Calculate totals and write the PDF set, returning the written paths"""
+        output_dir = Path(output_dir) if output_dir else self.output_dir
+        values, jobs = self.fill_jobs(values)
+        return self.write_pdfs(values, jobs, output_dir)
+
+    def write_pdfs(self, values, jobs, output_dir):
+        """Write the fill_jobs PDF set into output_dir, returning the written paths"""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        written = []
+        for filename, (input_pdf, data_dict) in jobs.items():
+            output_pdf = output_dir / filename
+            pdf_templates.write_fillable_pdf(input_pdf, output_pdf, data_dict, self.flatten)
+            written.append(output_pdf)
+        logging.info(f"Filled {len(written)} PDFs for {values['-FIRST-']} {values['-LAST-']} in {output_dir}")
+        return written
+
+    def fill_zip(self, values, fileobj):
+        """Calculate totals and stream the whole PDF set to a binary file object as one zip"""
+        values, jobs = self.fill_jobs(values)
+        pdf_output.fill_zip(jobs, fileobj, self.flatten)
+        logging.info(f"Filled {len(jobs)} PDFs for {values['-FIRST-']} {values['-LAST-']} into a zip")
+        return list(jobs)
+
+    def fill_merged(self, values, fileobj):
+        """Calculate totals and write the whole PDF set to a binary file object as one document"""
+        values, jobs = self.fill_jobs(values)
+        pdf_output.fill_merged(jobs, fileobj, self.flatten)
+        logging.info(f"Filled {len(jobs)} PDFs for {values['-FIRST-']} {values['-LAST-']} into one document")
+        return list(jobs)
+
+
+def read_records(path):
+    """Yield records from a .csv or .jsonl file (one per row/line) or a .json list/object"""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(f):
+                yield {k: v for k, v in row.items() if k and v}
+        elif path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            data = json.load(f)
+            yield from (data if isinstance(data, list) else [data])
+
+
+# Each pool worker keeps its own filler (and template cache) for the whole batch
+_worker = None
+
+
+def _init_worker(brand, output_dir, flatten):
+    global _worker
+    _worker = HeadlessAutofiller(brand, output_dir, flatten)
+
+
+OUTPUT_FORMATS = {"folder": "", "zip": ".zip", "merged": ".pdf"}
+
+
+def _fill_client(values, output_path, output_format):
+    """Fill one client in a pool worker, returning (filenames, warning)"""
+    values, jobs = _worker.fill_jobs(values)
+    # e.g. an age past the payment factors: the set is still filled, without time pay
+    warning = values["-AGE-ERROR-"]
+    if output_format == "folder":
+        return [str(path) for path in _worker.write_pdfs(values, jobs, output_path)], warning
+
+    # The file is only written once the whole set has filled, so a failed client leaves nothing behind
+    buffer = io.BytesIO()
+    if output_format == "zip":
+        pdf_output.fill_zip(jobs, buffer, _worker.flatten)
+    else:
+        pdf_output.fill_merged(jobs, buffer, _worker.flatten)
+    Path(output_path).write_bytes(buffer.getvalue())
+    logging.info(f"Filled {len(jobs)} PDFs for {values['-FIRST-']} {values['-LAST-']} into {output_path}")
+    return list(jobs), warning
+
+
+def run_batch(paths, brand="rob", package=None, output_dir=None, jobs=None, output_format="folder", flatten=False):
+    """Fill a PDF set per record into <output dir>/<client>/ (or <client>.zip / .pdf), returning (succeeded, failed)"""
+    autofiller = HeadlessAutofiller(brand, output_dir, flatten)
+    if package and package not in autofiller.profile.packages:
+        raise ValueError(f"Unknown package '{package}' for {autofiller.profile.title}")
+    output_dir = autofiller.output_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+
+    counts = {"Done": 0, "Failed": 0}
+    folders = set()
+    summary_path = output_dir / "batch_summary.csv"
+    with open(summary_path, 'w', encoding="utf-8", newline="") as f, \
+            ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                initargs=(brand, str(output_dir), flatten)) as pool:
+        summary = csv.writer(f)
+        summary.writerow(["Source", "Row", "Client", "Status", "Folder", "Error", "Warning"])
+
+        # Rows finish out of order across the workers; they're written in input order
+        finished = {}
+        next_index = 0
+
+        def record_result(index, row, folder, error=None, warning=""):
+            nonlocal next_index
+            status = "Failed" if error else "Done"
+            counts[status] += 1
+            finished[index] = list(row) + [status, folder, error or "", warning]
+            if error:
+                logging.error(f"Error filling record {row[1]} of {row[0]}: {error}")
+            elif warning:
+                logging.warning(f"Record {row[1]} of {row[0]} filled with a warning: {warning}")
+            while next_index in finished:
+                summary.writerow(finished.pop(next_index))
+                next_index += 1
+
+        def collect(done):
+            for future in done:
+                index, row, folder = pending.pop(future)
+                try:
+                    _, warning = future.result()
+                    record_result(index, row, folder, warning=warning)
+                except Exception as e:
+                    record_result(index, row, folder, str(e))
+
+        # Only a couple of rows per worker are in flight, so memory stays flat however long the file is
+        pending = {}
+        index = 0
+        for path in paths:
+            for n, record in enumerate(read_records(path), 1):
+                index += 1
+                try:
+                    values = normalize_values(record)
+                    if package:
+                        values = normalize_values(apply_package(values, autofiller.profile, package))
+                    folder = client_folder(values, n)
+                    if folder in folders:
+                        folder = f"{folder} ({Path(path).stem} row {n})"
+                    folders.add(folder)
+                except Exception as e:
+                    record_result(index - 1, (path, n, ""), "", str(e))
+                    continue
+
+                folder += OUTPUT_FORMATS[output_format]
+                client = f"{values.get('-FIRST-', '')} {values.get('-LAST-', '')}".strip()
+                future = pool.submit(_fill_client, values, str(output_dir / folder), output_format)
+                pending[future] = (index - 1, (path, n, client), folder)
+                if len(pending) >= 2 * jobs:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+        collect(wait(pending)[0])
+
+    logging.info(f"Batch finished: {counts['Done']} filled, {counts['Failed']} failed. Summary in {summary_path}")
+    return counts["Done"], counts["Failed"]
+
+
+def parse_flatten(text):
+    """--flatten's value: True for every form, a list of form numbers, or None if it isn't one"""
+    if not text.strip():
+        return True
+    numbers = [n.strip() for n in text.split(",")]
+    if not all(n.isascii() and n.isdigit() and 1 <= int(n) <= 5 for n in numbers):
+        return None
+    return [int(n) for n in numbers]
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Fill client PDF forms without the GUI")
+    arg_parser.add_argument("inputs", nargs="+", help=".csv, .json or .jsonl files of form values")
+    arg_parser.add_argument("--brand", choices=sorted(brands.PROFILES), default="rob")
+    arg_parser.add_argument("--package", default=None, help="Apply one of the brand's packages to every record")
+    output_format = arg_parser.add_mutually_exclusive_group()
+    output_format.add_argument("--zip", dest="output_format", action="store_const", const="zip", default="folder",
+                               help="Write each client's PDF set as one <client>.zip")
+    output_format.add_argument("--merged", dest="output_format", action="store_const", const="merged",
+                               help="Write each client's PDF set as one merged <client>.pdf")
+    arg_parser.add_argument("--flatten", nargs="?", const="", default=None, metavar="FORMS",
+                            help="Bake the values into the page: every form, or just the comma-separated "
+                                 "form numbers (1-5), e.g. --flatten=1,3")
+    arg_parser.add_argument("--jobs", type=int, default=None, help="Worker processes, defaults to the CPU count")
+    arg_parser.add_argument("--output-dir", default=None, help="Defaults to 'Filled Forms' in the current directory")
+    args = arg_parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    flatten = False if args.flatten is None else parse_flatten(args.flatten)
+    if flatten is None:
+        arg_parser.error(f"--flatten takes comma-separated form numbers from 1 to 5, not '{args.flatten}' "
+                         "(give the input files before --flatten, or write --flatten=1,3)")
+    _, failed = run_batch(args.inputs, args.brand, args.package, args.output_dir, args.jobs, args.output_format, flatten)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
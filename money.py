@@ -0,0 +1,107 @@
+"""Money amounts as integer cents.
+
+Dollar fields are parsed once into Money and all totals, taxes and payments are
+added up in whole cents, so there is no float rounding drift between GST/PST and
+the Grand Total and nothing needs re-parsing when a total is recomputed.
+"""
+import locale
+from decimal import ROUND_HALF_UP, Decimal
+
+
+def _round(amount):
+    return int(amount.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+class Money(int):
+    """An amount in integer cents"""
+    __slots__ = ()
+
+    @classmethod
+    def parse(cls, value):
+        """Parse a dollar field like '$1,234.50' (or a number of dollars) into cents"""
+        if isinstance(value, Money):
+            return value
+        if value is None or value == '':
+            return ZERO
+        if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+            return cls.from_dollars(value)
+
+        text = str(value).replace('$', '').replace(',', '').strip()
+        negative = text.startswith('-')
+        whole, _, fraction = text.lstrip('-').partition('.')
+        if not text.lstrip('-') or (whole and not whole.isdigit()) or (fraction and not fraction.isdigit()):
+            if text in ('', '.'):
+                return ZERO
+            raise ValueError(f"Invalid dollar amount: '{value}'")
+        cents = int(whole or 0) * 100 + int(fraction[:2].ljust(2, '0'))
+        if fraction[2:3] >= '5':
+            cents += 1
+        return cls(-cents if negative else cents)
+
+    @classmethod
+    def from_dollars(cls, amount):
+        return cls(_round(Decimal(str(amount)).scaleb(2)))
+
+    @property
+    def dollars(self):
+        return int(self) / 100
+
+    def format(self, grouping=True):
+        """Format the way the form fields display dollars, e.g. 1,234.50"""
+        whole, cents = divmod(abs(int(self)), 100)
+        sign = '-' if self < 0 else ''
+        if not grouping:
+            return f"{sign}{whole}.{cents:02d}"
+        decimal_point = locale.localeconv()['decimal_point']
+        return f"{sign}{locale.format_string('%d', whole, grouping=True)}{decimal_point}{cents:02d}"
+
+    def percent(self, rate):
+        """This amount times a rate such as 0.05, rounded half up to the cent"""
+        return Money(_round(Decimal(int(self)) * Decimal(str(rate))))
+
+    def __add__(self, other):
+        if isinstance(other, int):
+            return Money(int(self) + int(other))
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, int):
+            return Money(int(self) - int(other))
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, int):
+            return Money(int(other) - int(self))
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, int) and not isinstance(other, Money):
+            return Money(int(self) * other)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Money(-int(self))
+
+    def __str__(self):
+        return self.format(grouping=False)
+
+    def __format__(self, spec):
+        return format(self.dollars, spec) if spec else str(self)
+
+    def __repr__(self):
+        return f"Money('{self}')"
+
+
+ZERO = Money(0)
+
+
+def parse_or_zero(value):
+    """Money for a field, treating invalid or partially typed input as zero"""
+    try:
+        return Money.parse(value)
+    except (ValueError, TypeError):
+        return ZERO
@@ -0,0 +1,188 @@
+"""Filled PDF sets kept in memory and handed out as a single zip or merged PDF.
+
+A set is filled completely into buffers before anything is written, so the
+caller's file object only ever receives a whole set: if one of the five forms
+fails, nothing is written and no partial files are left behind.
+
+The merged document puts every form's pages in one file. Fonts and XObjects
+that the templates each embed are written once, and each form's fields are
+grouped under a "Form n" parent so same-named fields (Date, Address, ...) on
+different forms keep their own values.
+"""
+import hashlib
+import io
+import logging
+import zipfile
+
+import pdfrw
+
+import pdf_templates
+
+APPEARANCE_STATES = (pdfrw.PdfName.N, pdfrw.PdfName.R, pdfrw.PdfName.D)
+RESOURCE_CATEGORIES = (pdfrw.PdfName.Font, pdfrw.PdfName.XObject)
+
+
+def fill_in_memory(jobs, flatten=False):
+    """{filename: PDF bytes} for jobs mapping an output filename to (input_pdf, data_dict)"""
+    return {filename: pdf_templates.fill_pdf_bytes(input_pdf, data_dict, flatten)
+            for filename, (input_pdf, data_dict) in jobs.items()}
+
+
+def write_zip(files, fileobj):
+    """Write {filename: bytes} to a binary file object as one zip archive"""
+    with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED) as archive:
+        for filename, data in files.items():
+            archive.writestr(filename, data)
+
+
+def fill_zip(jobs, fileobj, flatten=False):
+    """Fill every PDF in memory, then stream them to fileobj as one zip"""
+    write_zip(fill_in_memory(jobs, flatten), fileobj)
+
+
+def _copy(obj):
+    """Shallow copy of a dictionary or stream, so objects shared with the template cache aren't changed"""
+    new = pdfrw.PdfDict()
+    for key, value in obj.iteritems():
+        new[key] = value
+    new.indirect = obj.indirect
+    if obj.stream is not None:
+        new.stream = obj.stream
+    return new
+
+
+class SharedResources:
+    """One object per distinct font, XObject and appearance stream across the merged forms"""
+
+    def __init__(self):
+        self.by_digest = {}
+        self.digests = {}  # id -> (object, digest); holds the object so its id isn't reused
+        self.shared = 0
+
+    def digest(self, obj):
+        """Hash of an object's content, so equal fonts from different templates compare equal"""
+        known = self.digests.get(id(obj))
+        if known is not None:
+            return known[1]
+        self.digests[id(obj)] = (obj, b'')  # Cycles hash as empty
+
+        h = hashlib.sha256()
+        if isinstance(obj, pdfrw.PdfDict):
+            for key in sorted(obj.keys()):
+                if key not in ('/Parent', '/P'):  # Back-references don't change the content
+                    h.update(key.encode('latin-1'))
+                    h.update(self.digest(obj[key]))
+            data = obj.stream
+            if data is not None:
+                h.update(b'stream')
+                h.update(data.encode('latin-1') if isinstance(data, str) else data)
+        elif isinstance(obj, pdfrw.PdfArray):
+            h.update(b'[')
+            for value in obj:
+                h.update(self.digest(value))
+        else:
+            h.update(str(obj).encode('latin-1', 'replace'))
+        digest = h.digest()
+        self.digests[id(obj)] = (obj, digest)
+        return digest
+
+    def share(self, obj):
+        """The first object seen with the same content as obj"""
+        existing = self.by_digest.setdefault(self.digest(obj), obj)
+        if existing is not obj:
+            self.shared += 1
+        return existing
+
+    def resources(self, resources):
+        """Copy of a /Resources dictionary pointing at the shared fonts and XObjects"""
+        if not resources:
+            return resources
+        new = _copy(resources)
+        for category in RESOURCE_CATEGORIES:
+            entries = resources[category]
+            if entries:
+                new[category] = pdfrw.PdfDict((name, self.share(value)) for name, value in entries.iteritems())
+        return new
+
+    def appearance(self, appearance):
+        """Copy of an annotation's /AP with its streams (and their resources) shared"""
+        if not isinstance(appearance, pdfrw.PdfDict):
+            return appearance
+        new = _copy(appearance)
+        for state in APPEARANCE_STATES:
+            value = appearance[state]
+            if not isinstance(value, pdfrw.PdfDict):
+                continue
+            if value.stream is not None:
+                new[state] = self.stream(value)
+            else:
+                new[state] = pdfrw.PdfDict((name, self.stream(stream)) for name, stream in value.iteritems())
+        return new
+
+    def stream(self, stream):
+        if not isinstance(stream, pdfrw.PdfDict) or stream.stream is None:
+            return stream
+        new = _copy(stream)
+        new.Resources = self.resources(stream.Resources)
+        return self.share(new)
+
+
+def merge_copies(copies, fileobj):
+    """Write filled pdf_templates.FormCopy objects to fileobj as one document"""
+    writer = pdfrw.PdfWriter()
+    shared = SharedResources()
+    fields = []
+    default_fonts = pdfrw.PdfDict()
+    default_appearance = None
+
+    for n, copy in enumerate(copies, 1):
+        root = copy.trailer.Root
+        # The pages and annotations are the copy's own, so they can be repointed in place
+        for page in pdf_templates.iter_pages(root.Pages):
+            page.Resources = shared.resources(page.inheritable.Resources)
+            writer.addpage(page)
+            # addpage writes a new page dictionary; widgets still pointing at the copy's page would drag
+            # it and its old page tree into the file
+            added = writer.pagearray[-1]
+            for annotation in page.Annots or []:
+                if annotation.AP:
+                    annotation.AP = shared.appearance(annotation.AP)
+                if annotation.P is not None:
+                    annotation.P = added
+
+        acroform = root.AcroForm
+        if not acroform:
+            continue
+        if acroform.Fields:
+            parent = pdfrw.IndirectPdfDict(T=pdfrw.PdfString.encode(f"Form {n}"), Kids=acroform.Fields)
+            for field in acroform.Fields:
+                field.Parent = parent
+            fields.append(parent)
+        if acroform.DR and acroform.DR.Font:
+            for name, font in acroform.DR.Font.iteritems():
+                if default_fonts[name] is None:
+                    default_fonts[name] = shared.share(font)
+        default_appearance = default_appearance or acroform.DA
+
+    acroform = pdfrw.IndirectPdfDict(Fields=pdfrw.PdfArray(fields))
+    if default_fonts:
+        acroform.DR = pdfrw.PdfDict(Font=default_fonts)
+    if default_appearance:
+        acroform.DA = default_appearance
+    writer.trailer.Root.AcroForm = acroform
+    writer.write(fileobj)
+    logging.info(f"Merged {len(copies)} forms, {shared.shared} duplicate resources shared")
+
+
+def fill_merged(jobs, fileobj, flatten=False):
+    """Fill every PDF, then write them to fileobj as one merged document"""
+    copies = [pdf_templates.template_cache.get(input_pdf).copy().fill(data_dict, flatten)
+              for input_pdf, data_dict in jobs.values()]
+    merge_copies(copies, fileobj)
+
+
+def merged_pdf_bytes(jobs, flatten=False):
+    """The merged document as bytes, e.g. from a pool worker"""
+    buffer = io.BytesIO()
+    fill_merged(jobs, buffer, flatten)
+    return buffer.getvalue()
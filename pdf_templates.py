@@ -0,0 +1,475 @@
+"""Parsed-template cache for the Forms/*.pdf files.
+
+fillpdfs.write_fillable_pdf re-reads and re-parses the template on every call.
+The cache keeps each template's parsed object tree and an index of its widget
+annotations by field name, keyed on path + mtime, and hands out copies that
+share everything except the form skeleton (pages, annotations and AcroForm).
+
+Filled fields get real appearance streams (see appearances), so viewers show
+the values without regenerating them from NeedAppearances.
+"""
+import atexit
+import io
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import pdfrw
+
+import appearances
+
+ANNOT_KEY = '/Annots'
+ANNOT_FIELD_KEY = '/T'
+ANNOT_FORM_TYPE = '/FT'
+ANNOT_FORM_BUTTON = '/Btn'
+ANNOT_FORM_TEXT = '/Tx'
+ANNOT_FORM_COMBO = '/Ch'
+ANNOT_FORM_OPTIONS = '/Opt'
+SUBTYPE_KEY = '/Subtype'
+WIDGET_SUBTYPE_KEY = '/Widget'
+PARENT_KEY = '/Parent'
+KIDS_KEY = '/Kids'
+
+# Keys leading from the trailer to everything a fill mutates.  Objects reached
+# through any other key (content streams, fonts, resources) are shared.
+STRUCTURAL_KEYS = {'/Root', '/Pages', '/Kids', '/Annots', '/Parent', '/P', '/AcroForm', '/Fields'}
+
+
+class FillCancelled(Exception):
+    """A queued fill was cancelled before it started"""
+
+
+def _clone(obj, memo):
+    """Copy obj and its structural children, sharing every other object"""
+    existing = memo.get(id(obj))
+    if existing is not None:
+        return existing
+
+    if isinstance(obj, pdfrw.PdfDict):
+        new = pdfrw.PdfDict()
+        new.indirect = obj.indirect
+        memo[id(obj)] = new
+        for key, value in obj.iteritems():
+            if key in STRUCTURAL_KEYS and isinstance(value, (pdfrw.PdfDict, pdfrw.PdfArray)):
+                value = _clone(value, memo)
+            dict.__setitem__(new, key, value)
+        return new
+
+    if isinstance(obj, pdfrw.PdfArray):
+        new = pdfrw.PdfArray()
+        new.indirect = obj.indirect
+        memo[id(obj)] = new
+        new.extend(_clone(value, memo) if isinstance(value, (pdfrw.PdfDict, pdfrw.PdfArray)) else value
+                   for value in obj)
+        return new
+
+    return obj
+
+
+def iter_pages(node):
+    """The page dictionaries under a page tree node, in order"""
+    if node.Type == pdfrw.PdfName.Page:
+        yield node
+    else:
+        for kid in node[KIDS_KEY] or []:
+            yield from iter_pages(kid)
+
+
+def flattens(flatten, input_pdf_path):
+    """Whether to flatten a template: flatten is True/False or a collection of template paths"""
+    if isinstance(flatten, bool):
+        return flatten
+    return os.path.abspath(os.fspath(input_pdf_path)) in {os.path.abspath(os.fspath(p)) for p in flatten}
+
+
+def _decode(value):
+    if isinstance(value, pdfrw.PdfString):
+        return value.to_unicode()
+    return '' if value is None else str(value)
+
+
+def field_key(target):
+    """Field name exactly as fillpdfs.write_fillable_pdf matches it"""
+    key = target[ANNOT_FIELD_KEY][1:-1]  # Remove parentheses
+    target_aux = target
+    while target_aux[PARENT_KEY]:
+        key = target[PARENT_KEY][ANNOT_FIELD_KEY][1:-1] + '.' + key
+        target_aux = target_aux[PARENT_KEY]
+    return key
+
+
+def _to_strings(data_dict):
+    """Same value conversion fillpdfs.convert_dict_values_to_string does"""
+    res = {}
+    for key, value in data_dict.items():
+        if isinstance(value, list):
+            res[key] = value
+        elif isinstance(value, tuple):
+            res[key] = '^'.join(str(ele) for ele in value)
+        else:
+            res[key] = str(value)
+    return res
+
+
+class FormTemplate:
+    """One parsed template plus an index of its widget annotations"""
+
+    def __init__(self, path, mtime):
+        start = time.perf_counter()
+        self.path = path
+        self.mtime = mtime
+        self.pdf = pdfrw.PdfReader(path)
+
+        # Field name -> widget annotations
+        self.fields = defaultdict(list)
+        for page in self.pdf.pages:
+            for annotation in page[ANNOT_KEY] or []:
+                if annotation[SUBTYPE_KEY] != WIDGET_SUBTYPE_KEY:
+                    continue
+                target = annotation if annotation[ANNOT_FIELD_KEY] else annotation[PARENT_KEY]
+                if target:
+                    self.fields[field_key(target)].append(annotation)
+
+        logging.info(f"Parsed template {os.path.basename(path)} ({len(self.fields)} fields) "
+                     f"in {time.perf_counter() - start:.3f}s")
+
+    @property
+    def field_names(self):
+        return list(self.fields)
+
+    @property
+    def schema(self):
+        """{field name: {"type": "Tx"/"Btn"/"Ch", "on": [checkbox on-values]}}"""
+        schema = {}
+        for name, annotations in self.fields.items():
+            first = annotations[0]
+            target = first if first[ANNOT_FIELD_KEY] else first[PARENT_KEY]
+            on_values = set()
+            if target[ANNOT_FORM_TYPE] == ANNOT_FORM_BUTTON:
+                # A button's normal appearance dict has one entry per state, /Off plus its on-values
+                for annotation in annotations:
+                    appearances = annotation['/AP'] and annotation['/AP']['/N']
+                    if appearances:
+                        on_values.update(key[1:] for key in appearances.keys() if key != '/Off')
+            schema[name] = {"type": (target[ANNOT_FORM_TYPE] or '')[1:], "on": sorted(on_values)}
+        return schema
+
+    def copy(self):
+        """Cheap copy of the template that can be filled and written independently"""
+        memo = {}
+        trailer = _clone(self.pdf, memo)
+        return FormCopy(self, trailer, memo)
+
+
+class FormCopy:
+    """A fillable copy of a FormTemplate"""
+
+    def __init__(self, template, trailer, memo):
+        self.template = template
+        self.trailer = trailer
+        self._memo = memo
+
+    def _own(self, obj):
+        return self._memo.get(id(obj), obj)
+
+    def fill(self, data_dict, flatten=False):
+        """Write the dictionary values and their appearances into the copy's fields"""
+        data_dict = _to_strings(data_dict)
+        acroform = self.trailer.Root.AcroForm
+        defaults = (acroform.DA, acroform.DR) if acroform else (None, None)
+
+        for key, value in data_dict.items():
+            for original in self.template.fields.get(key, ()):
+                annotation = self._own(original)
+                target = annotation if annotation[ANNOT_FIELD_KEY] else annotation[PARENT_KEY]
+                form_type = target[ANNOT_FORM_TYPE]
+
+                if form_type == ANNOT_FORM_BUTTON:
+                    if not annotation[ANNOT_FIELD_KEY]:
+                        self._fill_radio(annotation[PARENT_KEY], key, value)
+                    else:
+                        # button field i.e. a checkbox
+                        name = _checkbox_state(annotation, value)
+                        target.update(pdfrw.PdfDict(V=name, AS=name))
+                        if target[KIDS_KEY]:
+                            target[KIDS_KEY][0].update(pdfrw.PdfDict(V=name, AS=name))
+                elif form_type == ANNOT_FORM_COMBO:
+                    self._fill_combo(annotation, value)
+                    text = value if isinstance(value, str) else ', '.join(value)
+                    annotation.AP = pdfrw.PdfDict(N=self._text_appearance(annotation, target, text, *defaults))
+                elif form_type == ANNOT_FORM_TEXT:
+                    # regular text field
+                    target.V = value
+                    if target[KIDS_KEY]:
+                        target[KIDS_KEY][0].V = value
+                    annotation.AP = pdfrw.PdfDict(N=self._text_appearance(annotation, target, value, *defaults))
+
+        if flattens(flatten, self.template.path):
+            self.flatten()
+        elif acroform and acroform.NeedAppearances is not None:
+            acroform.NeedAppearances = None  # Every filled field now carries its own appearance
+        return self
+
+    def flatten(self):
+        """Draw every field's value into its page and drop the interactive fields"""
+        root = self.trailer.Root
+        acroform = root.AcroForm
+        defaults = (acroform.DA, acroform.DR) if acroform else (None, None)
+
+        for page in iter_pages(root.Pages):
+            annotations = page[ANNOT_KEY]
+            if not annotations:
+                continue
+            kept = pdfrw.PdfArray()
+            drawn = []
+            for annotation in annotations:
+                if annotation[SUBTYPE_KEY] != WIDGET_SUBTYPE_KEY:
+                    kept.append(annotation)
+                    continue
+                appearance = self._flat_appearance(annotation, *defaults)
+                if appearance is not None:
+                    drawn.append((annotation.Rect, appearance))
+            page.Annots = kept or None
+            if drawn:
+                _draw_on_page(page, drawn)
+        root.AcroForm = None
+
+    def _flat_appearance(self, annotation, default_da, default_resources):
+        """The XObject showing a widget's current value, or None if nothing is drawn"""
+        if int(annotation.F or 0) & 2:  # Hidden
+            return None
+        target = annotation if annotation[ANNOT_FIELD_KEY] else annotation[PARENT_KEY]
+        form_type = target[ANNOT_FORM_TYPE] if target else None
+        appearance = annotation['/AP']
+        normal = appearance['/N'] if isinstance(appearance, pdfrw.PdfDict) else None
+
+        if form_type == ANNOT_FORM_BUTTON:
+            state = annotation['/AS'] or target['/V']
+            if state in (None, '/Off', '/') or not isinstance(normal, pdfrw.PdfDict) or normal.stream is not None:
+                return None
+            return normal[state]
+
+        if form_type in (ANNOT_FORM_TEXT, ANNOT_FORM_COMBO):
+            text = _decode(target['/V'])
+            if not text:
+                return None
+            return self._text_appearance(annotation, target, text, default_da, default_resources)
+        return None
+
+    def _text_appearance(self, annotation, target, text, default_da, default_resources):
+        """The (memoized) stream showing text in a text or combo widget"""
+        x1, y1, x2, y2 = (float(n) for n in annotation.Rect)
+        normal = annotation['/AP']['/N'] if isinstance(annotation['/AP'], pdfrw.PdfDict) else None
+        resources = normal.Resources if isinstance(normal, pdfrw.PdfDict) and normal.Resources else default_resources
+        return appearances.cached_text_appearance(_decode(annotation.DA or target.DA or default_da),
+                                                  abs(x2 - x1), abs(y2 - y1), text,
+                                                  int(annotation.Q or target.Q or 0), resources)
+
+    def _fill_radio(self, parent, key, value):
+        options = []
+        for kid in parent[KIDS_KEY]:
+            states = [state for state in kid['/AP']['/N'].keys() if state != '/Off']
+            export = states[0] if states else '/Off'
+            options.append(export[1:] if export.startswith('/') else export)
+            state = export if f'/{value}' == export else '/Off'
+            kid.update(pdfrw.PdfDict(AS=pdfrw.PdfName(state[1:])))
+        if value in options:
+            parent.update(pdfrw.PdfDict(V=pdfrw.PdfName(value)))
+        elif value not in ("None", ""):
+            raise KeyError(f"{value} Not An Option For {key}, Options are {options}")
+
+    def _fill_combo(self, annotation, value):
+        options = annotation[ANNOT_FORM_OPTIONS] or []
+        decoded = []
+        for option in options:
+            if isinstance(option, pdfrw.PdfArray):
+                option = option[0]
+            decoded.append(option.decode() if isinstance(option, pdfrw.PdfString) else str(option))
+        if isinstance(value, list):
+            pdfstr = pdfrw.PdfArray([pdfrw.PdfString.encode(each) for each in decoded if each in value])
+        else:
+            if value not in decoded and value not in ("None", ""):
+                raise KeyError(f"{value} Not An Option For {annotation[ANNOT_FIELD_KEY]}, Options are {decoded}")
+            pdfstr = pdfrw.PdfString.encode(value)
+        annotation.update(pdfrw.PdfDict(V=pdfstr, AS=pdfstr))
+
+    def write(self, output_pdf_path):
+        """Write the filled copy to a path or binary file object"""
+        pdfrw.PdfWriter().write(output_pdf_path, self.trailer)
+
+
+def _checkbox_state(annotation, value):
+    """The appearance state to tick a checkbox with for a value.
+
+    The mappings tick with 'On' where most templates say /Yes; without
+    NeedAppearances a state the widget has no appearance for shows as blank,
+    so a checkbox with a single on-state is ticked with that one. Empty, None
+    and 'Off' leave it unticked.
+    """
+    if value in (None, "", "None", "Off"):
+        return pdfrw.PdfName('Off')
+    name = pdfrw.PdfName(value)
+    appearance = annotation['/AP']
+    normal = appearance['/N'] if isinstance(appearance, pdfrw.PdfDict) else None
+    if name == '/Off' or not isinstance(normal, pdfrw.PdfDict) or normal.stream is not None or normal[name] is not None:
+        return name
+    on_states = [state for state in normal.keys() if state != '/Off']
+    return pdfrw.PdfName(on_states[0][1:]) if len(on_states) == 1 else name
+
+
+def _draw_on_page(page, drawn):
+    """Append XObjects to the page content, each scaled from its BBox onto a widget Rect"""
+    # The page's resources may be shared with the cached template, so draw into a copy
+    resources = pdfrw.PdfDict()
+    for key, value in (page.inheritable.Resources or pdfrw.PdfDict()).iteritems():
+        resources[key] = value
+    xobjects = pdfrw.PdfDict()
+    for key, value in (resources.XObject or pdfrw.PdfDict()).iteritems():
+        xobjects[key] = value
+
+    operations = []
+    for n, (rect, xobject) in enumerate(drawn):
+        name = f'FlatField{n}'
+        xobjects[pdfrw.PdfName(name)] = xobject
+        x1, y1, x2, y2 = (float(v) for v in rect)
+        bx1, by1, bx2, by2 = (float(v) for v in xobject.BBox)
+        sx = (abs(x2 - x1) / (bx2 - bx1)) if bx2 != bx1 else 1
+        sy = (abs(y2 - y1) / (by2 - by1)) if by2 != by1 else 1
+        operations.append(f"q {sx:g} 0 0 {sy:g} {min(x1, x2) - bx1 * sx:g} {min(y1, y2) - by1 * sy:g} cm /{name} Do Q")
+    resources.XObject = xobjects
+    page.Resources = resources
+
+    # Wrap the original content in q/Q so its graphics state can't leak into the fields
+    contents = page.Contents
+    contents = list(contents) if isinstance(contents, pdfrw.PdfArray) else [contents] if contents else []
+    before = pdfrw.IndirectPdfDict()
+    before.stream = "q\n"
+    after = pdfrw.IndirectPdfDict()
+    after.stream = "\nQ\n" + "\n".join(operations) + "\n"
+    page.Contents = pdfrw.PdfArray([before] + contents + [after])
+
+
+class TemplateCache:
+    """Parsed templates keyed on path, re-parsed when the file's mtime changes"""
+
+    def __init__(self):
+        self._templates = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        path = os.path.abspath(os.fspath(path))
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            template = self._templates.get(path)
+            if template is None or template.mtime != mtime:
+                template = FormTemplate(path, mtime)
+                self._templates[path] = template
+        return template
+
+    def preload(self, paths):
+        """Parse the templates ahead of the first fill"""
+        for path in paths:
+            try:
+                self.get(path)
+            except (OSError, pdfrw.PdfParseError) as e:
+                logging.warning(f"Could not preload template {path}: {str(e)}")
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+
+
+template_cache = TemplateCache()
+
+
+def write_fillable_pdf(input_pdf_path, output_pdf_path, data_dict, flatten=False):
+    """Drop-in replacement for fillpdfs.write_fillable_pdf that reuses parsed templates"""
+    template_cache.get(input_pdf_path).copy().fill(data_dict, flatten).write(output_pdf_path)
+
+
+def fill_pdf_bytes(input_pdf_path, data_dict, flatten=False):
+    """The filled PDF as bytes, without touching the disk"""
+    buffer = io.BytesIO()
+    template_cache.get(input_pdf_path).copy().fill(data_dict, flatten).write(buffer)
+    return buffer.getvalue()
+
+
+def _fill_job(input_pdf_path, output_pdf_path, data_dict, flatten):
+    write_fillable_pdf(input_pdf_path, output_pdf_path, data_dict, flatten)
+    return output_pdf_path
+
+
+POOL_SIZE = min(5, os.cpu_count() or 1)
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(preload=()):
+    """Worker processes kept alive between fills so their template caches stay warm"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=POOL_SIZE,
+                                        initializer=template_cache.preload, initargs=(list(preload),))
+            atexit.register(shutdown_pool)
+        return _pool
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def fill_pdfs(jobs, flatten=False, cancel=None):
+    """Fill PDFs in parallel, yielding (key, output_pdf, error) as each one finishes.
+
+    jobs maps a key to an (input_pdf, output_pdf, data_dict) tuple. error is None on
+    success, otherwise the exception raised for that file (e.g. PermissionError).
+    Setting the optional cancel Event stops files that have not started yet; they
+    are reported with a FillCancelled error.
+    """
+    pending = dict(jobs)
+    try:
+        pool = get_pool(input_pdf for input_pdf, _, _ in pending.values())
+        futures = {pool.submit(_fill_job, input_pdf, str(output_pdf), data_dict, flatten): key
+                   for key, (input_pdf, output_pdf, data_dict) in pending.items()}
+        not_done = set(futures)
+        while not_done:
+            done, not_done = wait(not_done, timeout=0.1, return_when=FIRST_COMPLETED)
+            if cancel is not None and cancel.is_set():
+                for future in not_done:
+                    future.cancel()
+            for future in done:
+                key = futures[future]
+                try:
+                    future.result()
+                    error = None
+                except CancelledError:
+                    error = FillCancelled(f"Cancelled before {os.path.basename(str(pending[key][1]))} was written")
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    error = e
+                _, output_pdf, _ = pending.pop(key)
+                yield key, output_pdf, error
+    except (BrokenProcessPool, OSError) as e:
+        # Workers could not start or died; finish the rest in this process
+        logging.error(f"PDF worker pool unavailable, filling in-process: {str(e)}")
+        shutdown_pool()
+        for key, (input_pdf, output_pdf, data_dict) in list(pending.items()):
+            pending.pop(key)
+            if cancel is not None and cancel.is_set():
+                yield key, output_pdf, FillCancelled(f"Cancelled before {os.path.basename(str(output_pdf))} was written")
+                continue
+            try:
+                write_fillable_pdf(input_pdf, output_pdf, data_dict, flatten)
+                yield key, output_pdf, None
+            except Exception as e:
+                yield key, output_pdf, e
@@ -0,0 +1,333 @@
+import locale
+from datetime import datetime
+
+from money import ZERO, Money, parse_or_zero
+
+GST_RATE = 0.05
+PST_RATE = 0.07
+
+CARD_PRICE = 2.95
+GUEST_BOOK_PRICE = 75.00
+DEATH_CERTIFICATE_PRICE = 27.00
+
+SECTION_FIELDS = {
+    'A': ['A1', 'A2A', 'A2B', 'A2C', 'A2D', 'A3', 'A4A', 'A4B', 'A4C',
+          'A5A', 'A5B', 'A5C', 'A5D', 'A6', 'A7', 'A8', 'A9A', 'A9B',
+          'A9C', 'A9D', 'A9E', 'A9F', 'A9G', 'A9H'],
+    'B': ['B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'B7'],
+    'C': ['C1', 'C2', 'C3', 'C4', 'C5', 'C6', 'C7', 'C8', 'C9', 'C10'],
+    'D': ['D1', 'D2', 'D3', 'D4', 'D5', 'D6', 'D7', 'D8']
+}
+
+GST_FIELDS = [
+    "A1", "A2A", "A2B", "A2C", "A2D", "A3", "A4A", "A4B",
+    "A4C", "A5A", "A5B", "A5C", "A5D", "A6", "A7", "A8",
+    "A9A", "A9B", "A9C", "A9D", "A9E", "A9F", "A9G", "A9H",
+    "B1", "B2", "B3", "B4", "B5", "B6", "B7", "C1", "C2",
+    "C3", "C4", "C5", "C6", "C7", "C8", "C9", "C10"
+]
+
+PST_FIELDS = [
+    "B1", "B2", "B3", "B4", "B5", "B6", "B7", "C4", "C7"
+]
+
+SECTION_3_FIELDS = [
+    "3A Goods and Services", "3B MonumentMarker", "3C Other Expenses",
+    "3D Final Documents Service", "3E Journey Home"
+]
+
+SECTION_4_FIELDS = [
+    "4A Single Pay", "4B Time Pay", "4C Single Pay Journey Home", "4D LPR"
+]
+
+PAYMENT_TERMS = ['3-year', '5-year', '10-year', '15-year', '20-year']
+MAX_AGE = 82  # Oldest age any payment term is offered to
+COMPARISON_YEARS = 10
+DOWN_PAYMENT_SHARES = (0, 0.10, 0.25, 0.50)  # Shares of Total 3 offered as single pays
+
+PAYMENT_FACTORS = {
+    '0_to_54': {'3-year': 0.03150, '5-year': 0.01995, '10-year': 0.01155, '15-year': 0.008925, '20-year': 0.00735},
+    '55_to_59': {'3-year': 0.03255, '5-year': 0.01995, '10-year': 0.01260, '15-year': 0.009975, '20-year': 0.00840},
+    '60_to_64': {'3-year': 0.03255, '5-year': 0.02100, '10-year': 0.01365, '15-year': 0.01050, '20-year': 0.008925},
+    '65': {'3-year': 0.03360, '5-year': 0.02100, '10-year': 0.01470, '15-year': 0.01155, '20-year': 0.009975},
+    '66_to_69': {'3-year': 0.03360, '5-year': 0.02100, '10-year': 0.01470, '15-year': 0.01155, '20-year': None},
+    '70': {'3-year': 0.03465, '5-year': 0.02205, '10-year': 0.01575, '15-year': 0.01260, '20-year': None},
+    '71_to_74': {'3-year': 0.03465, '5-year': 0.02205, '10-year': 0.01575, '15-year': None, '20-year': None},
+    '75': {'3-year': 0.03675, '5-year': 0.02310, '10-year': 0.01680, '15-year': None, '20-year': None},
+    '76_to_79': {'3-year': 0.03675, '5-year': 0.02310, '10-year': None, '15-year': None, '20-year': None},
+    '80': {'3-year': 0.03780, '5-year': 0.02625, '10-year': None, '15-year': None, '20-year': None},
+    '81_to_82': {'3-year': 0.03780, '5-year': None, '10-year': None, '15-year': None, '20-year': None}
+}
+
+AGE_GROUPS = [
+    ('0_to_54', lambda x: x <= 54),
+    ('55_to_59', lambda x: 55 <= x <= 59),
+    ('60_to_64', lambda x: 60 <= x <= 64),
+    ('65', lambda x: x == 65),
+    ('66_to_69', lambda x: 66 <= x <= 69),
+    ('70', lambda x: x == 70),
+    ('71_to_74', lambda x: 71 <= x <= 74),
+    ('75', lambda x: x == 75),
+    ('76_to_79', lambda x: 76 <= x <= 79),
+    ('80', lambda x: x == 80),
+    ('81_to_82', lambda x: 81 <= x <= 82)
+]
+
+
+LINE_ITEMS = [field for fields in SECTION_FIELDS.values() for field in fields]
+LINE_INDEX = {field: i for i, field in enumerate(LINE_ITEMS)}
+
+
+def parse_dollars(value):
+    """Convert a formatted dollar string (or number) to float"""
+    return Money.parse(value).dollars
+
+
+def format_dollars(amount):
+    """Format an amount the same way the form fields display it"""
+    if isinstance(amount, Money):
+        return amount.format()
+    return locale.format_string('%.2f', amount, grouping=True)
+
+
+def calculate_age(birthdate):
+    # dateutil is only needed once a birthdate is entered, so it isn't loaded at startup
+    from dateutil import parser
+    from dateutil.relativedelta import relativedelta
+    birth_date = parser.parse(birthdate)
+    today = datetime.now()
+    return relativedelta(today, birth_date).years
+
+
+def calculate_total_discount(values):
+    """Sum every discount amount row in the values dictionary"""
+    return sum((parse_or_zero(amount) for key, amount in values.items()
+                if isinstance(key, tuple) and key[0] == '-DISCOUNT-AMT-'), ZERO)
+
+
+def calculate_gst(taxable, total_discount):
+    # GST is charged after subtracting the total discount
+    return (taxable - total_discount).percent(GST_RATE)
+
+
+def calculate_pst(pst_base):
+    return pst_base.percent(PST_RATE)
+
+
+def price_line_items(items, total_discount=ZERO, gst_fields=GST_FIELDS, pst_fields=PST_FIELDS, pst_exempt=()):
+    """Section totals, taxes and Grand Total from an array of LINE_ITEMS amounts in cents"""
+    totals = {f"Total {section}": sum((items[LINE_INDEX[field]] for field in fields), ZERO)
+              for section, fields in SECTION_FIELDS.items()}
+    taxable = sum((items[LINE_INDEX[field]] for field in gst_fields), ZERO)
+    pst_base = sum((items[LINE_INDEX[field]] for field in gst_fields
+                    if field in pst_fields and field not in pst_exempt), ZERO)
+
+    gst = calculate_gst(taxable, total_discount)
+    pst = calculate_pst(pst_base)
+    total_abc = totals["Total A"] + totals["Total B"] + totals["Total C"]
+    grand_total = total_abc - total_discount + gst + pst + totals["Total D"]
+
+    totals.update({
+        "Total D_2": totals["Total D"],
+        "Total \\(ABC\\)": total_abc,
+        "Discount": total_discount,
+        "GST": gst,
+        "PST": pst,
+        "Grand Total": grand_total
+    })
+    return totals
+
+
+def pst_exempt_fields(values):
+    """Skip PST for B1 if Minimum Cremation package is selected"""
+    return ("B1",) if (values.get("Casket") or "").strip() == "Basic Cremation Container" else ()
+
+
+def calculate_grand_total(values, gst_fields=GST_FIELDS, pst_fields=PST_FIELDS, total_discount=None):
+    """Calculate section totals, taxes, Grand Total and Total 3 from the line items"""
+    if total_discount is None:
+        total_discount = calculate_total_discount(values)
+
+    items = [parse_or_zero(values.get(field)) for field in LINE_ITEMS]
+    results = price_line_items(items, Money.parse(total_discount), gst_fields, pst_fields,
+                               pst_exempt_fields(values))
+
+    # Preplanned Amount
+    results["3A Goods and Services"] = results["Grand Total"]
+    results["Total 3"] = results["Grand Total"] + sum(
+        (parse_or_zero(values.get(field)) for field in SECTION_3_FIELDS[1:]), ZERO)
+    return results
+
+
+def calculate_section_3_total(values):
+    """Calculate total for section 3"""
+    return sum((parse_or_zero(values.get(field)) for field in SECTION_3_FIELDS), ZERO)
+
+
+def calculate_section_4_total(values):
+    """Calculate total for section 4"""
+    return sum((parse_or_zero(values.get(field)) for field in SECTION_4_FIELDS), ZERO)
+
+
+def get_age_group(age):
+    """Return the payment_factors age group for an age, or None if out of range"""
+    return next((group for group, condition in AGE_GROUPS if condition(age)), None)
+
+
+def build_factor_table(payment_factors=PAYMENT_FACTORS):
+    """Dense table of the five term factors (None where not offered) for every age 0..MAX_AGE"""
+    table = []
+    for age in range(MAX_AGE + 1):
+        age_group = get_age_group(age)
+        table.append(tuple(payment_factors[age_group][term] for term in PAYMENT_TERMS)
+                     if age_group is not None else None)
+    return table
+
+
+_factor_tables = {id(PAYMENT_FACTORS): (PAYMENT_FACTORS, build_factor_table(PAYMENT_FACTORS))}
+
+
+def factor_table(payment_factors=PAYMENT_FACTORS):
+    """The dense factor table for a payment_factors dict, built once per dict"""
+    cached = _factor_tables.get(id(payment_factors))
+    if cached is None or cached[0] is not payment_factors:
+        cached = (payment_factors, build_factor_table(payment_factors))
+        _factor_tables[id(payment_factors)] = cached
+    return cached[1]
+
+
+def payment_factors_for_age(age, payment_factors=PAYMENT_FACTORS):
+    """The five term factors for an age, in PAYMENT_TERMS order"""
+    table = factor_table(payment_factors)
+    factors = table[max(age, 0)] if age < len(table) else None
+    if factors is None:
+        raise ValueError(f"Age {age} is out of supported range")
+    return factors
+
+
+def amount_to_finance(total_preplanned, single_pay):
+    """Total 3 less the single pay, rounded up to whole dollars"""
+    remaining = Money.parse(total_preplanned) - Money.parse(single_pay)
+    return Money(-(-remaining // 100) * 100)
+
+
+def calculate_monthly_payments(total_preplanned, single_pay, age, payment_factors=PAYMENT_FACTORS):
+    """Calculate monthly payments for every term, None where a term is not offered"""
+    return monthly_payments_by_age(total_preplanned, single_pay, [age], payment_factors)[age]
+
+
+def monthly_payments_by_age(total_preplanned, single_pay, ages, payment_factors=PAYMENT_FACTORS):
+    """Monthly payments for several ages at once, e.g. now and if they wait five years"""
+    total_to_finance = amount_to_finance(total_preplanned, single_pay)
+    if total_to_finance <= 0:
+        return {age: {term: ZERO for term in PAYMENT_TERMS} for age in ages}
+
+    payments = {}
+    for age in ages:
+        factors = payment_factors_for_age(age, payment_factors)
+        payments[age] = {term: total_to_finance.percent(factor) if factor is not None else None
+                         for term, factor in zip(PAYMENT_TERMS, factors)}
+    return payments
+
+
+def comparison_single_pays(total_preplanned, single_pay, shares=DOWN_PAYMENT_SHARES):
+    """The current single pay plus whole-dollar shares of Total 3 to compare against"""
+    total = Money.parse(total_preplanned)
+    amounts = {Money.parse(single_pay)}
+    amounts.update(Money(total.percent(share) // 100 * 100) for share in shares)
+    return sorted(amount for amount in amounts if amount <= max(total, ZERO))
+
+
+def payment_comparison(total_preplanned, age, single_pays, years=COMPARISON_YEARS,
+                       payment_factors=PAYMENT_FACTORS):
+    """Monthly payments for ages age..age+years (as far as terms are offered) x single pays.
+
+    Returns rows of (age, single_pay, amount_financed, payments) where payments maps
+    each term to its monthly payment, or None where the term is not offered.
+    """
+    table = factor_table(payment_factors)
+    ages = [each for each in range(age, age + years + 1) if 0 <= each < len(table) and table[each]]
+    if not ages:
+        raise ValueError(f"Age {age} is out of supported range")
+
+    financed = [(Money.parse(single_pay), amount_to_finance(total_preplanned, single_pay))
+                for single_pay in single_pays]
+    rows = []
+    for each in ages:
+        for single_pay, amount in financed:
+            if amount <= 0:
+                payments = {term: ZERO for term in PAYMENT_TERMS}
+            else:
+                payments = {term: amount.percent(factor) if factor is not None else None
+                            for term, factor in zip(PAYMENT_TERMS, table[each])}
+            rows.append((each, single_pay, max(amount, ZERO), payments))
+    return rows
+
+
+def apply_quantities(values):
+    """Fill B5, B6 and D7 from the cards, guest book and death certificate quantities"""
+    for qty_key, field, price in (("Cards_Qty", "B5", CARD_PRICE),
+                                  ("Guest_Book_Qty", "B6", GUEST_BOOK_PRICE),
+                                  ("Death_Certificates_Quantity", "D7", DEATH_CERTIFICATE_PRICE)):
+        quantity = values.get(qty_key)
+        if quantity in (None, ''):
+            continue
+        try:
+            values[field] = f"{int(quantity) * price:.2f}"
+        except ValueError:
+            values[field] = ""
+    return values
+
+
+def prepare_values(values):
+    """Copy of a saved plan with quantities, Journey Home and age applied the way the form does"""
+    values = dict(values)
+    apply_quantities(values)
+
+    # Single Pay Journey Home moves the Journey Home amount from 3E to 4C
+    if values.get("-SINGLE_PAY_JH-") and values.get("3E Journey Home"):
+        values["4C Single Pay Journey Home"] = values["3E Journey Home"]
+        values["3E Journey Home"] = ""
+
+    if not values.get("-AGE-") and values.get("-BIRTHDATE-"):
+        try:
+            values["-AGE-"] = str(calculate_age(values["-BIRTHDATE-"]))
+        except ValueError:
+            values["-AGE-"] = ""
+    return values
+
+
+def quote(values, gst_fields=GST_FIELDS, pst_fields=PST_FIELDS, payment_factors=PAYMENT_FACTORS):
+    """Run the full totals/tax/payment chain on a plain dict of form keys.
+
+    Returns a new dictionary with every calculated field formatted the way the
+    form displays it, plus the raw monthly payments under '-MONTHLY-PAYMENTS-'.
+    An age the payment factors don't cover doesn't stop the quote: like the
+    window, no term is offered and the problem is kept under '-AGE-ERROR-'.
+    """
+    values = prepare_values(values)
+    totals = calculate_grand_total(values, gst_fields, pst_fields)
+    for key, amount in totals.items():
+        values[key] = format_dollars(amount)
+
+    monthly_payments = {}
+    values["-AGE-ERROR-"] = ""
+    if values.get("-AGE-"):
+        try:
+            monthly_payments = calculate_monthly_payments(
+                parse_or_zero(values["Total 3"]),
+                parse_or_zero(values.get("4A Single Pay")),
+                int(str(values["-AGE-"]).strip()),
+                payment_factors
+            )
+        except ValueError as e:
+            values["-AGE-ERROR-"] = str(e)
+            monthly_payments = {term: None for term in PAYMENT_TERMS}
+        selected_term = values.get("Payment Term")
+        if selected_term in monthly_payments:
+            payment = monthly_payments[selected_term]
+            values["4B Time Pay"] = format_dollars(payment) if payment is not None else ""
+    values['-MONTHLY-PAYMENTS-'] = monthly_payments
+
+    values["Total 4 \\(ABCD\\)"] = format_dollars(calculate_section_4_total(values))
+    return values
@@ -0,0 +1,187 @@
+"""Dependency graph for the calculated form fields.
+
+Every calculated field declares the fields it reads. When an input changes only
+the calculated fields downstream of it are recomputed, propagation stops at any
+field whose value did not change, and only fields whose displayed text changed
+are handed back to be repainted.
+
+    A1..A9H -> Total A -+
+    B1..B7  -> Total B -+-> Total (ABC) -+
+    C1..C10 -> Total C -+                +-> Grand Total -> 3A -> Total 3 -> monthly payments -> 4B -> Total 4
+    discount rows -> Discount -> GST ----+
+    B1..C7 (+ Casket) -> PST ------------+
+    D1..D8  -> Total D ------------------+
+"""
+import logging
+from collections import defaultdict
+from graphlib import TopologicalSorter
+
+import pricing
+from money import ZERO, Money, parse_or_zero
+
+DISCOUNTS = '-DISCOUNTS-'  # Stands in for every ('-DISCOUNT-AMT-', i) row
+MONTHLY_PAYMENTS = '-MONTHLY-PAYMENTS-'
+KEEP = object()  # Returned by a node to leave its current value in place
+
+
+def _dollars(value):
+    return "" if value is None else value.format()
+
+
+def _monthly_row(payments):
+    return [payments[term].format() if payments[term] is not None else 'N/A'
+            for term in pricing.PAYMENT_TERMS]
+
+
+class RecalcGraph:
+    """Calculated fields with their inputs, recomputed only when something upstream changes"""
+
+    def __init__(self, gst_fields=pricing.GST_FIELDS, pst_fields=pricing.PST_FIELDS,
+                 payment_factors=pricing.PAYMENT_FACTORS):
+        self.gst_fields = list(gst_fields)
+        self.pst_fields = [field for field in self.gst_fields if field in pst_fields]
+        self.payment_factors = payment_factors
+
+        self.nodes = {}
+        self.dependents = defaultdict(set)
+        for section, fields in pricing.SECTION_FIELDS.items():
+            self.node(f"Total {section}", fields, lambda fields=fields: self.sum(fields))
+        self.node("Total D_2", ["Total D"], lambda: self.values["Total D"])
+        self.node("Total \\(ABC\\)", ["Total A", "Total B", "Total C"],
+                  lambda: self.values["Total A"] + self.values["Total B"] + self.values["Total C"])
+        self.node("Discount", [DISCOUNTS], lambda: sum(self.discounts.values(), ZERO))
+        self.node("GST", self.gst_fields + ["Discount"], self.calculate_gst)
+        self.node("PST", self.pst_fields + ["Casket"], self.calculate_pst)
+        self.node("Grand Total", ["Total \\(ABC\\)", "Discount", "GST", "PST", "Total D"],
+                  lambda: (self.values["Total \\(ABC\\)"] - self.values["Discount"] + self.values["GST"]
+                           + self.values["PST"] + self.values["Total D"]))
+        self.node("3A Goods and Services", ["Grand Total"], lambda: self.values["Grand Total"])
+        self.node("Total 3", ["Grand Total"] + pricing.SECTION_3_FIELDS[1:],
+                  lambda: self.values["Grand Total"] + self.sum(pricing.SECTION_3_FIELDS[1:]))
+        self.node(MONTHLY_PAYMENTS, ["Total 3", "4A Single Pay", "-AGE-"], self.calculate_monthly_payments,
+                  display=lambda payments: None if payments is None else _monthly_row(payments))
+        self.node("4B Time Pay", [MONTHLY_PAYMENTS, "Payment Term"], self.calculate_time_pay)
+        self.node("Total 4 \\(ABCD\\)", pricing.SECTION_4_FIELDS,
+                  lambda: self.sum(pricing.SECTION_4_FIELDS))
+
+        self.order = list(TopologicalSorter(
+            {name: node[0] for name, node in self.nodes.items()}).static_order())
+        self.inputs = [name for name in self.order if name not in self.nodes]
+        self.reset()
+
+    def node(self, name, inputs, function, display=_dollars):
+        self.nodes[name] = (list(inputs), function, display)
+        for key in inputs:
+            self.dependents[key].add(name)
+
+    def reset(self):
+        """Forget every value, e.g. after the form is cleared"""
+        self.values = {}
+        self.cents = {}
+        self.discounts = {}
+        self.displayed = {}
+        self.errors = {}
+        self.dirty = set(self.nodes)
+
+    def amount(self, key):
+        """A field's amount in cents, parsed once when the field was set"""
+        value = self.values.get(key)
+        if key in self.nodes:
+            return value or ZERO
+        return self.cents.get(key, ZERO)
+
+    def sum(self, keys):
+        return sum((self.amount(key) for key in keys), ZERO)
+
+    def calculate_gst(self):
+        return pricing.calculate_gst(self.sum(self.gst_fields), self.values["Discount"])
+
+    def calculate_pst(self):
+        exempt = pricing.pst_exempt_fields(self.values)
+        return pricing.calculate_pst(self.sum(field for field in self.pst_fields if field not in exempt))
+
+    def calculate_monthly_payments(self):
+        age = str(self.values.get("-AGE-") or "").strip()
+        if not age:
+            return None
+        try:
+            return pricing.calculate_monthly_payments(
+                self.values["Total 3"], self.amount("4A Single Pay"), int(age), self.payment_factors)
+        except ValueError:
+            # No term is offered for the age, so a selected term leaves 4B blank as pricing.quote does
+            self.values[MONTHLY_PAYMENTS] = {term: None for term in pricing.PAYMENT_TERMS}
+            raise
+
+    def calculate_time_pay(self):
+        payments = self.values.get(MONTHLY_PAYMENTS)
+        selected_term = self.values.get("Payment Term")
+        if not payments or selected_term not in payments:
+            return KEEP
+        return payments[selected_term]
+
+    def set_value(self, key, value):
+        """Record a changed field and mark everything downstream of it"""
+        if isinstance(key, tuple) and key[0] == '-DISCOUNT-AMT-':
+            amount = parse_or_zero(value)
+            if self.discounts.get(key) != amount:
+                self.discounts[key] = amount
+                self.dirty.update(self.dependents[DISCOUNTS])
+            return
+        if key in self.nodes:
+            # A calculated field typed over by hand keeps that value until its inputs change
+            value = parse_or_zero(value) if value not in (None, "") else None
+            self.displayed[key] = _dollars(value)
+        if self.values.get(key, KEEP) != value:
+            self.values[key] = value
+            self.cents[key] = value if isinstance(value, Money) else parse_or_zero(value)
+            self.dirty.update(self.dependents[key])
+
+    def load(self, values):
+        """Sync every input from a full values dictionary"""
+        for key in self.inputs:
+            if key != DISCOUNTS:
+                self.set_value(key, values.get(key))
+        if "4B Time Pay" in values:
+            self.set_value("4B Time Pay", values["4B Time Pay"])
+        rows = {key for key in values if isinstance(key, tuple) and key[0] == '-DISCOUNT-AMT-'}
+        for key in rows:
+            self.set_value(key, values[key])
+        for key in set(self.discounts) - rows:
+            del self.discounts[key]
+            self.dirty.update(self.dependents[DISCOUNTS])
+
+    def recompute(self):
+        """Recompute the dirty fields in dependency order.
+
+        Returns (changes, errors): the display value of every field whose text
+        changed, and any new calculation errors keyed by field.
+        """
+        changes = {}
+        errors = {}
+        for name in self.order:
+            if name not in self.dirty:
+                continue
+            self.dirty.discard(name)
+            inputs, function, display = self.nodes[name]
+            previous = self.values.get(name, KEEP)
+            try:
+                value = function()
+            except Exception as e:
+                if self.errors.get(name) != str(e):
+                    errors[name] = e
+                self.errors[name] = str(e)
+                logging.error(f"Error calculating {name}: {str(e)}")
+                value = self.values.get(name)
+            else:
+                self.errors.pop(name, None)
+                if value is KEEP:
+                    continue
+                self.values[name] = value
+
+            shown = display(value)
+            if shown is not None and shown != self.displayed.get(name):
+                self.displayed[name] = shown
+                changes[name] = shown
+            if value != previous:
+                self.dirty.update(self.dependents[name])
+        return changes, errors
@@ -0,0 +1,255 @@
+"""Local HTTP service for the quote and fill logic, for the CRM and web intake form.
+
+    GET  /catalog?brand=rob   caskets, urns and packages for the brand
+    POST /quote?brand=rob     JSON form values -> section totals, taxes, payments and the payment factors
+    POST /fill?brand=rob      JSON form values -> zip of the filled PDF set (&format=pdf: one merged PDF,
+                              &flatten=all or e.g. flatten=4,5: bake the values into those forms' pages)
+
+An age past the payment factor table still gets totals and PDFs, without
+monthly payments; the problem comes back as "warning" in the /quote JSON
+and as an X-Autofill-Warning header from /fill.
+
+Request bodies are the same records headless accepts. PDFs are written by the
+shared pdf_templates worker pool, whose processes keep the templates parsed
+between requests; at most that many fills run at once and the rest wait.
+
+    python -m service --port 8765
+"""
+import argparse
+import asyncio
+import io
+import json
+import logging
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import parse_qs, urlsplit
+
+import brands
+import headless
+import pdf_output
+import pdf_templates
+import pricing
+
+MAX_BODY = 1 << 20
+QUOTE_FIELDS = ["Total A", "Total B", "Total C", "Total D", "Total \\(ABC\\)", "Discount", "GST", "PST",
+                "Grand Total"] + pricing.SECTION_3_FIELDS + [
+    "Total 3", "4A Single Pay", "4B Time Pay", "4C Single Pay Journey Home", "4D LPR", "Total 4 \\(ABCD\\)"]
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class PDF(bytes):
+    """A response body to send as application/pdf rather than a zip"""
+    warning = ""
+
+
+class Zip(bytes):
+    """A zip response body"""
+    warning = ""
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class AutofillService:
+    """Request handlers over one validated HeadlessAutofiller per brand"""
+
+    def __init__(self):
+        self.autofillers = {brand: headless.HeadlessAutofiller(brand) for brand in brands.PROFILES}
+        self.templates = [path for autofiller in self.autofillers.values() for path in autofiller.pdf_paths.values()]
+        pdf_templates.get_pool(self.templates)  # Start the workers and parse every template before the first request
+        self.fill_slots = asyncio.Semaphore(pdf_templates.POOL_SIZE)
+
+    def autofiller(self, query):
+        brand = query.get("brand", ["rob"])[0]
+        if brand not in self.autofillers:
+            raise HTTPError(400, f"Unknown brand '{brand}', expected one of {', '.join(self.autofillers)}")
+        return self.autofillers[brand]
+
+    def catalog(self, query, body):
+        profile = self.autofiller(query).profile
+        return {"caskets": profile.caskets, "urns": profile.urns, "packages": profile.packages}
+
+    def quote(self, query, body):
+        values = self.autofiller(query).calculate(read_values(body))
+        payments = values["-MONTHLY-PAYMENTS-"]
+        return {
+            "warning": values["-AGE-ERROR-"] or None,
+            "totals": {key: values.get(key, "") for key in QUOTE_FIELDS},
+            "monthly_payments": {term: None if payment is None else pricing.format_dollars(payment)
+                                 for term, payment in payments.items()},
+            "payment_factors": pricing.PAYMENT_FACTORS
+        }
+
+    async def fill(self, query, body):
+        autofiller = self.autofiller(query)
+        output_format = query.get("format", ["zip"])[0]
+        if output_format not in ("zip", "pdf"):
+            raise HTTPError(400, f"Unknown format '{output_format}', expected zip or pdf")
+        flatten = query.get("flatten", [""])[0]
+        flatten = autofiller.flatten_templates(flatten == "all" or [n for n in flatten.split(",") if n])
+        values, jobs = autofiller.fill_jobs(read_values(body))
+
+        # The workers send the filled PDFs back as bytes; nothing is written to disk
+        async with self.fill_slots:
+            pool = pdf_templates.get_pool(self.templates)
+            if output_format == "pdf":
+                futures = [asyncio.wrap_future(pool.submit(pdf_output.merged_pdf_bytes, jobs, flatten))]
+            else:
+                futures = [asyncio.wrap_future(pool.submit(pdf_templates.fill_pdf_bytes, input_pdf, data_dict, flatten))
+                           for input_pdf, data_dict in jobs.values()]
+            try:
+                filled = await asyncio.gather(*futures)
+            except BrokenProcessPool:
+                pdf_templates.shutdown_pool()  # The next request starts fresh workers
+                raise
+        logging.info(f"Filled {len(jobs)} PDFs for {values['-FIRST-']} {values['-LAST-']} over HTTP")
+        if output_format == "pdf":
+            result = PDF(filled[0])
+        else:
+            archive = io.BytesIO()
+            await asyncio.to_thread(pdf_output.write_zip, dict(zip(jobs, filled)), archive)
+            result = Zip(archive.getvalue())
+        result.warning = values["-AGE-ERROR-"]
+        return result
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        routes = {"/catalog": ("GET", self.catalog), "/quote": ("POST", self.quote), "/fill": ("POST", self.fill)}
+        if url.path not in routes:
+            raise HTTPError(404, f"No endpoint {url.path}")
+        allowed, handler = routes[url.path]
+        if method != allowed:
+            raise HTTPError(405, f"{url.path} expects {allowed}")
+        result = handler(query, body)
+        return await result if asyncio.iscoroutine(result) else result
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection until the client closes it"""
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, body = request
+                warning = ""
+                try:
+                    result = await self.dispatch(method, target, body)
+                    if isinstance(result, PDF):
+                        status, content_type, payload = 200, "application/pdf", bytes(result)
+                        warning = result.warning
+                    elif isinstance(result, Zip):
+                        status, content_type, payload = 200, "application/zip", bytes(result)
+                        warning = result.warning
+                    else:
+                        status, content_type, payload = 200, "application/json", json.dumps(result).encode()
+                except HTTPError as e:
+                    status, content_type, payload = e.status, "application/json", error_body(str(e))
+                except ValueError as e:
+                    # Bad request values, e.g. form numbers to flatten that don't exist
+                    status, content_type, payload = 400, "application/json", error_body(str(e))
+                except Exception as e:
+                    logging.error(f"Error handling {method} {target}: {str(e)}")
+                    status, content_type, payload = 500, "application/json", error_body(str(e))
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(response_head(status, content_type, len(payload), keep_alive, warning) + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except HTTPError as e:
+            payload = error_body(str(e))
+            writer.write(response_head(e.status, "application/json", len(payload), False) + payload)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def read_values(body):
+    try:
+        record = json.loads(body or b"{}")
+    except ValueError as e:
+        raise HTTPError(400, f"Body is not valid JSON: {str(e)}")
+    if not isinstance(record, dict):
+        raise HTTPError(400, "Body must be a JSON object of form values")
+    discounts = record.get("Discounts", [])
+    if not isinstance(discounts, list) or not all(isinstance(row, list) and len(row) == 2 for row in discounts):
+        raise HTTPError(400, "Discounts must be a list of [description, amount] pairs")
+    try:
+        return headless.normalize_values(record)
+    except (TypeError, ValueError) as e:
+        raise HTTPError(400, f"Invalid form values: {str(e)}")
+
+
+async def read_request(reader):
+    """(method, target, headers, body) of the next request, or None at end of stream"""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, _ = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "Malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = headers.get("content-length") or "0"
+    if not (length.isascii() and length.isdigit()):
+        raise HTTPError(400, f"Invalid Content-Length '{length}'")
+    length = int(length)
+    if length > MAX_BODY:
+        raise HTTPError(413, f"Request body over {MAX_BODY} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, body
+
+
+def response_head(status, content_type, length, keep_alive, warning=""):
+    # The warning can quote the client's input; escape anything that isn't printable ASCII
+    warning = warning.encode("unicode_escape").decode("ascii")
+    extra = f"X-Autofill-Warning: {warning}\r\n" if warning else ""
+    return (f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {length}\r\n"
+            f"{extra}"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode("latin-1")
+
+
+def error_body(message):
+    return json.dumps({"error": message}).encode()
+
+
+async def serve(host, port):
+    service = AutofillService()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    logging.info(f"Autofill service listening on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Serve quotes and filled PDFs over local HTTP")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8765)
+    args = arg_parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
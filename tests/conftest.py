@@ -0,0 +1,110 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+FORMS = os.path.join(ROOT, "Forms")
+
+
+class FakeRoot:
+    """Tk's after/after_cancel on a clock the test moves forward"""
+
+    def __init__(self):
+        self.now = 0
+        self.timers = {}
+        self.count = 0
+
+    def after(self, ms, callback):
+        self.count += 1
+        self.timers[self.count] = (self.now + ms, callback)
+        return self.count
+
+    def after_cancel(self, timer):
+        self.timers.pop(timer, None)
+
+    def advance(self, ms):
+        """Run every callback that falls due in the next ms milliseconds, in time order"""
+        end = self.now + ms
+        while True:
+            due = [(when, timer) for timer, (when, _) in self.timers.items() if when <= end]
+            if not due:
+                break
+            when, timer = min(due)
+            self.now = when
+            self.timers.pop(timer)[1]()
+        self.now = end
+
+
+class FakeElement:
+    def __init__(self, value=""):
+        self.value = value
+        self.Widget = None
+
+    def get(self):
+        return self.value
+
+    def update(self, value=None, **kwargs):
+        if value is not None:
+            self.value = value
+        elif "values" in kwargs:
+            self.value = kwargs["values"]
+
+
+class FakeWindow:
+    """The parts of sg.Window the event loop uses; read() hands out queued events"""
+
+    def __init__(self, keys=()):
+        self.elements = {key: FakeElement() for key in keys}
+        self.TKroot = FakeRoot()
+        self.events = []
+        self.closed = False
+
+    @property
+    def AllKeysDict(self):
+        return self.elements
+
+    key_dict = AllKeysDict
+
+    def __getitem__(self, key):
+        return self.elements[key]
+
+    def read(self, timeout=None):
+        event = self.events.pop(0) if self.events else "Exit"
+        if callable(event):
+            event = event()
+        event, value = event if isinstance(event, tuple) else (event, None)
+        values = {key: element.value for key, element in self.elements.items()}
+        if value is not None:
+            values[event] = value
+        return event, values
+
+    def write_event_value(self, key, value):
+        self.events.append((key, value))
+
+    def refresh(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def autofiller(monkeypatch):
+    """A PDFAutofiller on a FakeWindow holding the calculated and priced fields"""
+    import autofill_core
+    import pricing
+    import recalc
+
+    monkeypatch.setattr(autofill_core.PDFAutofiller, "setup_logging", lambda self: None)
+    popups = []
+    monkeypatch.setattr(autofill_core.sg, "popup_error", lambda *args, **kwargs: popups.append(args))
+    filler = autofill_core.PDFAutofiller(headless=True)
+    keys = set(pricing.LINE_ITEMS) | set(recalc.RecalcGraph().nodes) | set(pricing.SECTION_3_FIELDS) | set(
+        pricing.SECTION_4_FIELDS) | {"-AGE-", "Payment Term", "Casket", "-FIRST-", "-LAST-", "-MONTHLY_PAYMENTS_TABLE-"}
+    filler.window = FakeWindow(keys - {recalc.MONTHLY_PAYMENTS})
+    filler.deferred_tabs = {}
+    filler.current_monthly_payments = {}
+    filler.popups = popups
+    return filler
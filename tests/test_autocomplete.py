@@ -0,0 +1,126 @@
+import pytest
+
+import autocomplete
+import catalog_search
+import catalogs
+from conftest import FakeWindow
+
+
+class FakeWidget:
+    def __init__(self, x=0, y=0):
+        self.x, self.y = x, y
+        self.bindings = {}
+
+    def bind(self, sequence, callback, add=None):
+        self.bindings.setdefault(sequence, []).append(callback)
+
+    def winfo_rootx(self):
+        return self.x
+
+    def winfo_rooty(self):
+        return self.y
+
+    def winfo_height(self):
+        return 20
+
+
+class FakeListbox:
+    def __init__(self):
+        self.rows = []
+        self.placed = None
+        self.selection = ()
+        self.edits = []
+
+    def delete(self, first, last):
+        self.edits.append(("delete", first, last))
+        del self.rows[first:last + 1]
+
+    def insert(self, index, *items):
+        self.edits.append(("insert", index, len(items)))
+        self.rows[index:index] = items
+
+    def place(self, **kwargs):
+        self.placed = kwargs
+
+    def place_forget(self):
+        self.placed = None
+
+    def curselection(self):
+        return self.selection
+
+    def get(self, index):
+        return self.rows[index]
+
+
+@pytest.fixture
+def completer(monkeypatch):
+    window = FakeWindow(["Casket", "Urn"])
+    window["Casket"].Widget = FakeWidget(10, 100)
+    window["Urn"].Widget = FakeWidget(10, 300)
+    window.TKroot.winfo_rootx = window.TKroot.winfo_rooty = lambda: 0
+    monkeypatch.setattr(autocomplete.time, "monotonic", lambda: window.TKroot.now / 1000)
+
+    picked = []
+    completer = autocomplete.Autocomplete(window, {"Casket": (catalogs.CASKETS, "C1"), "Urn": (catalogs.URNS, "C5")},
+                                          lambda *args: picked.append(args))
+    completer.listbox = FakeListbox()
+    completer.picked = picked
+    return completer
+
+
+def test_one_list_serves_every_registered_input(completer):
+    completer.update("Casket", "pine")
+    assert completer.listbox.rows == catalog_search.catalog_index(catalogs.CASKETS).search("pine")
+    assert completer.listbox.placed["y"] == 120
+
+    completer.update("Urn", "maple")
+    assert completer.listbox.rows == catalog_search.catalog_index(catalogs.URNS).search("maple")
+    assert completer.listbox.placed["y"] == 320
+
+    # Each input is bound once, and leaving an input only hides the list if it's showing for that input
+    completer.update("Casket", "pin")
+    assert len(completer.window["Casket"].Widget.bindings["<FocusOut>"]) == 1
+    completer.window["Urn"].Widget.bindings["<FocusOut>"][0](None)
+    assert completer.listbox.placed is not None
+    completer.window["Casket"].Widget.bindings["<FocusOut>"][0](None)
+    assert completer.listbox.placed is None
+
+
+def test_picking_an_item_hands_back_its_price(completer):
+    completer.update("Urn", "cardboard")
+    completer.listbox.selection = (completer.listbox.rows.index("Basic Cardboard Urn"),)
+    completer._select(None)
+    assert completer.picked == [("Urn", "Basic Cardboard Urn", "C5", 35.0)]
+    assert completer.listbox.placed is None and completer.timer is None
+
+
+def test_typing_more_only_edits_the_rows_that_change(completer):
+    completer.update("Casket", "oak")
+    completer.listbox.edits.clear()
+    completer.update("Casket", "oak")
+    assert completer.listbox.edits == []
+
+
+def test_the_list_hides_after_inactivity_from_one_timer(completer):
+    root = completer.window.TKroot
+    completer.update("Casket", "pine")
+    completer.update("Casket", "pine b")
+    assert len(root.timers) == 1
+
+    root.advance(5000)
+    completer.touch()  # e.g. scrolling the list
+    root.advance(2000)
+    assert completer.listbox.placed is not None
+    assert len(root.timers) == 1  # Re-armed for the time left since the activity
+
+    root.advance(4999)
+    assert completer.listbox.placed is not None
+    root.advance(1)
+    assert completer.listbox.placed is None
+    assert root.timers == {} and completer.timer is None
+
+
+def test_hiding_cancels_the_timer(completer):
+    completer.update("Casket", "pine")
+    completer.hide()
+    assert completer.window.TKroot.timers == {}
@@ -0,0 +1,92 @@
+import PySimpleGUI as sg
+import pytest
+
+from conftest import FakeElement
+
+
+def run_events(autofiller, *events):
+    autofiller.validate_pdf_mappings = lambda: None
+    autofiller.window.events.extend(events)
+    autofiller.run()
+
+
+def test_autofill_sees_the_totals_of_an_edit_still_waiting_on_the_debounce(autofiller):
+    seen = []
+    autofiller.autofill_pdfs = seen.append
+    autofiller.window["A1"].value = "500.00"
+    autofiller.recalculate("A1")  # Queued for RECALC_DELAY_MS, then Autofill is clicked
+
+    run_events(autofiller, "Autofill PDFs")
+    assert seen[0]["A1"] == "500.00"
+    assert seen[0]["Total A"] == "500.00"
+    assert seen[0]["Grand Total"] == "525.00"
+    assert not autofiller.recalc_pending and autofiller.recalc_timer is None
+
+
+def test_an_unreadable_key_doesnt_drop_the_other_queued_edits(autofiller):
+    autofiller.window["B2"].value = "200.00"
+    autofiller.recalculate("B2", "Not built yet")
+    autofiller.window.TKroot.advance(autofiller.RECALC_DELAY_MS)
+    assert autofiller.window["Total B"].value == "200.00"
+    assert autofiller.window["PST"].value == "14.00"
+
+
+def test_calculation_errors_share_one_popup(autofiller):
+    graph = autofiller.recalc
+
+    def fail(message):
+        def function():
+            raise ValueError(message)
+        return function
+
+    for name in ("GST", "PST"):
+        inputs, _, display = graph.nodes[name]
+        graph.nodes[name] = (inputs, fail(f"{name} failed"), display)
+    autofiller.window["B2"].value = "200.00"
+    autofiller.recalculate("B2")
+    autofiller.window.TKroot.advance(autofiller.RECALC_DELAY_MS)
+    assert len(autofiller.popups) == 1
+    assert "GST failed" in autofiller.popups[0][0] and "PST failed" in autofiller.popups[0][0]
+
+
+@pytest.fixture
+def deferred(autofiller):
+    """Three deferred tabs whose build is recorded, each adding one input to the window"""
+    built = []
+    autofiller.deferred_tabs = {'-TAB-PACKAGES-': "-PACKAGE-", '-TAB-TIME-PAY-': "Payment Term",
+                                '-TAB-OTHER-INFO-': "-BENEFICIARY-"}
+
+    def build_tab(tab_key):
+        key = autofiller.deferred_tabs.pop(tab_key, None)
+        if key is not None:
+            built.append(tab_key)
+            autofiller.window.elements[key] = FakeElement(f"{key} default")
+    autofiller.build_tab = build_tab
+
+    timeouts = []
+    read = autofiller.window.read
+    autofiller.window.read = lambda timeout=None: timeouts.append(timeout) or read(timeout)
+    autofiller.built, autofiller.timeouts = built, timeouts
+    return autofiller
+
+
+def test_idle_reads_build_the_remaining_tabs_in_order(deferred):
+    run_events(deferred, sg.TIMEOUT_EVENT, sg.TIMEOUT_EVENT, sg.TIMEOUT_EVENT)
+    assert deferred.built == ['-TAB-PACKAGES-', '-TAB-TIME-PAY-', '-TAB-OTHER-INFO-']
+    # Reads only time out while there's a tab left to build
+    assert deferred.timeouts == [deferred.IDLE_BUILD_MS] * 3 + [None]
+
+
+def test_visiting_a_tab_builds_it_first(deferred):
+    run_events(deferred, ('-TABS-', '-TAB-OTHER-INFO-'), ('-TABS-', '-TAB-OTHER-INFO-'), sg.TIMEOUT_EVENT)
+    assert deferred.built == ['-TAB-OTHER-INFO-', '-TAB-PACKAGES-']
+    assert list(deferred.deferred_tabs) == ['-TAB-TIME-PAY-']
+
+
+def test_a_whole_form_event_builds_every_tab_and_sees_their_values(deferred):
+    seen = []
+    deferred.autofill_pdfs = seen.append
+    run_events(deferred, sg.TIMEOUT_EVENT, "Autofill PDFs")
+    assert deferred.built == ['-TAB-PACKAGES-', '-TAB-TIME-PAY-', '-TAB-OTHER-INFO-']
+    assert seen[0]["-BENEFICIARY-"] == "-BENEFICIARY- default"
+    assert deferred.timeouts[-1] is None
@@ -0,0 +1,50 @@
+import random
+
+import batch_pricing
+import pricing
+from money import ZERO, Money, parse_or_zero
+
+PRICED_FIELDS = ["Total A", "Total B", "Total C", "Total D", "Total D_2", "Total \\(ABC\\)", "Discount", "GST",
+                 "PST", "Grand Total", "3A Goods and Services", "Total 3", "4B Time Pay", "Total 4 \\(ABCD\\)"]
+
+
+def amount(rng):
+    return rng.choice(["", "0.00", f"{rng.randint(0, 500000) / 100:.2f}", f"{rng.randint(0, 2000)}"])
+
+
+def random_plan(rng):
+    plan = {field: amount(rng) for field in pricing.LINE_ITEMS if rng.random() < 0.3}
+    for field in pricing.SECTION_3_FIELDS[1:] + pricing.SECTION_4_FIELDS:
+        if rng.random() < 0.3:
+            plan[field] = amount(rng)
+    for i in range(rng.randint(0, 2)):
+        plan[('-DISCOUNT-DESC-', i)] = "Discount"
+        plan[('-DISCOUNT-AMT-', i)] = amount(rng)
+    if rng.random() < 0.8:
+        plan["-AGE-"] = str(rng.randint(0, 100))
+    if rng.random() < 0.7:
+        plan["Payment Term"] = rng.choice(pricing.PAYMENT_TERMS)
+    if rng.random() < 0.1:
+        plan["Casket"] = "Basic Cremation Container"
+    return plan
+
+
+def test_price_plans_matches_quote_on_random_plans():
+    rng = random.Random(8)
+    plans = [random_plan(rng) for _ in range(3000)]
+    results = batch_pricing.price_plans(batch_pricing.to_columns(plans))
+
+    for i, plan in enumerate(plans):
+        quote = pricing.quote(plan)
+        totals = batch_pricing.plan_totals(results, i)
+        assert {field: totals[field] for field in PRICED_FIELDS} == \
+               {field: parse_or_zero(quote.get(field)) for field in PRICED_FIELDS}, plan
+        assert totals["-MONTHLY-PAYMENTS-"] == (quote["-MONTHLY-PAYMENTS-"] or {
+            term: ZERO for term in pricing.PAYMENT_TERMS}), plan
+        assert bool(results["-AGE-ERROR-"][i]) == bool(quote["-AGE-ERROR-"]), plan
+
+
+def test_typed_time_pay_counts_without_a_term():
+    plan = {"A1": "1,000.00", "-AGE-": "60", "4A Single Pay": "100.00", "4B Time Pay": "45.50"}
+    results = batch_pricing.price_plans(batch_pricing.to_columns([plan]))
+    assert batch_pricing.plan_totals(results, 0)["Total 4 \\(ABCD\\)"] == Money.parse("145.50")
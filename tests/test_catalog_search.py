@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+import catalog_search
+import catalogs
+
+CATALOGS = {name: catalog for name, catalog in vars(catalogs).items()
+            if name.isupper() and isinstance(catalog, dict) and catalog}
+
+
+def scan(catalog, text):
+    """The old lookup: every name containing the text, in catalog order"""
+    return [name for name in catalog if text.strip().lower() in name.lower()]
+
+
+def queries(catalog, rng):
+    """Prefixes, inner substrings and words of the names, plus a few random strings"""
+    found = set()
+    for name in catalog:
+        lowered = name.lower()
+        found.add(lowered[:rng.randint(1, len(lowered))])
+        start = rng.randrange(len(lowered))
+        found.add(lowered[start:start + rng.randint(1, 6)])
+        found.update(lowered.split())
+        found.add(name.upper())
+    found.update("".join(rng.choice("aeinorst ") for _ in range(rng.randint(1, 4))) for _ in range(30))
+    return sorted(text for text in found if text.strip())
+
+
+def assert_substring_matches_first(index, catalog, text):
+    expected = scan(catalog, text)
+    results = index.search(text)
+    assert set(results[:len(expected)]) == set(expected), text
+    assert len(results) == len(set(results)), text
+    # Prefix matches first, then word starts, then any other substring, each in catalog order
+    lowered = text.strip().lower()
+    rank = {name: (0 if name.lower().startswith(lowered)
+                   else 1 if any(word.startswith(lowered) for word in catalog_search.WORD.findall(name.lower()))
+                   else 2) for name in expected}
+    order = list(catalog)
+    assert results[:len(expected)] == sorted(expected, key=lambda name: (rank[name], order.index(name))), text
+
+
+@pytest.mark.parametrize("name", sorted(CATALOGS))
+def test_search_returns_every_substring_match_first(name):
+    catalog = CATALOGS[name]
+    index = catalog_search.CatalogIndex(catalog)
+    for text in queries(catalog, random.Random(name)):
+        assert_substring_matches_first(index, catalog, text)
+
+
+@pytest.mark.parametrize("name", sorted(CATALOGS))
+def test_typing_narrows_to_the_same_matches(name):
+    """Each keystroke reuses the previous result, so type names out and back one character at a time"""
+    catalog = CATALOGS[name]
+    index = catalog_search.CatalogIndex(catalog)
+    for full in list(catalog)[:40]:
+        for n in list(range(1, len(full) + 1)) + list(range(len(full) - 1, 0, -1)):
+            assert_substring_matches_first(index, catalog, full[:n])
+
+
+def test_empty_text_lists_the_whole_catalog():
+    assert catalog_search.CatalogIndex(catalogs.CASKETS).search("  ") == list(catalogs.CASKETS)
+
+
+def test_words_in_any_order_follow_the_substring_matches():
+    results = catalog_search.CatalogIndex(catalogs.CASKETS).search("pine brownsville")
+    assert not scan(catalogs.CASKETS, "pine brownsville")
+    assert results[:2] == ["Brownsville Pine", "Brownsville Pine (oversize)"]
+
+
+def test_close_names_follow_for_typos():
+    index = catalog_search.CatalogIndex(catalogs.CASKETS)
+    results = index.search("brwnsville pine")
+    assert results[0] == "Brownsville Pine"
+    assert len(results) <= catalog_search.FUZZY_LIMIT
+
+
+def test_close_names_come_after_the_substring_matches():
+    index = catalog_search.CatalogIndex(catalogs.CASKETS)
+    expected = scan(catalogs.CASKETS, "cedar")
+    results = index.search("cedar")
+    assert 0 < len(expected) < catalog_search.FUZZY_LIMIT
+    assert results[:len(expected)] == [name for name in catalogs.CASKETS if name in expected]
+    assert len(results) <= catalog_search.FUZZY_LIMIT
+
+
+def test_catalog_index_is_built_once_per_catalog():
+    assert catalog_search.catalog_index(catalogs.URNS) is catalog_search.catalog_index(catalogs.URNS)
+
+
+def test_listbox_edit_replaces_only_the_changed_rows():
+    shown = ["a", "b", "c", "d"]
+    for items in (["a", "x", "d"], [], ["a", "b", "c", "d", "e"], ["z"], shown):
+        start, stop, inserted = catalog_search.listbox_edit(shown, items)
+        assert shown[:start] + inserted + shown[stop:] == items
+
+
+@pytest.mark.parametrize("items, edit", [
+    (["a", "x", "d"], (1, 3, ["x"])),
+    (["a", "b", "c", "d", "e"], (4, 4, ["e"])),
+    (["b", "c", "d"], (0, 1, [])),
+    (["a", "b", "c", "d"], (4, 4, [])),
+    (["z"], (0, 4, ["z"])),
+])
+def test_listbox_edit_keeps_the_matching_ends(items, edit):
+    assert catalog_search.listbox_edit(["a", "b", "c", "d"], items) == edit
+
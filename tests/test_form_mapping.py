@@ -0,0 +1,39 @@
+import copy
+import os
+
+import pytest
+
+import brands
+import form_mapping
+import pdf_templates
+from conftest import FORMS, ROOT
+
+pytestmark = pytest.mark.skipif(not os.path.isdir(FORMS), reason="Forms/ templates not present")
+
+
+@pytest.fixture(scope="module", params=sorted(brands.PROFILES))
+def brand(request):
+    profile = brands.PROFILES[request.param]
+    schemas = {pdf: pdf_templates.template_cache.get(path).schema
+               for pdf, path in form_mapping.pdf_paths(ROOT, profile).items()}
+    return profile, schemas
+
+
+def test_the_shipped_mappings_match_the_templates(brand):
+    profile, schemas = brand
+    assert form_mapping.validate_mappings(profile, schemas) == {}
+
+
+def test_missing_fields_and_wrong_field_types_are_reported_per_form(brand):
+    profile, schemas = brand
+    schemas = copy.deepcopy(schemas)
+    rows = form_mapping.mapping_rows(profile, 1)
+    text = next(row[0] for row in rows if not form_mapping.is_checkbox(row))
+    checkbox = next(row[0] for row in rows if form_mapping.is_checkbox(row))
+    del schemas[1][text]
+    schemas[1][checkbox]["type"] = "Tx"
+
+    problems = form_mapping.validate_mappings(profile, schemas)
+    assert list(problems) == [1]
+    assert sorted(problems[1]) == sorted([f"no field named '{text}'",
+                                          f"'{checkbox}' is mapped as a checkbox but is a Tx field"])
@@ -0,0 +1,52 @@
+import json
+import os
+import shutil
+
+import pytest
+
+import form_schema
+import pdf_templates
+from conftest import FORMS
+
+TRUSTAGE = os.path.join(FORMS, "Protector Plus TruStage Application form - New.pdf")
+
+pytestmark = pytest.mark.skipif(not os.path.exists(TRUSTAGE), reason="Forms/ templates not present")
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Paths the schema loader had to parse"""
+    parsed = []
+    cache = pdf_templates.TemplateCache()
+    monkeypatch.setattr(pdf_templates, "template_cache", cache)
+    get = cache.get
+    monkeypatch.setattr(cache, "get", lambda path: parsed.append(os.path.basename(path)) or get(path))
+    return parsed
+
+
+def test_schemas_are_parsed_once_and_again_when_the_file_changes(tmp_path, parses):
+    template = tmp_path / "form.pdf"
+    shutil.copyfile(TRUSTAGE, template)
+
+    schemas = form_schema.load_schemas(tmp_path, {1: str(template)})
+    assert parses == ["form.pdf"]
+    assert schemas[1]["10-year"] == {"type": "Btn", "on": ["Yes"]}
+    index = json.loads((tmp_path / form_schema.SCHEMA_FILE).read_text(encoding="utf-8"))
+    assert index["form.pdf"]["sha256"] == form_schema.file_hash(template)
+
+    assert form_schema.load_schemas(tmp_path, {1: str(template)}) == schemas
+    assert parses == ["form.pdf"]
+
+    with open(template, "ab") as f:
+        f.write(b"\n% edited\n")
+    assert form_schema.load_schemas(tmp_path, {1: str(template)}) == schemas
+    assert parses == ["form.pdf", "form.pdf"]
+
+
+def test_an_unreadable_index_is_rebuilt(tmp_path, parses):
+    shutil.copyfile(TRUSTAGE, tmp_path / "form.pdf")
+    (tmp_path / form_schema.SCHEMA_FILE).write_text("{not json", encoding="utf-8")
+
+    assert "10-year" in form_schema.load_schemas(tmp_path, {1: str(tmp_path / "form.pdf")})[1]
+    assert parses == ["form.pdf"]
+    assert "form.pdf" in json.loads((tmp_path / form_schema.SCHEMA_FILE).read_text(encoding="utf-8"))
@@ -0,0 +1,73 @@
+import csv
+import os
+
+import pytest
+
+import headless
+from conftest import FORMS
+
+pytestmark = pytest.mark.skipif(not os.path.isdir(FORMS), reason="Forms/ templates not present")
+
+
+def test_batch_fills_a_client_past_the_payment_factor_table(tmp_path):
+    clients = tmp_path / "clients.csv"
+    clients.write_text("-FIRST-,-LAST-,-AGE-,A1,Payment Term\n"
+                       "Ann,Lee,60,2500.00,5-year\n"
+                       "Bob,Ray,91,2500.00,5-year\n", encoding="utf-8")
+    output_dir = tmp_path / "out"
+
+    assert headless.run_batch([str(clients)], output_dir=output_dir, jobs=1) == (2, 0)
+
+    with open(output_dir / "batch_summary.csv", encoding="utf-8") as f:
+        rows = {row["Client"]: row for row in csv.DictReader(f)}
+    assert rows["Ann Lee"]["Status"] == "Done" and rows["Ann Lee"]["Warning"] == ""
+    assert rows["Bob Ray"]["Status"] == "Done"
+    assert rows["Bob Ray"]["Warning"] == "Age 91 is out of supported range"
+    assert len(list((output_dir / "Bob Ray").glob("*.pdf"))) == 5
+
+
+def test_summary_rows_follow_the_input_and_unreadable_amounts_fail(tmp_path):
+    clients = tmp_path / "clients.csv"
+    clients.write_text("-FIRST-,-LAST-,-AGE-,A1,Payment Term\n"
+                       "Ann,Lee,60,2500.00,5-year\n"
+                       "Cy,Ho,60,abc,5-year\n"
+                       "Bob,Ray,91,2500.00,5-year\n"
+                       "Di,Fox,70,1200.00,3-year\n", encoding="utf-8")
+    output_dir = tmp_path / "out"
+
+    assert headless.run_batch([str(clients)], output_dir=output_dir, jobs=2) == (3, 1)
+
+    with open(output_dir / "batch_summary.csv", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["Row"] for row in rows] == ["1", "2", "3", "4"]
+    assert rows[1]["Status"] == "Failed"
+    assert rows[1]["Error"] == "A1: 'abc' is not a dollar amount"
+    assert not (output_dir / "Cy Ho").exists()
+    assert rows[2]["Warning"] == "Age 91 is out of supported range"
+
+
+def test_normalize_values_rejects_unreadable_discounts():
+    with pytest.raises(ValueError, match="Discount: 'ten' is not a dollar amount"):
+        headless.normalize_values({"A1": "100", "Discounts": [["Cadence", "ten"]]})
+    assert headless.normalize_values({"A1": "$1,200.50", "3E Journey Home": ""})["A1"] == "$1,200.50"
+
+
+@pytest.mark.parametrize("argv, inputs, flatten", [
+    (["a.csv", "b.csv"], ["a.csv", "b.csv"], False),
+    (["a.csv", "b.csv", "--flatten"], ["a.csv", "b.csv"], True),
+    (["--flatten=1,3", "a.csv", "b.csv"], ["a.csv", "b.csv"], [1, 3]),
+    (["--flatten", "2", "a.csv"], ["a.csv"], [2]),
+])
+def test_flatten_leaves_the_inputs_alone(monkeypatch, argv, inputs, flatten):
+    calls = []
+    monkeypatch.setattr(headless, "run_batch", lambda *args: calls.append(args) or (len(args[0]), 0))
+    assert headless.main(argv) == 0
+    assert calls[0][0] == inputs
+    assert calls[0][-1] == flatten
+
+
+@pytest.mark.parametrize("argv", [["--flatten", "a.csv"], ["--flatten=6", "a.csv"], ["--flatten=1,x", "a.csv"]])
+def test_flatten_rejects_anything_but_form_numbers(argv):
+    with pytest.raises(SystemExit) as error:
+        headless.main(argv)
+    assert error.value.code == 2
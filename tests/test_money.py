@@ -0,0 +1,86 @@
+import locale
+
+import pytest
+
+from money import ZERO, Money, parse_or_zero
+import pricing
+
+
+@pytest.mark.parametrize("taxable, gst", [
+    ("0.10", "0.01"),     # 0.5 cent
+    ("0.30", "0.02"),     # 1.5 cents
+    ("10.10", "0.51"),    # 50.5 cents
+    ("10.30", "0.52"),    # 51.5 cents
+    ("0.09", "0.00"),     # 0.45 cent
+    ("-0.10", "-0.01"),   # a discount larger than the taxable items rounds away from zero
+])
+def test_gst_rounds_half_cents_up(taxable, gst):
+    assert pricing.calculate_gst(Money.parse(taxable), ZERO) == Money.parse(gst)
+
+
+@pytest.mark.parametrize("base, pst", [
+    ("0.50", "0.04"),     # 3.5 cents
+    ("1.50", "0.11"),     # 10.5 cents
+    ("7.50", "0.53"),     # 52.5 cents
+    ("0.07", "0.00"),     # 0.49 cent
+])
+def test_pst_rounds_half_cents_up(base, pst):
+    assert pricing.calculate_pst(Money.parse(base)) == Money.parse(pst)
+
+
+def test_gst_is_taken_after_the_discount():
+    assert pricing.calculate_gst(Money.parse("100.10"), Money.parse("0.30")) == Money.parse("4.99")
+
+
+@pytest.mark.parametrize("rate", [pricing.GST_RATE, pricing.PST_RATE])
+def test_taxes_match_the_old_float_math_away_from_half_cents(rate):
+    for cents in range(0, 500000, 37):
+        if cents * round(rate * 100) % 100 == 50:
+            continue  # Exactly half a cent, where the old '%.2f' of a float could go either way
+        old = f"{cents / 100 * rate:.2f}"
+        assert str(Money(cents).percent(rate)) == old, cents
+
+
+@pytest.mark.parametrize("text, cents", [
+    ("$1,234.50", 123450),
+    ("12.", 1200),
+    (".5", 50),
+    ("1.005", 101),
+    ("1.004", 100),
+    ("-0.5", -50),
+    ("", 0),
+    (None, 0),
+    (12.345, 1235),
+])
+def test_parse(text, cents):
+    assert Money.parse(text) == cents
+
+
+def test_parse_rejects_text_and_parse_or_zero_treats_it_as_zero():
+    with pytest.raises(ValueError):
+        Money.parse("12a")
+    assert parse_or_zero("12a") == ZERO
+
+
+@pytest.fixture
+def conventions(monkeypatch):
+    """Stand-in locale conventions, since the test machine may only have the C locale"""
+    current = locale.localeconv()
+
+    def use(thousands_sep, decimal_point):
+        monkeypatch.setattr(locale, "localeconv", lambda: dict(
+            current, grouping=[3, 0], thousands_sep=thousands_sep, decimal_point=decimal_point))
+    return use
+
+
+def test_format_groups_with_the_locale(conventions):
+    conventions(",", ".")
+    assert Money(123456789).format() == "1,234,567.89"
+    assert Money(-100005).format() == "-1,000.05"
+    assert Money(123456789).format(grouping=False) == "1234567.89"
+    assert str(Money(5)) == "0.05"
+
+
+def test_format_uses_the_locale_separators(conventions):
+    conventions(" ", ",")
+    assert Money(123456789).format() == "1 234 567,89"
@@ -0,0 +1,83 @@
+import io
+import os
+import re
+import zipfile
+
+import pdfrw
+import pytest
+
+import pdf_output
+import pdf_templates
+from conftest import FORMS
+
+TRUSTAGE = os.path.join(FORMS, "Protector Plus TruStage Application form - New.pdf")
+
+pytestmark = pytest.mark.skipif(not os.path.exists(TRUSTAGE), reason="Forms/ templates not present")
+
+
+def merged(*data_dicts):
+    copies = [pdf_templates.template_cache.get(TRUSTAGE).copy().fill(data) for data in data_dicts]
+    # These templates leave out the optional /P; many PDF producers write it
+    for copy in copies:
+        for page in pdf_templates.iter_pages(copy.trailer.Root.Pages):
+            for annotation in page.Annots or []:
+                annotation.P = page
+    buffer = io.BytesIO()
+    pdf_output.merge_copies(copies, buffer)
+    return buffer.getvalue()
+
+
+def test_merged_widgets_point_at_the_written_pages():
+    pdf_bytes = merged({"1-year": "On"}, {"3-year": "On"})
+    pages = pdfrw.PdfReader(fdata=pdf_bytes).pages
+    page_ids = {id(page) for page in pages}
+    widgets = [annotation for page in pages for annotation in page.Annots or [] if annotation.P is not None]
+    assert widgets and all(id(annotation.P) in page_ids for annotation in widgets)
+
+    # No orphaned page dictionaries or page trees from the copies
+    assert len(re.findall(rb"/Type\s*/Pages\b", pdf_bytes)) == 1
+    assert len(re.findall(rb"/Type\s*/Page\b", pdf_bytes)) == len(pages)
+
+
+def test_zip_holds_each_pdf_under_its_output_name():
+    jobs = {"1. Application - Ann Lee.pdf": (TRUSTAGE, {"3-year": "On"}),
+            "2. Application copy - Ann Lee.pdf": (TRUSTAGE, {})}
+    buffer = io.BytesIO()
+    pdf_output.fill_zip(jobs, buffer)
+
+    with zipfile.ZipFile(buffer) as archive:
+        assert archive.namelist() == list(jobs)
+        assert all(archive.read(name).startswith(b"%PDF") for name in jobs)
+
+
+def test_a_failed_form_writes_nothing(tmp_path):
+    jobs = {"1.pdf": (TRUSTAGE, {}), "2.pdf": (str(tmp_path / "missing.pdf"), {})}
+    buffer = io.BytesIO()
+    with pytest.raises(OSError):
+        pdf_output.fill_zip(jobs, buffer)
+    assert buffer.getvalue() == b""
+
+
+def test_merged_fields_are_grouped_per_form_and_keep_their_own_values():
+    reader = pdfrw.PdfReader(fdata=merged({"3-year": "On"}, {"5-year": "On"}))
+    assert [field.T.to_unicode() for field in reader.Root.AcroForm.Fields] == ["Form 1", "Form 2"]
+
+    states = {}
+    for page in reader.pages:
+        for annotation in page.Annots or []:
+            if annotation.T and annotation.T.to_unicode() in ("3-year", "5-year"):
+                states[pdf_templates.field_key(annotation)] = annotation.AS
+    assert states == {"Form 1.3-year": "/Yes", "Form 1.5-year": "/Off",
+                      "Form 2.3-year": "/Off", "Form 2.5-year": "/Yes"}
+
+
+def test_merged_forms_share_identical_appearance_streams():
+    reader = pdfrw.PdfReader(fdata=merged({}, {}))
+    widgets = {}
+    for page in reader.pages:
+        for annotation in page.Annots or []:
+            if annotation.T and annotation.T.to_unicode() == "1-year":
+                widgets[pdf_templates.field_key(annotation)] = annotation
+    first, second = widgets["Form 1.1-year"], widgets["Form 2.1-year"]
+    assert first is not second
+    assert first.AP.N.Off is second.AP.N.Off and first.AP.N.Yes is second.AP.N.Yes
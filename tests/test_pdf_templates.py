@@ -0,0 +1,117 @@
+import io
+import os
+import threading
+
+import pdfrw
+import pytest
+
+import pdf_templates
+from conftest import FORMS
+
+TRUSTAGE = os.path.join(FORMS, "Protector Plus TruStage Application form - New.pdf")
+TERMS = ["1-year", "3-year", "5-year", "10-year", "15-year", "20-year"]
+
+pytestmark = pytest.mark.skipif(not os.path.exists(TRUSTAGE), reason="Forms/ templates not present")
+
+
+def checkbox_states(pdf_bytes, names):
+    states = {}
+    for page in pdfrw.PdfReader(io.BytesIO(pdf_bytes)).pages:
+        for annotation in page.Annots or []:
+            if annotation.T and annotation.T[1:-1] in names:
+                states[annotation.T[1:-1]] = (annotation.V, annotation.AS)
+    return states
+
+
+@pytest.mark.parametrize("value", ["", None, "Off"])
+def test_blank_checkbox_stays_off(value):
+    states = checkbox_states(pdf_templates.fill_pdf_bytes(TRUSTAGE, {term: value for term in TERMS}), TERMS)
+    assert states == {term: ("/Off", "/Off") for term in TERMS}
+
+
+def test_on_ticks_the_single_on_state():
+    data = {term: "" for term in TERMS}
+    data["10-year"] = "On"
+    states = checkbox_states(pdf_templates.fill_pdf_bytes(TRUSTAGE, data), TERMS)
+    assert states.pop("10-year") == ("/Yes", "/Yes")
+    assert set(states.values()) == {("/Off", "/Off")}
+
+
+def test_template_cache_reparses_only_when_the_file_changes(tmp_path):
+    path = tmp_path / "form.pdf"
+    path.write_bytes(open(TRUSTAGE, "rb").read())
+    cache = pdf_templates.TemplateCache()
+
+    template = cache.get(path)
+    assert cache.get(str(path)) is template
+    assert "10-year" in template.field_names
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reparsed = cache.get(path)
+    assert reparsed is not template and reparsed.mtime == os.path.getmtime(path)
+    assert cache.get(path) is reparsed
+
+
+def test_copies_fill_without_touching_the_cached_template():
+    template = pdf_templates.TemplateCache().get(TRUSTAGE)
+    ticked = template.copy().fill({"10-year": "On"})
+    blank = template.copy()
+    field = template.fields["10-year"][0]
+    assert ticked._own(field).AS == "/Yes"
+    assert blank._own(field).AS == field.AS != "/Yes"
+
+
+@pytest.fixture
+def pool():
+    yield
+    pdf_templates.shutdown_pool()
+
+
+def test_fill_pdfs_reports_each_file_on_its_own(tmp_path, pool):
+    jobs = {"ok": (TRUSTAGE, tmp_path / "ok.pdf", {"3-year": "On"}),
+            "bad": (TRUSTAGE, tmp_path / "missing" / "bad.pdf", {})}
+    results = {key: (output_pdf, error) for key, output_pdf, error in pdf_templates.fill_pdfs(jobs)}
+
+    assert results["ok"] == (tmp_path / "ok.pdf", None)
+    assert checkbox_states((tmp_path / "ok.pdf").read_bytes(), ["3-year"]) == {"3-year": ("/Yes", "/Yes")}
+    assert isinstance(results["bad"][1], OSError)
+
+
+def widget(*states):
+    return pdfrw.PdfDict(AP=pdfrw.PdfDict(N=pdfrw.PdfDict((pdfrw.PdfName(state), pdfrw.PdfDict()) for state in states)))
+
+
+@pytest.mark.parametrize("states, value, expected", [
+    (("Off", "Yes"), "On", "/Yes"),  # The mappings' 'On' ticks the only on-state
+    (("Off", "Yes"), "Yes", "/Yes"),
+    (("Off", "Male", "Female"), "Female", "/Female"),
+    (("Off", "Male", "Female"), "On", "/On"),  # Ambiguous, so left as given
+    (("Off", "Yes"), "Off", "/Off"),
+    (("Off", "Yes"), "", "/Off"),
+])
+def test_checkbox_state_maps_to_the_widgets_on_state(states, value, expected):
+    assert pdf_templates._checkbox_state(widget(*states), value) == expected
+
+
+def test_fill_pdfs_falls_back_to_this_process_without_workers(tmp_path, monkeypatch):
+    def no_pool(preload=()):
+        raise OSError("no processes")
+    monkeypatch.setattr(pdf_templates, "get_pool", no_pool)
+    jobs = {n: (TRUSTAGE, tmp_path / f"{n}.pdf", {"5-year": "On"}) for n in (1, 2)}
+
+    results = list(pdf_templates.fill_pdfs(jobs))
+    assert sorted((key, error) for key, _, error in results) == [(1, None), (2, None)]
+    assert checkbox_states((tmp_path / "2.pdf").read_bytes(), ["5-year"]) == {"5-year": ("/Yes", "/Yes")}
+
+
+def test_cancelled_fallback_fills_nothing(tmp_path, monkeypatch):
+    def no_pool(preload=()):
+        raise OSError("no processes")
+    monkeypatch.setattr(pdf_templates, "get_pool", no_pool)
+    cancel = threading.Event()
+    cancel.set()
+
+    results = list(pdf_templates.fill_pdfs({1: (TRUSTAGE, tmp_path / "1.pdf", {})}, cancel=cancel))
+    assert isinstance(results[0][2], pdf_templates.FillCancelled)
+    assert not (tmp_path / "1.pdf").exists()
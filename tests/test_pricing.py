@@ -0,0 +1,52 @@
+import pytest
+
+import pricing
+from money import Money
+
+PLAN = {"A1": "2,500.00", "B1": "1,000.00", "Payment Term": "5-year"}
+
+
+def test_quote_offers_no_term_for_an_age_past_the_factor_table():
+    values = pricing.quote(dict(PLAN, **{"-AGE-": "91", "4B Time Pay": "50.00"}))
+    assert values["-AGE-ERROR-"] == "Age 91 is out of supported range"
+    assert values["-MONTHLY-PAYMENTS-"] == {term: None for term in pricing.PAYMENT_TERMS}
+    assert values["4B Time Pay"] == ""
+    assert values["Grand Total"] == pricing.quote(PLAN)["Grand Total"]
+
+
+def test_quote_keeps_a_typed_time_pay_without_a_term():
+    values = pricing.quote({"A1": "2,500.00", "-AGE-": "91", "4B Time Pay": "50.00"})
+    assert values["-AGE-ERROR-"]
+    assert values["4B Time Pay"] == "50.00"
+    assert Money.parse(values["Total 4 \\(ABCD\\)"]) == Money.parse("50.00")
+
+
+def test_quote_with_a_supported_age_has_no_age_error():
+    values = pricing.quote(dict(PLAN, **{"-AGE-": "60"}))
+    assert values["-AGE-ERROR-"] == ""
+    assert values["4B Time Pay"] == values["-MONTHLY-PAYMENTS-"]["5-year"].format()
+
+
+def test_payment_comparison_rows_stop_where_the_factor_table_ends():
+    rows = pricing.payment_comparison("10,000.00", 78, ["0", "2,500.00", "12,000.00"])
+    assert [(age, single_pay) for age, single_pay, _, _ in rows] == [
+        (age, Money.parse(single_pay)) for age in range(78, 83) for single_pay in ("0", "2,500.00", "12,000.00")]
+
+    age, _, financed, payments = rows[0]
+    assert financed == Money.parse("10,000.00")
+    assert payments == {"3-year": Money.parse("367.50"), "5-year": Money.parse("231.00"),
+                        "10-year": None, "15-year": None, "20-year": None}
+    assert rows[1][3]["3-year"] == Money.parse("275.63")  # 7,500.00 financed
+    assert rows[2][2] == Money(0) and set(rows[2][3].values()) == {Money(0)}
+    assert rows[-2][3]["5-year"] is None  # 82 only has the 3-year term
+
+
+def test_payment_comparison_past_the_table_raises():
+    with pytest.raises(ValueError, match="Age 83 is out of supported range"):
+        pricing.payment_comparison("10,000.00", 83, ["0"])
+
+
+def test_comparison_single_pays_are_whole_dollar_shares_and_the_current_one():
+    assert pricing.comparison_single_pays("10,001.99", "1,234.56") == [
+        Money.parse(amount) for amount in ("0", "1,000.00", "1,234.56", "2,500.00", "5,001.00")]
+    assert pricing.amount_to_finance("10,000.01", "0") == Money.parse("10,001.00")
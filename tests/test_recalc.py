@@ -0,0 +1,69 @@
+import pricing
+import recalc
+from money import Money
+
+PLAN = {"A1": "2,000.00", "B1": "1,200.00", "B2": "300.00", "D1": "150.00", "-AGE-": "62",
+        "Payment Term": "10-year", "Casket": "Oak"}
+CHAIN = ["Casket", "PST", "Grand Total", "Total 3", recalc.MONTHLY_PAYMENTS, "4B Time Pay", "Total 4 \\(ABCD\\)"]
+
+
+def loaded_graph(values=PLAN):
+    graph = recalc.RecalcGraph()
+    graph.load(values)
+    graph.recompute()
+    return graph
+
+
+def count_calls(graph, names):
+    """Wrap nodes so each call is recorded in the returned list"""
+    calls = []
+    for name in names:
+        inputs, function, display = graph.nodes[name]
+        graph.nodes[name] = (inputs, lambda name=name, function=function: (calls.append(name), function())[1], display)
+    return calls
+
+
+def test_order_follows_casket_to_pst_to_grand_total_to_payments():
+    order = recalc.RecalcGraph().order
+    assert [order.index(name) for name in CHAIN] == sorted(order.index(name) for name in CHAIN)
+
+
+def test_casket_change_reaches_the_payments_in_one_recompute():
+    graph = loaded_graph()
+    calls = count_calls(graph, graph.nodes)
+    graph.set_value("Casket", "Basic Cremation Container")  # B1 no longer carries PST
+    changes, errors = graph.recompute()
+
+    assert not errors
+    assert calls == [name for name in graph.order if name in calls]  # Dependency order
+    assert [name for name in CHAIN[1:] if name in calls] == CHAIN[1:]
+    assert not {"Total A", "Total B", "GST"} & set(calls)
+
+    expected = pricing.quote(dict(PLAN, Casket="Basic Cremation Container"))
+    for field in ["PST", "Grand Total", "Total 3", "4B Time Pay", "Total 4 \\(ABCD\\)"]:
+        assert changes[field] == expected[field]
+    assert graph.values[recalc.MONTHLY_PAYMENTS] == expected["-MONTHLY-PAYMENTS-"]
+
+
+def test_unchanged_pst_stops_the_propagation():
+    graph = loaded_graph()
+    calls = count_calls(graph, graph.nodes)
+    graph.set_value("Casket", "Pine")  # Still taxed, so PST keeps its value
+    changes, _ = graph.recompute()
+    assert calls == ["PST"]
+    assert changes == {}
+
+
+def test_a_total_d_change_skips_the_taxes():
+    graph = loaded_graph()
+    calls = count_calls(graph, graph.nodes)
+    graph.set_value("D1", "200.00")
+    changes, _ = graph.recompute()
+    assert "PST" not in calls and "GST" not in calls
+    assert Money.parse(changes["Grand Total"]) - Money.parse(pricing.quote(PLAN)["Grand Total"]) == 5000
+
+
+def test_an_age_past_the_factors_offers_no_term():
+    graph = loaded_graph(dict(PLAN, **{"-AGE-": "91"}))
+    assert graph.values[recalc.MONTHLY_PAYMENTS] == {term: None for term in pricing.PAYMENT_TERMS}
+    assert graph.displayed["4B Time Pay"] == ""
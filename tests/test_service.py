@@ -0,0 +1,100 @@
+import asyncio
+import io
+import json
+import os
+import zipfile
+
+import pytest
+
+import pdf_templates
+import service
+from conftest import FORMS
+
+needs_forms = pytest.mark.skipif(not os.path.isdir(FORMS), reason="Forms/ templates not present")
+
+CLIENT = json.dumps({"-FIRST-": "Bob", "-LAST-": "Ray", "-AGE-": 91, "A1": 2500, "Payment Term": "5-year"}).encode()
+
+
+async def request(method, target, body):
+    """Status line, headers and body of one request served through handle_connection"""
+    autofill_service = service.AutofillService()
+    server = await asyncio.start_server(autofill_service.handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"{method} {target} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                     + body)
+        lines = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")[:-2]
+        headers = dict(line.split(": ", 1) for line in lines[1:])
+        payload = await reader.readexactly(int(headers["Content-Length"]))
+        writer.close()
+    return lines[0], headers, payload
+
+
+@pytest.fixture(autouse=True)
+def pool():
+    yield
+    pdf_templates.shutdown_pool()
+
+
+@needs_forms
+def test_quote_past_the_payment_factors_has_totals_and_a_warning():
+    status, _, payload = asyncio.run(request("POST", "/quote?brand=rob", CLIENT))
+    quote = json.loads(payload)
+    assert status == "HTTP/1.1 200 OK"
+    assert quote["warning"] == "Age 91 is out of supported range"
+    assert quote["totals"]["Grand Total"] and quote["totals"]["4B Time Pay"] == ""
+    assert set(quote["monthly_payments"].values()) == {None}
+
+
+@needs_forms
+def test_fill_past_the_payment_factors_returns_the_pdfs_with_a_warning_header():
+    status, headers, payload = asyncio.run(request("POST", "/fill?brand=rob", CLIENT))
+    assert status == "HTTP/1.1 200 OK"
+    assert headers["X-Autofill-Warning"] == "Age 91 is out of supported range"
+    assert len(zipfile.ZipFile(io.BytesIO(payload)).namelist()) == 5
+
+
+@needs_forms
+def test_a_warning_quoting_non_latin_input_is_escaped_in_the_header():
+    client = json.dumps({"-FIRST-": "Bob", "-LAST-": "Ray", "-AGE-": "\u65e5", "A1": 2500}).encode()
+    status, headers, payload = asyncio.run(request("POST", "/fill?brand=rob", client))
+    assert status == "HTTP/1.1 200 OK"
+    assert "\\u65e5" in headers["X-Autofill-Warning"]
+    assert len(zipfile.ZipFile(io.BytesIO(payload)).namelist()) == 5
+
+
+def test_response_head_keeps_the_warning_on_one_ascii_line():
+    head = service.response_head(200, "application/zip", 3, True, "Age \u65e5\r\nSet-Cookie: x")
+    lines = head.decode("ascii").split("\r\n")
+    assert lines[3] == "X-Autofill-Warning: Age \\u65e5\\r\\nSet-Cookie: x"
+    assert not any(line.startswith("Set-Cookie") for line in lines)
+
+
+def read(raw):
+    async def go():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        return await service.read_request(reader)
+    return asyncio.run(go())
+
+
+@pytest.mark.parametrize("length, status", [("abc", 400), ("-5", 400), ("\u00b2", 400), (str(service.MAX_BODY + 1), 413)])
+def test_bad_content_length_is_an_http_error(length, status):
+    with pytest.raises(service.HTTPError) as error:
+        read(f"POST /quote HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode())
+    assert error.value.status == status
+
+
+def test_content_length_reads_the_body():
+    assert read(b"POST /quote HTTP/1.1\r\nContent-Length: 2\r\n\r\n{}") == (
+        "POST", "/quote", {"content-length": "2"}, b"{}")
+
+
+@pytest.mark.parametrize("body", [b'{"Discounts": "Cadence"}', b'{"Discounts": [["Cadence"]]}',
+                                  b'{"Discounts": [5]}', b'[1, 2]', b'{"A1": '])
+def test_malformed_bodies_are_bad_requests(body):
+    with pytest.raises(service.HTTPError) as error:
+        service.read_values(body)
+    assert error.value.status == 400